@@ -0,0 +1,154 @@
+# backend/app/aggregates.py
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy import extract, func
+from sqlalchemy.orm import Session
+
+from . import models
+from .categories import get_category_cache
+
+def spending_aggregates(
+    db: Session, user_id: int, start_date: datetime, end_date: datetime, top_n: int = 20
+) -> Dict[str, Any]:
+    """
+    Compute a user's spending features for a date window in SQL.
+
+    Returns the compact v2 payload the inference bridge accepts instead of raw
+    transactions: per-category totals and counts as parallel arrays, a daily
+    spend series starting at start_date, and the top_n largest transactions.
+    """
+    in_window = (
+        models.Transaction.user_id == user_id,
+        models.Transaction.date >= start_date,
+        models.Transaction.date <= end_date
+    )
+    
+    # Grouped by the integer ID, names come from the in-memory cache
+    by_category = db.query(
+        models.Transaction.category_id,
+        func.sum(models.Transaction.amount),
+        func.count(models.Transaction.id)
+    ).filter(*in_window).group_by(models.Transaction.category_id).all()
+    categories = get_category_cache()
+    
+    day = func.date(models.Transaction.date)
+    by_day = db.query(day, func.sum(models.Transaction.amount)).filter(*in_window).group_by(day).all()
+    
+    first_day = start_date.date()
+    daily_spend = [0.0] * ((end_date.date() - first_day).days + 1)
+    for day_value, amount in by_day:
+        offset = (datetime.fromisoformat(str(day_value)).date() - first_day).days
+        if 0 <= offset < len(daily_spend):
+            daily_spend[offset] = round(amount, 2)
+    
+    top_transactions = db.query(models.Transaction).filter(*in_window).order_by(
+        models.Transaction.amount.desc()
+    ).limit(top_n).all()
+    
+    return {
+        "categories": [categories.name(user_id, category_id, db) for category_id, _, _ in by_category],
+        "category_totals": [total for _, total, _ in by_category],
+        "category_counts": [count for _, _, count in by_category],
+        "start_date": first_day.isoformat(),
+        "daily_spend": daily_spend,
+        "top_transactions": [
+            {
+                "amount": t.amount,
+                "category": categories.name(user_id, t.category_id, db),
+                "date": t.date.isoformat(),
+                "description": t.description
+            }
+            for t in top_transactions
+        ]
+    }
+
+def category_history(db: Session, user_id: int, year: int, month: int, months: int = 6) -> Optional[Dict[str, Any]]:
+    """
+    Spending by category in each of the months before year/month that have
+    transactions, oldest first, as the bridge's history payload. The bridge
+    flags categories whose spending this month is unusually high against it.
+    
+    Returns None when the user has no earlier transactions in the window.
+    """
+    end_date = datetime(year, month, 1)
+    start_date = end_date - relativedelta(months=months)
+    
+    year_col = extract('year', models.Transaction.date)
+    month_col = extract('month', models.Transaction.date)
+    rows = db.query(
+        year_col, month_col, models.Transaction.category_id, func.sum(models.Transaction.amount)
+    ).filter(
+        models.Transaction.user_id == user_id,
+        models.Transaction.date >= start_date,
+        models.Transaction.date < end_date
+    ).group_by(year_col, month_col, models.Transaction.category_id).all()
+    if not rows:
+        return None
+    names = get_category_cache()
+    rows = [(y, m, names.name(user_id, category_id, db), amount) for y, m, category_id, amount in rows]
+    
+    month_keys = sorted({f"{int(y):04d}-{int(m):02d}" for y, m, _, _ in rows})
+    categories = sorted({category for _, _, category, _ in rows})
+    month_index = {key: i for i, key in enumerate(month_keys)}
+    category_index = {category: i for i, category in enumerate(categories)}
+    
+    totals = [[0.0] * len(categories) for _ in month_keys]
+    for y, m, category, amount in rows:
+        totals[month_index[f"{int(y):04d}-{int(m):02d}"]][category_index[category]] = round(amount, 2)
+    
+    return {"categories": categories, "months": month_keys, "totals": totals}
+
+def monthly_net_flows(db: Session, user_id: int, year: int, month: int, months: int = 6) -> List[float]:
+    """
+    Income minus spending of each of the months before year/month that has an
+    income record, oldest first. The bridge simulates goal feasibility from
+    their distribution.
+    """
+    end_date = datetime(year, month, 1)
+    start_date = end_date - relativedelta(months=months)
+    
+    incomes = db.query(models.UserIncome).filter(
+        models.UserIncome.user_id == user_id,
+        (models.UserIncome.year * 100 + models.UserIncome.month) >= start_date.year * 100 + start_date.month,
+        (models.UserIncome.year * 100 + models.UserIncome.month) < end_date.year * 100 + end_date.month
+    ).all()
+    if not incomes:
+        return []
+    
+    year_col = extract('year', models.Transaction.date)
+    month_col = extract('month', models.Transaction.date)
+    spending = {
+        (int(y), int(m)): total
+        for y, m, total in db.query(year_col, month_col, func.sum(models.Transaction.amount)).filter(
+            models.Transaction.user_id == user_id,
+            models.Transaction.date >= start_date,
+            models.Transaction.date < end_date
+        ).group_by(year_col, month_col).all()
+    }
+    
+    return [
+        round(record.income - spending.get((record.year, record.month), 0.0), 2)
+        for record in sorted(incomes, key=lambda record: (record.year, record.month))
+    ]
+
+def transaction_rows(db: Session, user_id: int, start_date: datetime, end_date: datetime):
+    """
+    Every transaction of the window as dicts, the v1 payload format
+    """
+    transactions = db.query(models.Transaction).filter(
+        models.Transaction.user_id == user_id,
+        models.Transaction.date >= start_date,
+        models.Transaction.date <= end_date
+    ).all()
+    
+    categories = get_category_cache()
+    return [
+        {
+            "amount": t.amount,
+            "category": categories.name(user_id, t.category_id, db),
+            "date": t.date.isoformat(),
+            "description": t.description
+        }
+        for t in transactions
+    ]
@@ -0,0 +1,132 @@
+# backend/app/categories.py
+import os
+import re
+import string
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from . import models
+from .database import ShardRouter, get_shard_router
+
+# Names the frontend offers, other spellings of them map here
+KNOWN_CATEGORIES = [
+    "Food & Dining", "Transportation", "Housing", "Utilities", "Entertainment", "Shopping",
+    "Healthcare", "Personal Care", "Education", "Travel", "Other",
+]
+
+# Common synonyms, keyed by their case-folded form
+CATEGORY_ALIASES = {
+    "food": "Food & Dining",
+    "food and dining": "Food & Dining",
+    "dining": "Food & Dining",
+    "restaurants": "Food & Dining",
+    "transport": "Transportation",
+    "rent": "Housing",
+    "health": "Healthcare",
+    "health care": "Healthcare",
+    "uncategorized": "Other",
+}
+
+_CANONICAL = {name.casefold(): name for name in KNOWN_CATEGORIES}
+_CANONICAL.update(CATEGORY_ALIASES)
+
+def normalize_category(name: Optional[str]) -> str:
+    """
+    The stored form of a category name: whitespace collapsed, known names and
+    their aliases matched regardless of case, and other names capitalized word
+    by word, so "groceries ", "Groceries" and "GROCERIES" are one category
+    """
+    cleaned = re.sub(r"\s+", " ", name or "").strip()
+    if not cleaned:
+        return "Other"
+    return _CANONICAL.get(cleaned.casefold()) or string.capwords(cleaned)
+
+class CategoryCache:
+    """
+    In-memory ID/name maps of users' categories, loaded per user on first use.
+
+    Categories are never renamed or deleted, so entries never go stale, they
+    can only be missing when another worker created the category; a miss
+    reloads the user's categories. Holds max_users users, least recently used
+    first out.
+    """
+
+    def __init__(self, router: Optional[ShardRouter] = None, max_users: int = 10000):
+        self.router = router or get_shard_router()
+        self.max_users = max_users
+        self.users: "OrderedDict[int, Tuple[Dict[str, int], Dict[int, str]]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def id_for(self, user_id: int, name: Optional[str]) -> int:
+        """
+        The ID of the user's category of that name, created if new
+        """
+        name = normalize_category(name)
+        category_id = self._maps(user_id)[0].get(name)
+        if category_id is not None:
+            return category_id
+
+        # Committed on its own, so the ID stays valid whatever the caller's transaction does
+        db = self.router.session(user_id)
+        try:
+            db.execute(insert(models.Category).values(user_id=user_id, name=name).on_conflict_do_nothing())
+            db.commit()
+        finally:
+            db.close()
+        return self._maps(user_id, reload=True)[0][name]
+
+    def names(self, user_id: int, db: Optional[Session] = None) -> Dict[int, str]:
+        """
+        All of the user's categories by ID, loaded with db when given
+        """
+        return self._maps(user_id, db)[1]
+
+    def name(self, user_id: int, category_id: Optional[int], db: Optional[Session] = None) -> str:
+        if category_id is None:
+            return "Other"
+        name = self.names(user_id, db).get(category_id)
+        if name is None:
+            name = self._maps(user_id, db, reload=True)[1].get(category_id, "Other")
+        return name
+
+    def _maps(
+        self, user_id: int, db: Optional[Session] = None, reload: bool = False
+    ) -> Tuple[Dict[str, int], Dict[int, str]]:
+        with self.lock:
+            maps = self.users.get(user_id)
+            if maps is not None and not reload:
+                self.users.move_to_end(user_id)
+                return maps
+
+        session = db or self.router.session(user_id)
+        try:
+            rows = session.query(models.Category.id, models.Category.name).filter(
+                models.Category.user_id == user_id
+            ).all()
+        finally:
+            if db is None:
+                session.close()
+        maps = ({name: category_id for category_id, name in rows}, {category_id: name for category_id, name in rows})
+
+        with self.lock:
+            self.users[user_id] = maps
+            self.users.move_to_end(user_id)
+            while len(self.users) > self.max_users:
+                self.users.popitem(last=False)
+        return maps
+
+_category_cache: Optional[CategoryCache] = None
+_category_cache_lock = threading.Lock()
+
+def get_category_cache() -> CategoryCache:
+    """
+    Return the process-wide category cache, holding CATEGORY_CACHE_USERS users
+    """
+    global _category_cache
+    with _category_cache_lock:
+        if _category_cache is None:
+            _category_cache = CategoryCache(max_users=int(os.getenv("CATEGORY_CACHE_USERS", "10000")))
+    return _category_cache
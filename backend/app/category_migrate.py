@@ -0,0 +1,126 @@
+# backend/app/category_migrate.py
+"""
+Convert a database whose transactions store category names as strings to the
+categories table: every distinct name becomes a per-user category under its
+normalized name, transactions get its ID and the string column is dropped.
+The backend does this on startup; run it by hand to convert a copy, or to see
+the space it saves.
+
+Run from the backend directory:
+    python -m app.category_migrate --database ./budget_app.db
+"""
+import argparse
+import os
+import sqlite3
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from . import models
+from .categories import normalize_category
+
+def has_legacy_categories(engine: Engine) -> bool:
+    """
+    Whether the transactions table still has its category string column
+    """
+    inspector = inspect(engine)
+    if "transactions" not in inspector.get_table_names():
+        return False
+    return "category" in {column["name"] for column in inspector.get_columns("transactions")}
+
+def _columns(cursor, table: str) -> set:
+    return {row[1] for row in cursor.execute(f"PRAGMA table_info({table})").fetchall()}
+
+def migrate_legacy_categories(engine: Engine, vacuum: bool = True) -> int:
+    """
+    Move the category strings of the transactions table into categories
+
+    Every worker runs this on startup, so the schema is checked again and the
+    whole conversion done in one BEGIN IMMEDIATE transaction: a worker that
+    waited for the write lock finds the column gone and does nothing.
+
+    Args:
+        engine: Engine of one database file
+        vacuum: Rewrite the file afterwards, so the dropped column's space is freed
+
+    Returns:
+        The number of transactions converted, 0 when already converted
+    """
+    # Checked without the write lock first, so converted databases never wait for it
+    if not has_legacy_categories(engine):
+        return 0
+
+    raw = engine.raw_connection()
+    try:
+        driver = raw.driver_connection
+        isolation_level = driver.isolation_level
+        driver.isolation_level = None  # transactions are begun explicitly below
+        cursor = driver.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            columns = _columns(cursor, "transactions")
+            if "category" not in columns:
+                cursor.execute("ROLLBACK")
+                return 0
+
+            categories = models.Category.__table__
+            cursor.execute(str(CreateTable(categories, if_not_exists=True).compile(dialect=engine.dialect)))
+            for index in categories.indexes:
+                cursor.execute(str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect)))
+            if "category_id" not in columns:
+                cursor.execute("ALTER TABLE transactions ADD COLUMN category_id INTEGER REFERENCES categories (id)")
+
+            # Several raw spellings can share one normalized category
+            raw_names = cursor.execute("SELECT DISTINCT user_id, category FROM transactions").fetchall()
+            cursor.execute(
+                "CREATE TEMP TABLE category_map (user_id INTEGER, raw TEXT, name TEXT, PRIMARY KEY (user_id, raw))"
+            )
+            cursor.executemany(
+                "INSERT INTO category_map (user_id, raw, name) VALUES (?, ?, ?)",
+                [(user_id, raw_name, normalize_category(raw_name)) for user_id, raw_name in raw_names if raw_name is not None]
+            )
+            cursor.execute(
+                "INSERT OR IGNORE INTO categories (user_id, name) SELECT DISTINCT user_id, name FROM category_map"
+            )
+            converted = cursor.execute(
+                """
+                UPDATE transactions SET category_id = (
+                    SELECT c.id FROM category_map m JOIN categories c ON c.user_id = m.user_id AND c.name = m.name
+                    WHERE m.user_id = transactions.user_id AND m.raw = transactions.category
+                )
+                """
+            ).rowcount
+            cursor.execute("DROP TABLE category_map")
+            cursor.execute("ALTER TABLE transactions DROP COLUMN category")
+            cursor.execute("COMMIT")
+        except Exception:
+            if driver.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
+
+        if vacuum:
+            try:
+                cursor.execute("VACUUM")
+            except sqlite3.OperationalError as e:
+                # Another worker is reading, the space is freed by the next VACUUM instead
+                print(f"Skipped VACUUM after converting categories: {e}")
+    finally:
+        # The connection goes back to the pool, where SQLAlchemy expects the driver's own transaction handling
+        driver.isolation_level = isolation_level
+        raw.close()
+    return converted
+
+def main():
+    from sqlalchemy import create_engine
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database", default="./budget_app.db")
+    args = parser.parse_args()
+
+    before = os.path.getsize(args.database)
+    converted = migrate_legacy_categories(create_engine(f"sqlite:///{args.database}"))
+    after = os.path.getsize(args.database)
+    print(f"{converted} transactions converted, {before:,} -> {after:,} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,113 @@
 # backend/app/database.py
+import os
+from typing import Callable, List, Optional, TypeVar
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+T = TypeVar("T")
 
 # SQLite database URL
 SQLALCHEMY_DATABASE_URL = "sqlite:///./budget_app.db"
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Database file of each shard when users are spread over several
+SHARD_PATH_TEMPLATE = "./budget_app.shard{shard}.db"
 
 # Base class for models
 Base = declarative_base()
 
-# Dependency to get DB session
-def get_db():
-    db = SessionLocal()
+def shard_urls(shards: int, template: str = SHARD_PATH_TEMPLATE) -> List[str]:
+    """
+    Database URLs of the shards, the single database when there is only one
+    """
+    if shards <= 1:
+        return [SQLALCHEMY_DATABASE_URL]
+    return [f"sqlite:///{template.format(shard=shard)}" for shard in range(shards)]
+
+class ShardRouter:
+    """
+    Routes every user to one of several SQLite databases by user ID. SQLite
+    allows one writer per file, so users on different shards write in
+    parallel. All of a user's rows live on their shard, so every per-user
+    query stays on one database; row IDs are only unique within a shard.
+    """
+
+    def __init__(self, urls: List[str]):
+        self.engines = [
+            create_engine(url, connect_args={"check_same_thread": False})
+            for url in urls
+        ]
+        self.session_factories = [
+            sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            for engine in self.engines
+        ]
+
+    @property
+    def shards(self) -> int:
+        return len(self.engines)
+
+    def shard_for(self, user_id: int) -> int:
+        return user_id % self.shards
+
+    def session(self, user_id: int) -> Session:
+        """
+        A new session on the user's shard
+        """
+        return self.session_factories[self.shard_for(user_id)]()
+
+    def create_all(self, metadata, attempts: int = 3) -> None:
+        """
+        Create missing tables on every shard. Workers starting together can
+        race between the check for a table and its creation; the loser sees
+        "already exists" and tries again, when the check skips that table.
+        """
+        for engine in self.engines:
+            for attempt in range(attempts):
+                try:
+                    metadata.create_all(bind=engine)
+                    break
+                except OperationalError as e:
+                    if "already exists" not in str(e) or attempt == attempts - 1:
+                        raise
+
+_router: Optional[ShardRouter] = None
+
+def get_shard_router() -> ShardRouter:
+    """
+    Return the process-wide shard router: DB_SHARDS databases (default 1,
+    the plain budget_app.db) named after DB_SHARD_PATH_TEMPLATE
+    """
+    global _router
+    if _router is None:
+        shards = int(os.getenv("DB_SHARDS", "1"))
+        _router = ShardRouter(shard_urls(shards, os.getenv("DB_SHARD_PATH_TEMPLATE", SHARD_PATH_TEMPLATE)))
+    return _router
+
+def session_for(user_id: int) -> Session:
+    """
+    A new session on the user's shard, for work outside a request such as background tasks
+    """
+    return get_shard_router().session(user_id)
+
+def across_shards(query: Callable[[Session], List[T]]) -> List[T]:
+    """
+    Run a query on every shard and concatenate the results, for admin and batch
+    jobs that span users. Aggregates such as sums have to be combined by the caller.
+    """
+    results: List[T] = []
+    for factory in get_shard_router().session_factories:
+        db = factory()
+        try:
+            results.extend(query(db))
+        finally:
+            db.close()
+    return results
+
+# Dependency to get DB session, on the shard of the request's user
+def get_db(user_id: int = 1):
+    db = session_for(user_id)
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1,64 @@
+# backend/app/inference_client.py
+import gzip
+import json
+import os
+import requests
+import time
+from typing import Optional
+
+# Payloads smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+# Part of the time budget kept back for the network hop and the fallback,
+# so the bridge gives up before this client does
+DEADLINE_MARGIN_SECONDS = 0.5
+
+def inference_url() -> str:
+    return os.getenv("INFERENCE_URL", "http://localhost:8001")
+
+def payload_version() -> int:
+    """
+    1 sends every raw transaction, 2 (default) sends SQL-computed aggregates
+    """
+    return int(os.getenv("INFERENCE_PAYLOAD_VERSION", "2"))
+
+def joint_goal_planning() -> bool:
+    """
+    Whether goal plans are generated for all of a user's goals in one bridge
+    call (default) rather than one call per goal
+    """
+    return os.getenv("JOINT_GOAL_PLANNING", "true").lower() in ("1", "true", "yes")
+
+def request_deadline() -> float:
+    """
+    Deadline of an interactive AI request that starts now, as a time.monotonic()
+    value. Past it the deterministic fallback is served instead.
+    """
+    return time.monotonic() + float(os.getenv("INFERENCE_TIMEOUT_SECONDS", "10"))
+
+def post_to_bridge(path: str, payload, deadline: Optional[float] = None, **kwargs) -> requests.Response:
+    """
+    POST a JSON payload to the inference bridge.
+
+    With payload version 2 the body is serialized compactly and gzip-compressed
+    when large enough; the bridge inflates it transparently.
+
+    With a deadline (a time.monotonic() value) the bridge is told the remaining
+    budget in X-Request-Timeout-Ms and the HTTP call times out at the deadline,
+    raising requests.Timeout so the caller can fall back in time.
+    """
+    headers = {"Content-Type": "application/json", **kwargs.pop("headers", {})}
+    if deadline is not None:
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise requests.Timeout(f"Deadline passed before calling {path}")
+        headers["X-Request-Timeout-Ms"] = str(int(max(left - DEADLINE_MARGIN_SECONDS, 0.0) * 1000))
+        kwargs["timeout"] = left
+    if payload_version() < 2:
+        return requests.post(f"{inference_url()}{path}", json=payload, headers=headers, **kwargs)
+    
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    if len(body) >= GZIP_MIN_BYTES:
+        body = gzip.compress(body, compresslevel=5)
+        headers["Content-Encoding"] = "gzip"
+    return requests.post(f"{inference_url()}{path}", data=body, headers=headers, **kwargs)
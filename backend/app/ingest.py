@@ -0,0 +1,143 @@
+# backend/app/ingest.py
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import models
+from .database import ShardRouter, get_shard_router
+
+def group_commit_enabled() -> bool:
+    """
+    Whether POST /api/transactions hands rows to the group-commit writer
+    instead of committing each one itself
+    """
+    return os.getenv("TRANSACTION_GROUP_COMMIT", "false").lower() in ("1", "true", "yes")
+
+class GroupCommitWriter:
+    """
+    Inserts transactions from many request threads in shared commits.
+
+    Each shard has a writer thread that takes every row queued for it, up to
+    max_rows, and inserts them in one commit, so the writes that arrive while a
+    commit is running share the next one: one database lock and sync instead
+    of one each. max_delay additionally waits for more rows after the first,
+    which only pays off when the commit itself is very fast. A caller's submit
+    returns the row's ID once the commit it was part of has completed.
+    """
+
+    def __init__(self, max_rows: int = 256, max_delay: float = 0.0, router: Optional[ShardRouter] = None):
+        self.router = router or get_shard_router()
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.queues: Dict[int, queue.Queue] = {}
+        self.lock = threading.Lock()
+        self.batches = 0
+        self.rows = 0
+
+    def submit(self, user_id: int, values: Dict[str, Any], timeout: Optional[float] = 30.0) -> int:
+        """
+        Insert one transaction and wait until it is committed
+
+        Args:
+            user_id: Owner of the transaction, created if missing
+            values: Column values of the transaction
+            timeout: Seconds to wait for the commit at most
+
+        Returns:
+            The ID of the inserted transaction
+        """
+        future: Future = Future()
+        self._queue(self.router.shard_for(user_id)).put((user_id, values, future))
+        return future.result(timeout=timeout)
+
+    def _queue(self, shard: int) -> queue.Queue:
+        pending = self.queues.get(shard)
+        if pending is None:
+            with self.lock:
+                pending = self.queues.get(shard)
+                if pending is None:
+                    pending = self.queues[shard] = queue.Queue()
+                    threading.Thread(
+                        target=self._run, args=(shard, pending), name=f"group-commit-{shard}", daemon=True
+                    ).start()
+        return pending
+
+    def _run(self, shard: int, pending: queue.Queue) -> None:
+        while True:
+            batch = [pending.get()]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_rows:
+                try:
+                    # Rows that queued up during the previous commit are taken right away
+                    batch.append(pending.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            self._commit(shard, batch)
+
+    def _commit(self, shard: int, batch: List[Tuple[int, Dict[str, Any], Future]]) -> None:
+        try:
+            ids = self._insert(shard, batch)
+        except Exception:
+            # One bad row must not fail the rows it happened to be batched with
+            for item in batch:
+                try:
+                    ids = self._insert(shard, [item])
+                except Exception as e:
+                    item[2].set_exception(e)
+                else:
+                    item[2].set_result(ids[0])
+            return
+
+        self.batches += 1
+        self.rows += len(batch)
+        for (_, _, future), row_id in zip(batch, ids):
+            future.set_result(row_id)
+
+    def _insert(self, shard: int, batch: List[Tuple[int, Dict[str, Any], Future]]) -> List[int]:
+        db = self.router.session_factories[shard]()
+        try:
+            user_ids = {user_id for user_id, _, _ in batch}
+            existing = {
+                user_id for (user_id,) in db.query(models.User.id).filter(models.User.id.in_(user_ids))
+            }
+            db.add_all(models.User(id=user_id) for user_id in user_ids - existing)
+
+            rows = [models.Transaction(user_id=user_id, **values) for user_id, values, _ in batch]
+            db.add_all(rows)
+            # IDs are assigned by the flush, reading them after the commit would reload every row
+            db.flush()
+            ids = [row.id for row in rows]
+            db.commit()
+            return ids
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "rows_per_batch": round(self.rows / self.batches, 2) if self.batches else 0.0,
+        }
+
+_writer: Optional[GroupCommitWriter] = None
+_writer_lock = threading.Lock()
+
+def get_group_commit_writer() -> GroupCommitWriter:
+    """
+    Return the process-wide group-commit writer configured from
+    GROUP_COMMIT_MAX_ROWS and GROUP_COMMIT_MAX_DELAY_MS
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = GroupCommitWriter(
+                max_rows=int(os.getenv("GROUP_COMMIT_MAX_ROWS", "256")),
+                max_delay=float(os.getenv("GROUP_COMMIT_MAX_DELAY_MS", "0")) / 1000,
+            )
+    return _writer
@@ -4,15 +4,23 @@ from fastapi.middleware.cors import CORSMiddleware
 import os
 from dotenv import load_dotenv
 
-from .database import engine
+from .database import get_shard_router
+from .category_migrate import migrate_legacy_categories
 from . import models
-from .routers import transactions, income, goals, summary
+from .profiler import ProfilerMiddleware, get_profiler, profiler_token
+from .routers import transactions, income, goals, summary, recurring, dashboard, admin
 
 # Load environment variables
 load_dotenv()
 
-# Create database tables
-models.Base.metadata.create_all(bind=engine)
+# Create database tables, on every shard
+get_shard_router().create_all(models.Base.metadata)
+
+# Move category strings of databases created by older versions into the categories table
+for shard_engine in get_shard_router().engines:
+    converted = migrate_legacy_categories(shard_engine)
+    if converted:
+        print(f"Converted the categories of {converted} transactions in {shard_engine.url}")
 
 # Create FastAPI app
 app = FastAPI(title="Budget App API")
@@ -26,11 +34,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Count requests for profile captures, only when the admin profiling endpoint is enabled
+if profiler_token():
+    app.add_middleware(ProfilerMiddleware, profiler=get_profiler())
+
 # Include routers
 app.include_router(transactions.router, prefix="/api")
 app.include_router(income.router, prefix="/api")
 app.include_router(goals.router, prefix="/api")
 app.include_router(summary.router, prefix="/api")
+app.include_router(recurring.router, prefix="/api")
+app.include_router(dashboard.router, prefix="/api")
+app.include_router(admin.router)
 
 # Root endpoint
 @app.get("/")
@@ -14,6 +14,9 @@ class User(Base):
     transactions = relationship("Transaction", back_populates="user")
     goals = relationship("Goal", back_populates="user")
     incomes = relationship("UserIncome", back_populates="user") 
+    summaries = relationship("MonthlySummary", back_populates="user")
+    categories = relationship("Category", back_populates="user")
+    recurring_expenses = relationship("RecurringExpenseState", back_populates="user", uselist=False)
 
 class UserIncome(Base):
     __tablename__ = "user_incomes"
@@ -31,13 +34,27 @@ class UserIncome(Base):
     # Relationships
     user = relationship("User", back_populates="incomes")
 
+class Category(Base):
+    __tablename__ = "categories"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    name = Column(String)  # Normalized with app.categories.normalize_category
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="unique_user_category_name"),
+    )
+    
+    # Relationships
+    user = relationship("User", back_populates="categories")
+
 class Transaction(Base):
     __tablename__ = "transactions"
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     amount = Column(Float)
-    category = Column(String)
+    category_id = Column(Integer, ForeignKey("categories.id"))  # Names are resolved through app.categories
     date = Column(DateTime, default=func.now())
     description = Column(String, nullable=True)
     
@@ -56,4 +73,39 @@ class Goal(Base):
     ai_plan = Column(String, nullable=True)  # Store AI-generated savings plan
     
     # Relationships
-    user = relationship("User", back_populates="goals")
\ No newline at end of file
+    user = relationship("User", back_populates="goals")
+
+class MonthlySummary(Base):
+    __tablename__ = "monthly_summaries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    year = Column(Integer)
+    month = Column(Integer)
+    fingerprint = Column(String)  # Hash of the inputs the summary was generated from
+    response = Column(String)  # The bridge's summary response as JSON
+    generated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "year", "month", name="unique_user_summary_per_month"),
+    )
+    
+    # Relationships
+    user = relationship("User", back_populates="summaries")
+
+class RecurringExpenseState(Base):
+    __tablename__ = "recurring_expense_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    last_transaction_id = Column(Integer, default=0)  # Transactions up to this ID are in the state
+    last_date = Column(DateTime, nullable=True)  # Latest transaction date seen, earlier arrivals rebuild the state
+    state = Column(String)  # Charge series of app.recurring as JSON
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("user_id", name="unique_user_recurring_state"),
+    )
+    
+    # Relationships
+    user = relationship("User", back_populates="recurring_expenses")
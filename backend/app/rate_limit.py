@@ -0,0 +1,171 @@
+# backend/app/rate_limit.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# The bridge caps prompts at this many tokens by default (PROMPT_TOKEN_BUDGET)
+PROMPT_TOKENS_MAX = 1200
+
+# Rough length of one generated summary or plan
+COMPLETION_TOKENS = 300
+
+class RateLimitExceeded(Exception):
+    """
+    A user is out of AI requests or tokens, the caller serves its fallback instead
+    """
+
+def estimate_tokens(payload: Dict[str, Any], completions: int = 1) -> int:
+    """
+    LLM tokens a bridge call with this payload costs, about four characters
+    per prompt token plus the expected completions
+    """
+    chars = len(json.dumps(payload, separators=(",", ":"), default=str))
+    return min(chars // 4, PROMPT_TOKENS_MAX) + completions * COMPLETION_TOKENS
+
+def refill(level: float, updated: float, capacity: float, rate: float, now: float) -> float:
+    """
+    A bucket's level after refilling at rate per second since updated
+    """
+    return min(capacity, level + max(now - updated, 0.0) * rate)
+
+class MemoryBucketStore:
+    """
+    Token buckets of this process
+    """
+
+    def __init__(self):
+        self.buckets: Dict[Tuple[int, str], Tuple[float, float]] = {}
+        self.lock = threading.Lock()
+
+    def take(self, user_id: int, costs: Dict[str, float], limits: Dict[str, Tuple[float, float]], now: float) -> bool:
+        with self.lock:
+            levels = {
+                name: refill(*self.buckets.get((user_id, name), (limits[name][0], now)), *limits[name], now)
+                for name in costs
+            }
+            allowed = all(levels[name] >= cost for name, cost in costs.items())
+            for name, cost in costs.items():
+                self.buckets[(user_id, name)] = (levels[name] - cost if allowed else levels[name], now)
+            return allowed
+
+class SqliteBucketStore:
+    """
+    Token buckets in a SQLite file, shared by every worker process on the host
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS token_buckets (
+                user_id INTEGER NOT NULL,
+                bucket TEXT NOT NULL,
+                level REAL NOT NULL,
+                updated REAL NOT NULL,
+                PRIMARY KEY (user_id, bucket)
+            )
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def take(self, user_id: int, costs: Dict[str, float], limits: Dict[str, Tuple[float, float]], now: float) -> bool:
+        conn = self._connection()
+        # Taking the write lock up front makes the read-check-update atomic across workers
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            stored = {
+                bucket: (level, updated)
+                for bucket, level, updated in conn.execute(
+                    "SELECT bucket, level, updated FROM token_buckets WHERE user_id = ?", (user_id,)
+                )
+            }
+            levels = {
+                name: refill(*stored.get(name, (limits[name][0], now)), *limits[name], now)
+                for name in costs
+            }
+            allowed = all(levels[name] >= cost for name, cost in costs.items())
+            conn.executemany(
+                "INSERT OR REPLACE INTO token_buckets (user_id, bucket, level, updated) VALUES (?, ?, ?, ?)",
+                [
+                    (user_id, name, levels[name] - cost if allowed else levels[name], now)
+                    for name, cost in costs.items()
+                ]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed
+
+class RateLimiter:
+    """
+    Per-user token buckets for AI-backed routes: one of AI requests, refilled
+    at requests_per_minute up to request_burst, and one of estimated LLM
+    tokens, refilled at tokens_per_hour up to an hour's worth. A call needs
+    room in both and takes from both, or from neither.
+    """
+
+    def __init__(self, store, requests_per_minute: float, request_burst: float, tokens_per_hour: float):
+        self.store = store
+        self.limits = {
+            "requests": (request_burst, requests_per_minute / 60),
+            "tokens": (tokens_per_hour, tokens_per_hour / 3600),
+        }
+
+    def acquire(self, user_id: int, tokens: int) -> None:
+        """
+        Take one request and the estimated tokens from the user's buckets
+
+        Raises:
+            RateLimitExceeded: The user has too few requests or tokens left
+        """
+        # A call costing more than a full bucket would otherwise never pass
+        costs = {"requests": 1, "tokens": min(tokens, self.limits["tokens"][0])}
+        if not self.store.take(user_id, costs, self.limits, time.time()):
+            raise RateLimitExceeded(f"User {user_id} is over the AI request quota")
+
+_rate_limiter: Optional[RateLimiter] = None
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Return the process-wide rate limiter configured from environment variables,
+    or None when AI_RATE_LIMIT_ENABLED=false. With AI_RATE_LIMIT_DB set the
+    buckets live in that SQLite file and are shared by all workers.
+    """
+    global _rate_limiter
+    if os.getenv("AI_RATE_LIMIT_ENABLED", "true").lower() not in ("1", "true", "yes"):
+        return None
+    if _rate_limiter is None:
+        path = os.getenv("AI_RATE_LIMIT_DB")
+        _rate_limiter = RateLimiter(
+            SqliteBucketStore(path) if path else MemoryBucketStore(),
+            requests_per_minute=float(os.getenv("AI_REQUESTS_PER_MINUTE", "6")),
+            request_burst=float(os.getenv("AI_REQUEST_BURST", "10")),
+            tokens_per_hour=float(os.getenv("AI_TOKENS_PER_HOUR", "60000")),
+        )
+    return _rate_limiter
+
+def check_ai_quota(user_id: int, payload: Dict[str, Any], completions: int = 1) -> None:
+    """
+    Charge a bridge call with this payload to the user's quota
+
+    Raises:
+        RateLimitExceeded: The user is over quota and should get the fallback
+    """
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        limiter.acquire(user_id, estimate_tokens(payload, completions))
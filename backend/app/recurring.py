@@ -0,0 +1,242 @@
+# backend/app/recurring.py
+import json
+import re
+from datetime import date, datetime, timedelta
+from dateutil.relativedelta import relativedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from . import models
+from .categories import get_category_cache
+
+# Billing periods a recurring charge can have, in days
+PERIODS = {"weekly": 7.0, "biweekly": 14.0, "monthly": 30.44, "quarterly": 91.31, "yearly": 365.25}
+DAYS_PER_MONTH = 30.44
+
+MIN_OCCURRENCES = 3  # charges before a series counts as recurring
+AMOUNT_TOLERANCE = 0.1  # relative difference of amounts within one series
+PERIOD_TOLERANCE = 0.15  # relative difference of the mean interval from its period
+MAX_INTERVAL_SPREAD = 0.2  # standard deviation of the intervals over their mean
+SAME_CHARGE_DAYS = 3  # charges closer than this do not count as an interval
+MIN_KEY_SHARE = 0.5  # share of a description's charges a bill's series must hold, shops fail it
+REORDER_DAYS = 7  # transactions dated up to this before the latest one are still added incrementally
+SERIES_PER_KEY = 8  # series kept per description, most recent first
+STALE_SINGLE_DAYS = 400  # one-off charges older than this are forgotten
+
+# Transaction fields the detector reads, in the order update_series expects them
+Charge = Tuple[float, Optional[int], datetime, Optional[str]]
+
+def charge_key(description: Optional[str]) -> Optional[str]:
+    """
+    The part of a description that stays the same from charge to charge:
+    lowercased, without digits (order and card numbers) or punctuation
+    """
+    key = re.sub(r"[^a-z]+", " ", (description or "").lower()).strip()
+    return key or None
+
+def update_series(state: Dict[str, Any], charges: Iterable[Charge]) -> None:
+    """
+    Add transactions, oldest first, to a user's charge series.
+
+    A series is a run of charges with the same description key and an amount
+    within AMOUNT_TOLERANCE of its mean. Each keeps running sums of its amounts
+    and of the intervals between charges, so adding a charge is O(series of
+    its key) and the history never has to be read again. Each also counts all
+    charges of its key since it started, which tells a bill (every charge to
+    the payee) from a shop where some purchases happen to cost the same.
+    """
+    series_by_key = state.setdefault("series", {})
+    for amount, category_id, charged_at, description in charges:
+        key = charge_key(description)
+        if key is None or not amount or amount <= 0:
+            continue
+        day = charged_at.date().toordinal()
+        candidates = series_by_key.setdefault(key, [])
+        for series in candidates:
+            series["key_charges"] += 1
+
+        best = None
+        for series in candidates:
+            mean = series["amount_sum"] / series["count"]
+            difference = abs(amount - mean)
+            if difference <= max(AMOUNT_TOLERANCE * mean, 1.0) and (best is None or difference < best[0]):
+                best = (difference, series)
+        if best is None:
+            candidates.insert(0, {
+                "label": description.strip(), "category_id": category_id, "amount_sum": amount, "count": 1,
+                "key_charges": 1, "first": day, "last": day, "intervals": 0, "interval_sum": 0.0, "interval_squares": 0.0
+            })
+            del candidates[SERIES_PER_KEY:]
+            continue
+
+        series = best[1]
+        gap = day - series["last"]
+        # Charges days apart, or posted after a later one of the series, add no interval
+        if gap >= SAME_CHARGE_DAYS:
+            series["intervals"] += 1
+            series["interval_sum"] += gap
+            series["interval_squares"] += gap * gap
+        series["label"] = description.strip()
+        series["category_id"] = category_id
+        series["amount_sum"] += amount
+        series["count"] += 1
+        series["last"] = max(series["last"], day)
+        # Most recently charged first, so the oldest series are the ones dropped
+        candidates.remove(series)
+        candidates.insert(0, series)
+
+def prune_series(state: Dict[str, Any], today: int) -> None:
+    """
+    Forget one-off charges older than STALE_SINGLE_DAYS, which keeps the
+    state of a user with years of history small
+    """
+    series_by_key = state.get("series", {})
+    for key in list(series_by_key):
+        kept = [s for s in series_by_key[key] if s["count"] > 1 or today - s["last"] <= STALE_SINGLE_DAYS]
+        if kept:
+            series_by_key[key] = kept
+        else:
+            del series_by_key[key]
+
+def recurring_charges(state: Dict[str, Any], today: date) -> List[Dict[str, Any]]:
+    """
+    The series that look like active subscriptions or bills: at least
+    MIN_OCCURRENCES charges at regular intervals close to a billing period,
+    most charges of their payee, and the last one no more than one and a half
+    periods ago. Largest monthly cost first.
+    """
+    charges = []
+    for series_list in state.get("series", {}).values():
+        for series in series_list:
+            if series["count"] < MIN_OCCURRENCES or series["intervals"] < MIN_OCCURRENCES - 1:
+                continue
+            if series["count"] < MIN_KEY_SHARE * series["key_charges"]:
+                continue
+            mean_interval = series["interval_sum"] / series["intervals"]
+            variance = max(series["interval_squares"] / series["intervals"] - mean_interval ** 2, 0.0)
+            if variance ** 0.5 > MAX_INTERVAL_SPREAD * mean_interval:
+                continue
+            period, period_days = min(PERIODS.items(), key=lambda item: abs(item[1] - mean_interval))
+            if abs(mean_interval - period_days) > PERIOD_TOLERANCE * period_days:
+                continue
+            if today.toordinal() - series["last"] > 1.5 * period_days + SAME_CHARGE_DAYS:
+                continue
+
+            amount = series["amount_sum"] / series["count"]
+            charges.append({
+                "description": series["label"],
+                "category_id": series["category_id"],
+                "amount": round(amount, 2),
+                "period": period,
+                "interval_days": round(mean_interval, 1),
+                "monthly_amount": round(amount * DAYS_PER_MONTH / period_days, 2),
+                "occurrences": series["count"],
+                "last_date": date.fromordinal(series["last"]).isoformat(),
+                "next_date": date.fromordinal(series["last"] + round(mean_interval)).isoformat()
+            })
+    charges.sort(key=lambda charge: charge["monthly_amount"], reverse=True)
+    return charges
+
+def _charges_query(db: Session, user_id: int, after_id: int = 0):
+    return db.query(
+        models.Transaction.id,
+        models.Transaction.amount,
+        models.Transaction.category_id,
+        models.Transaction.date,
+        models.Transaction.description
+    ).filter(models.Transaction.user_id == user_id, models.Transaction.id > after_id)
+
+def rebuild_state(db: Session, user_id: int) -> Tuple[Dict[str, Any], int, Optional[datetime]]:
+    """
+    A user's charge series computed from their whole history, with the last
+    transaction ID and date it covers
+    """
+    rows = _charges_query(db, user_id).order_by(models.Transaction.date, models.Transaction.id).all()
+    state: Dict[str, Any] = {}
+    update_series(state, (row[1:] for row in rows))
+    last_id = max((row[0] for row in rows), default=0)
+    last_date = rows[-1][3] if rows else None
+    if last_date is not None:
+        prune_series(state, last_date.date().toordinal())
+    return state, last_id, last_date
+
+def recurring_state(db: Session, user_id: int) -> Dict[str, Any]:
+    """
+    A user's charge series, brought up to date with the transactions added
+    since they were last stored.
+
+    Only transactions with a higher ID than the stored ones are read, which is
+    a range scan of the primary key. Ones dated up to REORDER_DAYS before the
+    latest transaction already in the state, as card payments often post, are
+    added all the same; one dated earlier would belong in the series' past, so
+    the state is rebuilt from the whole history instead.
+    """
+    row = db.query(models.RecurringExpenseState).filter(models.RecurringExpenseState.user_id == user_id).first()
+    if row is None:
+        state, last_id, last_date = rebuild_state(db, user_id)
+        row = models.RecurringExpenseState(user_id=user_id)
+        db.add(row)
+    else:
+        new_rows = _charges_query(db, user_id, row.last_transaction_id or 0).order_by(
+            models.Transaction.date, models.Transaction.id
+        ).all()
+        if not new_rows:
+            return json.loads(row.state)
+        if row.last_date is not None and new_rows[0][3] < row.last_date - timedelta(days=REORDER_DAYS):
+            state, last_id, last_date = rebuild_state(db, user_id)
+        else:
+            state = json.loads(row.state)
+            update_series(state, (new_row[1:] for new_row in new_rows))
+            last_id = max(new_row[0] for new_row in new_rows)
+            last_date = max(new_rows[-1][3], row.last_date or new_rows[-1][3])
+            prune_series(state, last_date.date().toordinal())
+
+    row.state = json.dumps(state, separators=(",", ":"))
+    row.last_transaction_id = last_id
+    row.last_date = last_date
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request stored the user's state first, it covers the same transactions
+        db.rollback()
+    return state
+
+def recurring_expenses(
+    db: Session, user_id: int, monthly_spending: Optional[float] = None, today: Optional[date] = None
+) -> Dict[str, Any]:
+    """
+    A user's fixed monthly obligations and what is left of their spending.
+
+    Args:
+        db: Session of the user's shard
+        user_id: The user
+        monthly_spending: Average monthly spending to split, defaults to that
+            of the last 2 months, the window goal planning looks at
+        today: Date the charges are judged active at
+
+    Returns:
+        fixed_monthly (recurring charges as a monthly cost), discretionary_monthly
+        (the rest of monthly_spending) and the recurring charges themselves
+    """
+    today = today or date.today()
+    if monthly_spending is None:
+        start_date = datetime.combine(today, datetime.min.time()) - relativedelta(months=2)
+        total = db.query(func.sum(models.Transaction.amount)).filter(
+            models.Transaction.user_id == user_id,
+            models.Transaction.date >= start_date
+        ).scalar()
+        monthly_spending = (total or 0.0) / 2
+
+    charges = recurring_charges(recurring_state(db, user_id), today)
+    categories = get_category_cache()
+    for charge in charges:
+        charge["category"] = categories.name(user_id, charge.pop("category_id"), db)
+
+    fixed_monthly = round(sum(charge["monthly_amount"] for charge in charges), 2)
+    return {
+        "fixed_monthly": fixed_monthly,
+        "discretionary_monthly": round(max(monthly_spending - fixed_monthly, 0.0), 2),
+        "charges": charges
+    }
@@ -0,0 +1,76 @@
+# backend/app/routers/admin.py
+from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional
+import asyncio
+import time
+
+from ..profiler import ProfileCapture, get_profiler, is_admin, routes_for
+
+router = APIRouter()
+
+# Pydantic models
+class ProfileRequest(BaseModel):
+    route: Optional[str] = Field(None, description="Route path as declared, e.g. /api/transactions; all routes when omitted")
+    method: Optional[str] = Field(None, description="Only requests with this HTTP method")
+    requests: Optional[int] = Field(None, ge=1, le=10000, description="Profile the next N requests to the route")
+    seconds: Optional[float] = Field(None, gt=0, le=300, description="Profile for a fixed time window")
+    interval_ms: float = Field(10.0, ge=1, le=1000, description="Time between stack samples")
+    timeout_s: float = Field(60.0, gt=0, le=600, description="Give up waiting for the requests after this long")
+    idle: bool = Field(False, description="Keep samples of threads waiting on a lock, queue or selector")
+
+    @model_validator(mode="after")
+    def check_mode(self):
+        if (self.requests is None) == (self.seconds is None):
+            raise ValueError("Set exactly one of requests and seconds")
+        if self.requests is not None and self.route is None:
+            raise ValueError("Profiling the next requests needs a route")
+        return self
+
+@router.post("/admin/profile", response_class=PlainTextResponse)
+async def capture_profile(
+    profile: ProfileRequest,
+    request: Request,
+    x_admin_token: Optional[str] = Header(None)
+):
+    """
+    Sample the stacks of the next N requests to a route, or of a time window,
+    and return them as collapsed stacks for flamegraph.pl or speedscope.
+    Requires the X-Admin-Token header to match PROFILER_ADMIN_TOKEN.
+    Async, so waiting for the capture does not hold a worker thread.
+    """
+    if not is_admin(x_admin_token):
+        raise HTTPException(status_code=404, detail="Not Found")
+    routes = routes_for(request.app, profile.route, profile.method) if profile.route else []
+    if profile.route and not routes:
+        raise HTTPException(status_code=404, detail=f"No route {profile.route}")
+
+    profiler = get_profiler()
+    capture = ProfileCapture(
+        routes=routes,
+        method=profile.method,
+        requests=profile.requests,
+        seconds=profile.seconds,
+        interval=profile.interval_ms / 1000,
+        idle=profile.idle
+    )
+    try:
+        profiler.start(capture)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    try:
+        timeout = profile.timeout_s if profile.requests is not None else profile.seconds + 1
+        await asyncio.to_thread(capture.done.wait, timeout)
+    finally:
+        profiler.stop(capture)
+
+    summary = capture.summary()
+    print(f"Captured profile of {profile.route or 'all routes'}: {summary}")
+    return PlainTextResponse(
+        capture.collapsed(),
+        headers={
+            "Content-Disposition": f"attachment; filename=backend-{int(time.time())}.collapsed",
+            **{f"X-Profile-{key.replace('_', '-').title()}": str(value) for key, value in summary.items()}
+        }
+    )
@@ -0,0 +1,176 @@
+# backend/app/routers/dashboard.py
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import extract, func
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
+from pydantic import BaseModel
+
+from ..database import get_db
+from .. import models
+from ..categories import get_category_cache
+from ..summary_store import stored_summary, summary_fingerprint
+from .goals import Goal
+from .summary import AvailablePeriodsResponse, SummaryResponse, collect_summary_inputs
+from .transactions import Transaction
+
+router = APIRouter()
+
+# Parts of the dashboard a request can select with ?fields=
+DASHBOARD_FIELDS = ("categories", "income", "goals", "periods", "summary", "transactions")
+
+# Pydantic models
+class GoalProgress(BaseModel):
+    months_remaining: float
+    required_monthly_savings: float
+    on_track: bool  # The month's income minus spending covers the required savings
+
+class DashboardGoal(Goal):
+    progress: GoalProgress
+
+class DashboardResponse(BaseModel):
+    year: int
+    month: int
+    category_totals: Optional[Dict[str, float]] = None
+    total_spending: Optional[float] = None
+    income: Optional[float] = None
+    goals: Optional[List[DashboardGoal]] = None
+    periods: Optional[AvailablePeriodsResponse] = None
+    summary: Optional[SummaryResponse] = None  # Stored summary of the month, None unless still current
+    transactions: Optional[List[Transaction]] = None
+
+def goal_progress(goal: models.Goal, month_surplus: float, today: datetime) -> Dict[str, Any]:
+    deadline = goal.deadline.replace(tzinfo=None)
+    months_remaining = max((deadline - today).days / 30.44, 0.0)
+    required_monthly_savings = goal.target_amount / max(months_remaining, 1.0)
+    return {
+        "months_remaining": round(months_remaining, 1),
+        "required_monthly_savings": round(required_monthly_savings, 2),
+        "on_track": month_surplus >= required_monthly_savings
+    }
+
+def dashboard_data(db: Session, user_id: int, year: int, month: int, fields: List[str]) -> Dict[str, Any]:
+    """
+    The selected parts of a month's dashboard, read in one session.
+
+    The month's spending comes from its transactions when those are selected,
+    otherwise from one grouped query; periods are one grouped query over all
+    years, rather than one per year.
+    """
+    start_date = datetime(year, month, 1)
+    end_date = start_date + relativedelta(months=1)
+    in_month = (
+        models.Transaction.user_id == user_id,
+        models.Transaction.date >= start_date,
+        models.Transaction.date < end_date
+    )
+    categories = get_category_cache()
+    data: Dict[str, Any] = {"year": year, "month": month}
+
+    # Goal progress is judged against the month's surplus, so goals need spending and income too
+    needs_spending = "categories" in fields or "goals" in fields
+    needs_income = "income" in fields or "goals" in fields
+
+    category_totals: Dict[str, float] = {}
+    if "transactions" in fields:
+        rows = db.query(models.Transaction).filter(*in_month).order_by(models.Transaction.date).all()
+        names = categories.names(user_id, db)
+        data["transactions"] = [
+            {
+                "id": t.id,
+                "user_id": t.user_id,
+                "amount": t.amount,
+                "category": names.get(t.category_id, "Other"),
+                "description": t.description,
+                "date": t.date
+            }
+            for t in rows
+        ]
+        for t in data["transactions"]:
+            category_totals[t["category"]] = category_totals.get(t["category"], 0.0) + t["amount"]
+    elif needs_spending:
+        by_category = db.query(models.Transaction.category_id, func.sum(models.Transaction.amount)).filter(
+            *in_month
+        ).group_by(models.Transaction.category_id).all()
+        for category_id, total in by_category:
+            name = categories.name(user_id, category_id, db)
+            category_totals[name] = category_totals.get(name, 0.0) + total
+    total_spending = round(sum(category_totals.values()), 2)
+    if "categories" in fields:
+        data["category_totals"] = {name: round(total, 2) for name, total in category_totals.items()}
+        data["total_spending"] = total_spending
+
+    income = 0.0
+    if needs_income:
+        income_record = db.query(models.UserIncome).filter(
+            models.UserIncome.user_id == user_id,
+            models.UserIncome.year == year,
+            models.UserIncome.month == month
+        ).first()
+        income = income_record.income if income_record else 0.0
+        if "income" in fields:
+            data["income"] = income
+
+    if "goals" in fields:
+        today = datetime.now()
+        data["goals"] = [
+            {
+                "id": goal.id,
+                "user_id": goal.user_id,
+                "description": goal.description,
+                "target_amount": goal.target_amount,
+                "deadline": goal.deadline,
+                "goal_priority": goal.goal_priority,
+                "ai_plan": goal.ai_plan,
+                "progress": goal_progress(goal, income - total_spending, today)
+            }
+            for goal in db.query(models.Goal).filter(models.Goal.user_id == user_id).all()
+        ]
+
+    if "periods" in fields:
+        year_col = extract('year', models.Transaction.date)
+        month_col = extract('month', models.Transaction.date)
+        months_by_year: Dict[int, List[int]] = {}
+        for period_year, period_month in db.query(year_col, month_col).filter(
+            models.Transaction.user_id == user_id
+        ).distinct().order_by(year_col, month_col).all():
+            months_by_year.setdefault(int(period_year), []).append(int(period_month))
+        data["periods"] = {"years": list(months_by_year), "months": months_by_year}
+
+    if "summary" in fields:
+        # Only a summary generated from the month's current data is served, as POST /api/summary would
+        _, _, summary_data = collect_summary_inputs(db, user_id, year, month)
+        data["summary"] = stored_summary(db, user_id, year, month, summary_fingerprint(summary_data))
+    return data
+
+# GET /api/dashboard
+@router.get("/dashboard", response_model=DashboardResponse, response_model_exclude_unset=True)
+def get_dashboard(
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+    user_id: int = 1
+):
+    """
+    Everything the dashboard shows for a month in one round trip: spending by
+    category, income, goals with their progress, the periods with data, the
+    stored AI summary and the month's transactions. Defaults to the current
+    month and all parts; fields takes a comma-separated subset of them.
+    """
+    today = datetime.now()
+    year = year or today.year
+    month = month or today.month
+    if not 1 <= month <= 12:
+        raise HTTPException(status_code=422, detail="month must be between 1 and 12")
+
+    selected = [field.strip() for field in fields.split(",") if field.strip()] if fields else list(DASHBOARD_FIELDS)
+    unknown = [field for field in selected if field not in DASHBOARD_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown fields {', '.join(unknown)}, choose from {', '.join(DASHBOARD_FIELDS)}"
+        )
+
+    return dashboard_data(db, user_id, year, month, selected)
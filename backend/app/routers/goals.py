@@ -2,14 +2,16 @@
 from dateutil.relativedelta import relativedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from pydantic import BaseModel
-import requests
-import os
 
 from ..database import get_db
 from .. import models
+from ..aggregates import monthly_net_flows, spending_aggregates, transaction_rows
+from ..inference_client import joint_goal_planning, payload_version, post_to_bridge, request_deadline
+from ..rate_limit import check_ai_quota
+from ..recurring import recurring_expenses
 
 router = APIRouter()
 
@@ -31,6 +33,116 @@ class Goal(GoalBase):
     class Config:
         orm_mode = True
 
+def fallback_plan(target_amount: float, deadline: datetime, user_income: float, aggregates) -> str:
+    """
+    Basic savings plan computed locally when the inference bridge is unavailable
+    """
+    deadline = deadline.replace(tzinfo=None)
+    months_remaining = max((deadline - datetime.now()).days / 30.44, 1.0)
+    required_monthly_savings = target_amount / months_remaining
+    
+    # Aggregates cover the last 2 months
+    category_totals = dict(zip(aggregates["categories"], aggregates["category_totals"]))
+    monthly_spending = sum(category_totals.values()) / 2
+    monthly_surplus = user_income - monthly_spending
+    
+    plan = (
+        f"To reach ${target_amount:.2f} by {deadline.strftime('%B %d, %Y')}, you need to set aside "
+        f"about ${required_monthly_savings:.2f} per month. "
+    )
+    if user_income <= 0:
+        return plan + "Add your monthly income to see how this fits your budget."
+    if monthly_surplus >= required_monthly_savings:
+        return plan + (
+            f"You have about ${monthly_surplus:.2f} left each month after spending, "
+            "so this goal looks achievable. Move the amount to savings right after payday."
+        )
+    plan += f"You currently have about ${max(monthly_surplus, 0):.2f} left each month after spending. "
+    if category_totals:
+        top_category = max(category_totals, key=category_totals.get)
+        plan += f"Consider cutting back on {top_category}, your largest expense, or extending the deadline."
+    else:
+        plan += "Consider extending the deadline or lowering the target."
+    return plan
+
+def goal_planning_inputs(db: Session, user_id: int) -> Tuple[float, Dict[str, Any], Dict[str, Any]]:
+    """
+    The user's current income, spending aggregates of the last 2 months, and
+    the bridge payload fields every goal planning request shares, including
+    the fixed monthly obligations the plans should not suggest cutting
+    """
+    current_date = datetime.now()
+    user_income_record = db.query(models.UserIncome).filter(
+        models.UserIncome.user_id == user_id,
+        models.UserIncome.year == current_date.year,
+        models.UserIncome.month == current_date.month
+    ).first()
+    user_income = user_income_record.income if user_income_record else 0.0
+    
+    # Aggregate the transactions of the last 2 months
+    start_date = current_date - relativedelta(months=2)
+    aggregates = spending_aggregates(db, user_id, start_date, current_date)
+    
+    monthly_spending = sum(aggregates["category_totals"]) / 2
+    shared = {
+        "user_income": user_income,
+        "monthly_net_flows": monthly_net_flows(db, user_id, current_date.year, current_date.month),
+        "recurring": recurring_expenses(db, user_id, monthly_spending, current_date.date())
+    }
+    if payload_version() >= 2:
+        shared["aggregates"] = aggregates
+    else:
+        shared["transactions"] = transaction_rows(db, user_id, start_date, current_date)
+    return user_income, aggregates, shared
+
+def refresh_goal_plans(db: Session, user_id: int, deadline: float) -> List[models.Goal]:
+    """
+    Regenerate the AI plans of all of a user's goals together.
+
+    Goals compete for the same income, so the bridge allocates the monthly
+    savings across them and writes every plan in a single model call. Falls
+    back to basic plans when the bridge is unavailable.
+    """
+    db_goals = db.query(models.Goal).filter(models.Goal.user_id == user_id).all()
+    if not db_goals:
+        return db_goals
+    
+    user_income, aggregates = 0.0, {"categories": [], "category_totals": []}
+    try:
+        user_income, aggregates, payload = goal_planning_inputs(db, user_id)
+        payload["goals"] = [
+            {
+                "goal_id": db_goal.id,
+                "goal_priority": db_goal.goal_priority,
+                "goal_description": db_goal.description,
+                "target_amount": db_goal.target_amount,
+                "deadline": db_goal.deadline.isoformat()
+            }
+            for db_goal in db_goals
+        ]
+        
+        # Over quota users get basic plans, which cost no LLM call
+        check_ai_quota(user_id, payload, completions=len(db_goals))
+        response = post_to_bridge("/multi_goal_planning", payload, deadline=deadline)
+        if response.status_code != 200:
+            raise RuntimeError(f"Inference bridge returned {response.status_code}")
+        
+        plans = {item["goal_id"]: item["plan"] for item in response.json().get("plans", [])}
+        for db_goal in db_goals:
+            db_goal.ai_plan = plans.get(db_goal.id) or fallback_plan(
+                db_goal.target_amount, db_goal.deadline, user_income, aggregates
+            )
+    except Exception as e:
+        # Log error but don't fail the request, fall back to basic plans
+        print(f"Error calling inference bridge: {e}")
+        for db_goal in db_goals:
+            db_goal.ai_plan = fallback_plan(db_goal.target_amount, db_goal.deadline, user_income, aggregates)
+    
+    db.commit()
+    for db_goal in db_goals:
+        db.refresh(db_goal)
+    return db_goals
+
 # GET /api/goals
 @router.get("/goals", response_model=List[Goal])
 def get_goals(db: Session = Depends(get_db), user_id: int = 1):
@@ -40,6 +152,8 @@ def get_goals(db: Session = Depends(get_db), user_id: int = 1):
 # POST /api/goal
 @router.post("/goal", response_model=Goal)
 def create_goal(goal: GoalCreate, db: Session = Depends(get_db), user_id: int = 1):
+    deadline = request_deadline()
+    
     # Create goal in database
     db_goal = models.Goal(
         user_id=user_id,
@@ -60,74 +174,51 @@ def create_goal(goal: GoalCreate, db: Session = Depends(get_db), user_id: int =
     db.commit()
     db.refresh(db_goal)
     
+    # The new goal changes what every other goal can be given, so all plans are redone in one call
+    if joint_goal_planning():
+        refresh_goal_plans(db, user_id, deadline)
+        return db_goal
+    
     # Call inference bridge to generate AI plan
+    user_income, aggregates = 0.0, {"categories": [], "category_totals": []}
     try:
-        # Get user current month income
-        current_date = datetime.now()
-        current_year = current_date.year
-        current_month = current_date.month
-
-        user_income_record = db.query(models.UserIncome).filter(
-            models.UserIncome.user_id == user_id,
-            models.UserIncome.year == current_year,
-            models.UserIncome.month == current_month
-        ).first()
-
-        user_income = user_income_record.income if user_income_record else 0.0
-
-        # Get the transaction records for the last 2 months
-        end_date = datetime.now()
-        start_date = end_date - relativedelta(months=2)
-        
-        # Query transactions within the time range
-        transactions = db.query(models.Transaction).filter(
-            models.Transaction.user_id == user_id,
-            models.Transaction.date >= start_date,
-            models.Transaction.date <= end_date
-        ).all()
-
-        transactions_data = [
-            {
-                "amount": t.amount,
-                "category": t.category,
-                "date": t.date.isoformat(),
-                "description": t.description
-            }
-            for t in transactions
-        ]
-        
-        # Prepare data for inference bridge
-        goal_data = {
+        user_income, aggregates, goal_data = goal_planning_inputs(db, user_id)
+        goal_data.update({
             "goal_id": db_goal.id,
             "goal_priority": db_goal.goal_priority,
             "goal_description": goal.description,
             "target_amount": goal.target_amount,
-            "deadline": goal.deadline.isoformat(),
-            "user_income": user_income,
-            "transactions": transactions_data
-        }
+            "deadline": goal.deadline.isoformat()
+        })
         
-        # Send to inference bridge
-        inference_url = os.getenv("INFERENCE_URL", "http://localhost:8001")
-        response = requests.post(
-            f"{inference_url}/goal_planning",
-            json=goal_data
-        )
+        # Send to inference bridge, unless the user is over quota
+        check_ai_quota(user_id, goal_data)
+        response = post_to_bridge("/goal_planning", goal_data, deadline=deadline)
+        if response.status_code != 200:
+            raise RuntimeError(f"Inference bridge returned {response.status_code}")
         
-        if response.status_code == 200:
-            # Update goal with AI plan
-            ai_plan = response.json().get("plan", "No plan generated")
-            db_goal.ai_plan = ai_plan
-            db.commit()
-            db.refresh(db_goal)
+        # Update goal with AI plan
+        ai_plan = response.json().get("plan", "No plan generated")
+        db_goal.ai_plan = ai_plan
+        db.commit()
+        db.refresh(db_goal)
     except Exception as e:
-        # Log error but don't fail the request
+        # Log error but don't fail the request, fall back to a basic plan
         print(f"Error calling inference bridge: {e}")
-        db_goal.ai_plan = "Unable to generate plan at this time."
+        db_goal.ai_plan = fallback_plan(goal.target_amount, goal.deadline, user_income, aggregates)
         db.commit()
+        db.refresh(db_goal)
     
     return db_goal
 
+# POST /api/goals/refresh_plans
+@router.post("/goals/refresh_plans", response_model=List[Goal])
+def refresh_plans(db: Session = Depends(get_db), user_id: int = 1):
+    """
+    Regenerate the AI plans of all goals together, e.g. after income or spending changed
+    """
+    return refresh_goal_plans(db, user_id, request_deadline())
+
 @router.delete("/goal/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_goal(
     goal_id: int,
@@ -1,10 +1,12 @@
 # backend/app/routers/income.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
 from ..database import get_db
 from .. import models
+from ..summary_store import refresh_on_write
+from .summary import refresh_stale_summaries
 
 router = APIRouter()
 
@@ -45,6 +47,7 @@ def get_income(
 @router.post("/income", response_model=UserIncomeResponse)
 def update_income(
     income_update: IncomeUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user_id: int = 1
 ):
@@ -70,4 +73,8 @@ def update_income(
     
     db.commit()
     db.refresh(user_income)
+    
+    # The month's stored summary no longer matches its income
+    if refresh_on_write():
+        background_tasks.add_task(refresh_stale_summaries, user_id, income_update.year, income_update.month)
     return user_income
\ No newline at end of file
@@ -0,0 +1,36 @@
+# backend/app/routers/recurring.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List
+from pydantic import BaseModel
+
+from ..database import get_db
+from ..recurring import recurring_expenses
+
+router = APIRouter()
+
+# Pydantic models
+class RecurringCharge(BaseModel):
+    description: str
+    category: str
+    amount: float
+    period: str  # weekly, biweekly, monthly, quarterly or yearly
+    interval_days: float
+    monthly_amount: float
+    occurrences: int
+    last_date: str
+    next_date: str
+
+class RecurringExpensesResponse(BaseModel):
+    fixed_monthly: float
+    discretionary_monthly: float
+    charges: List[RecurringCharge]
+
+# GET /api/recurring-expenses
+@router.get("/recurring-expenses", response_model=RecurringExpensesResponse)
+def get_recurring_expenses(db: Session = Depends(get_db), user_id: int = 1):
+    """
+    Subscriptions and bills found in the user's transactions, their monthly
+    cost and the spending of the last 2 months left over after them
+    """
+    return recurring_expenses(db, user_id)
@@ -1,16 +1,24 @@
 # backend/app/routers/summary.py
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy import extract
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+from dateutil.relativedelta import relativedelta
 from pydantic import BaseModel
 import requests
+import json
 import os
+import time
 from calendar import monthrange
 
-from ..database import get_db
+from ..database import across_shards, get_db, session_for
 from .. import models
+from ..aggregates import category_history, spending_aggregates, transaction_rows
+from ..inference_client import payload_version, post_to_bridge, inference_url, request_deadline
+from ..summary_store import store_summary, stored_summary, summary_fingerprint
+from ..rate_limit import RateLimitExceeded, check_ai_quota
 
 router = APIRouter()
 
@@ -24,6 +32,18 @@ class SummaryResponse(BaseModel):
     top_categories: Dict[str, float]
     total_spending: float
     budget_status: str
+    anomalies: List[Dict[str, Any]] = []
+
+class SummaryPeriod(BaseModel):
+    user_id: int
+    year: int
+    month: int
+
+class SummaryBatchRequest(BaseModel):
+    # Defaults to the previous month for every user with transactions in it
+    periods: Optional[List[SummaryPeriod]] = None
+    concurrency: Optional[int] = None
+    requests_per_minute: Optional[float] = None
 
 class AvailablePeriodsResponse(BaseModel):
     years: List[int]
@@ -66,41 +86,22 @@ def get_available_periods(db: Session = Depends(get_db), user_id: int = 1):
         "months": months_by_year
     }
 
-# POST /api/summary
-@router.post("/summary", response_model=SummaryResponse)
-def generate_summary(request: SummaryRequest, db: Session = Depends(get_db), user_id: int = 1):
-    # Get user
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+def collect_summary_inputs(db: Session, user_id: int, year: int, month: int):
+    """
+    Aggregate a month's spending and income and build the inference bridge payload
+    """
+    # Aggregate transactions for the specified month
+    _, last_day = monthrange(year, month)
+    start_date = datetime(year, month, 1)
+    end_date = datetime(year, month, last_day, 23, 59, 59)
     
-    # Get transactions for the specified month
-    _, last_day = monthrange(request.year, request.month)
-    start_date = datetime(request.year, request.month, 1)
-    end_date = datetime(request.year, request.month, last_day, 23, 59, 59)
-    
-    transactions = db.query(models.Transaction).filter(
-        models.Transaction.user_id == user_id,
-        models.Transaction.date >= start_date,
-        models.Transaction.date <= end_date
-    ).all()
-    
-    # Prepare transaction data
-    transaction_data = [
-        {
-            "amount": t.amount,
-            "category": t.category,
-            "date": t.date.isoformat(),
-            "description": t.description
-        }
-        for t in transactions
-    ]
+    aggregates = spending_aggregates(db, user_id, start_date, end_date)
     
     # Get user current month income
     user_income_record = db.query(models.UserIncome).filter(
         models.UserIncome.user_id == user_id,
-        models.UserIncome.year == request.year,
-        models.UserIncome.month == request.month
+        models.UserIncome.year == year,
+        models.UserIncome.month == month
     ).first()
 
     user_income = user_income_record.income if user_income_record else 0.0
@@ -108,40 +109,256 @@ def generate_summary(request: SummaryRequest, db: Session = Depends(get_db), use
     # Prepare data for inference bridge
     summary_data = {
         "user_id": user_id,
-        "month": request.month,
-        "year": request.year,
-        "income": user_income,
-        "transactions": transaction_data
+        "month": month,
+        "year": year,
+        "income": user_income
+    }
+    if payload_version() >= 2:
+        summary_data["aggregates"] = aggregates
+    else:
+        summary_data["transactions"] = transaction_rows(db, user_id, start_date, end_date)
+    
+    # Past months let the bridge flag unusually high spending itself
+    history = category_history(db, user_id, year, month, months=int(os.getenv("SUMMARY_HISTORY_MONTHS", "6")))
+    if history:
+        summary_data["history"] = history
+    return aggregates, user_income, summary_data
+
+def fallback_summary(month: int, year: int, aggregates: Dict[str, Any], user_income: float) -> Dict[str, Any]:
+    """
+    Basic summary computed locally when the inference bridge is unavailable
+    """
+    category_totals = dict(zip(aggregates["categories"], aggregates["category_totals"]))
+    total_spending = sum(category_totals.values())
+    budget_status = "Under Budget" if total_spending < user_income else "Over Budget"
+    
+    return {
+        "summary": f"In {month}/{year}, you spent ${total_spending:.2f} with income of ${user_income:.2f}.",
+        "top_categories": category_totals,
+        "total_spending": total_spending,
+        "budget_status": budget_status
     }
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def summary_events(result: Dict[str, Any]):
+    """
+    A complete summary as the "meta", "token" and "done" events of a stream
+    """
+    yield format_sse("meta", {key: value for key, value in result.items() if key != "summary"})
+    yield format_sse("token", {"text": result["summary"]})
+    yield format_sse("done", {"summary": result["summary"]})
+
+def summary_from_events(stream: str) -> Optional[Dict[str, Any]]:
+    """
+    Reassemble the summary response from a relayed event stream, None unless
+    it completed without an error
+    """
+    events = {}
+    for block in stream.split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        if "event" in lines and "data" in lines:
+            events[lines["event"]] = json.loads(lines["data"])
+    if "error" in events or "meta" not in events or "done" not in events:
+        return None
+    return {**events["meta"], "summary": events["done"]["summary"]}
+
+# POST /api/summary
+@router.post("/summary", response_model=SummaryResponse)
+def generate_summary(request: SummaryRequest, db: Session = Depends(get_db), user_id: int = 1):
+    deadline = request_deadline()
+    
+    # Get user
+    user = db.query(models.User).filter(models.User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    aggregates, user_income, summary_data = collect_summary_inputs(db, user_id, request.year, request.month)
+    
+    # Served from the store unless the month's data changed since it was generated
+    fingerprint = summary_fingerprint(summary_data)
+    stored = stored_summary(db, user_id, request.year, request.month, fingerprint)
+    if stored is not None:
+        return stored
     
     try:
+        # Over quota users get the fallback, which costs no LLM call
+        check_ai_quota(user_id, summary_data)
+        
         # Call inference bridge
-        inference_url = os.getenv("INFERENCE_URL", "http://localhost:8001")
-        response = requests.post(
-            f"{inference_url}/monthly_summary",
-            json=summary_data
-        )
-        if response.status_code == 200:
-            return response.json()
-        else:
+        response = post_to_bridge("/monthly_summary", summary_data, deadline=deadline)
+        if response.status_code != 200:
             raise HTTPException(status_code=500, detail="Error generating summary")
+        result = response.json()
     except Exception as e:
-        # Fallback to basic summary if inference bridge fails
-        # Calculate totals by category
-        category_totals = {}
-        for t in transactions:
-            category = t.category
-            if category in category_totals:
-                category_totals[category] += t.amount
-            else:
-                category_totals[category] = t.amount
-        
-        total_spending = sum(t.amount for t in transactions)
-        budget_status = "Under Budget" if total_spending < user_income else "Over Budget"
+        # Fallback to basic summary if the user is over quota, or the inference bridge fails or misses the deadline
+        return fallback_summary(request.month, request.year, aggregates, user_income)
+    
+    # Fallbacks are not stored, the next visit tries the bridge again
+    store_summary(db, user_id, request.year, request.month, fingerprint, result)
+    return result
+
+# POST /api/summary/stream
+@router.post("/summary/stream")
+def stream_summary(request: SummaryRequest, db: Session = Depends(get_db), user_id: int = 1):
+    """
+    Relay the inference bridge's server-sent event stream for a month's summary.
+    The first event carries top_categories, total_spending and budget_status,
+    followed by "token" events with summary text and a final "done" event.
+    """
+    deadline = request_deadline()
+    
+    # Get user
+    user = db.query(models.User).filter(models.User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Everything the stream needs is loaded up front, the session is not used while streaming
+    aggregates, user_income, summary_data = collect_summary_inputs(db, user_id, request.year, request.month)
+    fallback = fallback_summary(request.month, request.year, aggregates, user_income)
+    fingerprint = summary_fingerprint(summary_data)
+    stored = stored_summary(db, user_id, request.year, request.month, fingerprint)
+    
+    def relay():
+        relayed = bytearray()
+        # Only whole events are passed on, so one can be added after any of them
+        sent = 0
+        try:
+            check_ai_quota(user_id, summary_data)
+            with post_to_bridge("/monthly_summary/stream", summary_data, deadline=deadline, stream=True) as response:
+                if response.status_code != 200:
+                    raise RuntimeError(f"Inference bridge returned {response.status_code}")
+                # The request timeout only bounds each read, a stream trickling tokens would outlive the deadline
+                for chunk in response.iter_content(chunk_size=None):
+                    relayed.extend(chunk)
+                    end = relayed.rfind(b"\n\n", sent)
+                    if end != -1:
+                        yield bytes(relayed[sent:end + 2])
+                        sent = end + 2
+                    if time.monotonic() >= deadline and b"event: done\n" not in relayed:
+                        print("Summary stream passed its deadline, serving the basic summary")
+                        if sent:
+                            # The totals were sent in the first event, only the text is replaced
+                            yield format_sse("done", {"summary": fallback["summary"]})
+                        else:
+                            yield from summary_events(fallback)
+                        return
+                if len(relayed) > sent:
+                    yield bytes(relayed[sent:])
+        except Exception as e:
+            print(f"Error streaming from inference bridge: {e}")
+            if sent:
+                yield format_sse("error", {"status": 502, "detail": "Summary stream interrupted"})
+                return
+            # Fallback to basic summary if inference bridge fails before sending anything
+            yield from summary_events(fallback)
+            return
         
-        return {
-            "summary": f"In {request.month}/{request.year}, you spent ${total_spending:.2f} with income of ${user_income:.2f}.",
-            "top_categories": category_totals,
-            "total_spending": total_spending,
-            "budget_status": budget_status
-        }
\ No newline at end of file
+        result = summary_from_events(relayed.decode("utf-8", errors="replace"))
+        if result is not None:
+            store_db = session_for(user_id)
+            try:
+                store_summary(store_db, user_id, request.year, request.month, fingerprint, result)
+            finally:
+                store_db.close()
+    
+    return StreamingResponse(
+        summary_events(stored) if stored is not None else relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def refresh_stale_summaries(user_id: int, year: int, month: int):
+    """
+    Regenerate the user's stored summaries that a write to year/month made
+    stale: that month's and those of the following months, whose anomaly
+    history includes it. Runs as a background task with its own session.
+    """
+    history_months = int(os.getenv("SUMMARY_HISTORY_MONTHS", "6"))
+    db = session_for(user_id)
+    try:
+        rows = db.query(models.MonthlySummary).filter(
+            models.MonthlySummary.user_id == user_id
+        ).all()
+        for row in rows:
+            if not 0 <= (row.year - year) * 12 + row.month - month <= history_months:
+                continue
+            _, _, summary_data = collect_summary_inputs(db, user_id, row.year, row.month)
+            fingerprint = summary_fingerprint(summary_data)
+            if fingerprint == row.fingerprint:
+                continue
+            try:
+                check_ai_quota(user_id, summary_data)
+                response = post_to_bridge(
+                    "/monthly_summary", summary_data, deadline=request_deadline(),
+                    headers={"X-Request-Priority": "bulk"}
+                )
+            except (requests.RequestException, RateLimitExceeded) as e:
+                print(f"Error refreshing summary {row.year}-{row.month:02d}: {e}")
+                continue
+            if response.status_code == 200:
+                store_summary(db, user_id, row.year, row.month, fingerprint, response.json())
+    finally:
+        db.close()
+
+# POST /api/summary/batch
+@router.post("/summary/batch", status_code=202)
+def precompute_summaries(request: SummaryBatchRequest):
+    """
+    Submit a batch of monthly summaries to the inference bridge for background
+    generation. Returns the bridge job, poll GET /api/summary/batch/{job_id}.
+    """
+    periods = request.periods
+    if periods is None:
+        # Every active user's previous month, users are spread over all shards
+        previous = datetime.now() - relativedelta(months=1)
+        user_ids = across_shards(lambda db: db.query(models.Transaction.user_id).filter(
+            extract('year', models.Transaction.date) == previous.year,
+            extract('month', models.Transaction.date) == previous.month
+        ).distinct().all())
+        periods = [
+            SummaryPeriod(user_id=user_id, year=previous.year, month=previous.month)
+            for (user_id,) in user_ids
+        ]
+    if not periods:
+        raise HTTPException(status_code=400, detail="No summaries to precompute")
+    
+    items = []
+    for period in periods:
+        db = session_for(period.user_id)
+        try:
+            items.append(collect_summary_inputs(db, period.user_id, period.year, period.month)[2])
+        finally:
+            db.close()
+    
+    try:
+        response = post_to_bridge(
+            "/batch/monthly_summary",
+            {
+                "items": items,
+                "concurrency": request.concurrency,
+                "requests_per_minute": request.requests_per_minute
+            }
+        )
+    except requests.RequestException as e:
+        raise HTTPException(status_code=502, detail=f"Inference bridge unavailable: {e}")
+    if response.status_code != 202:
+        raise HTTPException(status_code=502, detail="Error submitting summary batch")
+    return response.json()
+
+# GET /api/summary/batch/{job_id}
+@router.get("/summary/batch/{job_id}")
+def get_precompute_job(job_id: str, include_items: bool = True):
+    try:
+        response = requests.get(
+            f"{inference_url()}/batch/jobs/{job_id}",
+            params={"include_items": include_items}
+        )
+    except requests.RequestException as e:
+        raise HTTPException(status_code=502, detail=f"Inference bridge unavailable: {e}")
+    if response.status_code == 404:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+    if response.status_code != 200:
+        raise HTTPException(status_code=502, detail="Error fetching batch job")
+    return response.json()
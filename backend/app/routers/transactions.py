@@ -1,5 +1,5 @@
 # backend/app/routers/transactions.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -7,6 +7,10 @@ from pydantic import BaseModel
 
 from ..database import get_db
 from .. import models
+from ..summary_store import refresh_on_write
+from ..ingest import get_group_commit_writer, group_commit_enabled
+from ..categories import get_category_cache
+from .summary import refresh_stale_summaries
 
 router = APIRouter()
 
@@ -34,19 +38,46 @@ def get_transactions(db: Session = Depends(get_db), user_id: int = 1):
     transactions = db.query(models.Transaction).filter(
         models.Transaction.user_id == user_id
     ).all()
-    return transactions
+    names = get_category_cache().names(user_id, db)
+    return [
+        {
+            "id": t.id,
+            "user_id": t.user_id,
+            "amount": t.amount,
+            "category": names.get(t.category_id, "Other"),
+            "description": t.description,
+            "date": t.date
+        }
+        for t in transactions
+    ]
 
 # POST /api/transactions
 @router.post("/transactions", response_model=Transaction)
-def create_transaction(transaction: TransactionCreate, db: Session = Depends(get_db), user_id: int = 1):
+def create_transaction(
+    transaction: TransactionCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    user_id: int = 1
+):
+    # Categories are stored once per user and referenced by ID, under their normalized name
+    categories = get_category_cache()
+    category_id = categories.id_for(user_id, transaction.category)
+    values = {
+        "amount": transaction.amount,
+        "category_id": category_id,
+        "description": transaction.description,
+        "date": transaction.date or datetime.now()
+    }
+    
+    # Concurrent writes share one commit, acknowledged once it completed
+    if group_commit_enabled():
+        transaction_id = get_group_commit_writer().submit(user_id, values)
+        if refresh_on_write():
+            background_tasks.add_task(refresh_stale_summaries, user_id, values["date"].year, values["date"].month)
+        return {"id": transaction_id, "user_id": user_id, "category": categories.name(user_id, category_id), **values}
+    
     # Create a new transaction
-    db_transaction = models.Transaction(
-        user_id=user_id,
-        amount=transaction.amount,
-        category=transaction.category,
-        description=transaction.description,
-        date=transaction.date or datetime.now()
-    )
+    db_transaction = models.Transaction(user_id=user_id, **values)
     
     # Ensure user exists
     user = db.query(models.User).filter(models.User.id == user_id).first()
@@ -59,4 +90,17 @@ def create_transaction(transaction: TransactionCreate, db: Session = Depends(get
     db.add(db_transaction)
     db.commit()
     db.refresh(db_transaction)
-    return db_transaction
\ No newline at end of file
+    
+    # Stored summaries of this month and later ones no longer match their data
+    if refresh_on_write():
+        background_tasks.add_task(
+            refresh_stale_summaries, user_id, db_transaction.date.year, db_transaction.date.month
+        )
+    return {
+        "id": db_transaction.id,
+        "user_id": user_id,
+        "amount": db_transaction.amount,
+        "category": categories.name(user_id, category_id),
+        "description": db_transaction.description,
+        "date": db_transaction.date
+    }
\ No newline at end of file
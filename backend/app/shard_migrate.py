@@ -0,0 +1,89 @@
+# backend/app/shard_migrate.py
+"""
+Split a single-file database into user shards.
+
+Every row goes to the shard of the user it belongs to (users by id, the other
+tables by user_id), keeping its ID; tables without a user column are copied
+to every shard. The source database is left untouched and the shards must be
+empty. Afterwards start the backend with the same DB_SHARDS and
+DB_SHARD_PATH_TEMPLATE.
+
+Run from the backend directory:
+    python -m app.shard_migrate --source ./budget_app.db --shards 4
+"""
+import argparse
+from typing import Dict, List
+from sqlalchemy import create_engine, func, insert, inspect, select
+
+from . import models
+from .category_migrate import has_legacy_categories
+from .database import SHARD_PATH_TEMPLATE, ShardRouter, shard_urls
+
+def migrate(source_url: str, router: ShardRouter, batch_size: int = 5000) -> Dict[str, List[int]]:
+    """
+    Copy every row of the source database to its user's shard
+
+    Args:
+        source_url: URL of the single-file database
+        router: Router of the target shards
+        batch_size: Rows read and inserted at a time
+
+    Returns:
+        Rows copied per table and shard
+    """
+    source = create_engine(source_url)
+    if has_legacy_categories(source):
+        raise RuntimeError("Convert the source's categories first: python -m app.category_migrate")
+    source_tables = inspect(source).get_table_names()
+    router.create_all(models.Base.metadata)
+
+    for engine in router.engines:
+        with engine.connect() as conn:
+            for table in models.Base.metadata.sorted_tables:
+                if conn.execute(select(func.count()).select_from(table)).scalar():
+                    raise RuntimeError(f"Shard {engine.url} already has rows in {table.name}")
+
+    copied = {}
+    with source.connect() as src:
+        # Parents before children, so foreign keys always resolve
+        for table in models.Base.metadata.sorted_tables:
+            if table.name not in source_tables:
+                continue
+            # Databases created by older versions may lack newer columns
+            columns = [table.c[column["name"]] for column in inspect(source).get_columns(table.name) if column["name"] in table.c]
+            owner = "id" if table.name == "users" else "user_id" if "user_id" in table.c else None
+
+            counts = [0] * router.shards
+            result = src.execution_options(yield_per=batch_size).execute(select(*columns))
+            for rows in result.mappings().partitions(batch_size):
+                by_shard = [[] for _ in range(router.shards)]
+                for row in rows:
+                    if owner is None or row[owner] is None:
+                        for shard_rows in by_shard:
+                            shard_rows.append(dict(row))
+                    else:
+                        by_shard[router.shard_for(row[owner])].append(dict(row))
+                for shard, shard_rows in enumerate(by_shard):
+                    if shard_rows:
+                        with router.engines[shard].begin() as conn:
+                            conn.execute(insert(table), shard_rows)
+                        counts[shard] += len(shard_rows)
+            copied[table.name] = counts
+    return copied
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="./budget_app.db", help="Path of the single-file database")
+    parser.add_argument("--shards", type=int, required=True)
+    parser.add_argument("--template", default=SHARD_PATH_TEMPLATE, help="Shard file path with a {shard} placeholder")
+    args = parser.parse_args()
+    if args.shards < 2:
+        parser.error("--shards must be at least 2")
+
+    router = ShardRouter(shard_urls(args.shards, args.template))
+    copied = migrate(f"sqlite:///{args.source}", router)
+    for table, counts in copied.items():
+        print(f"{table:<20} " + " ".join(f"{count:>8}" for count in counts))
+
+if __name__ == "__main__":
+    main()
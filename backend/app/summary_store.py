@@ -0,0 +1,58 @@
+# backend/app/summary_store.py
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from . import models
+
+def refresh_on_write() -> bool:
+    """
+    Whether writing a transaction or income regenerates the stale stored
+    summaries it affects in the background, rather than on their next visit
+    """
+    return os.getenv("SUMMARY_REFRESH_ON_WRITE", "false").lower() in ("1", "true", "yes")
+
+def summary_fingerprint(summary_data: Dict[str, Any]) -> str:
+    """
+    Hash of a summary's bridge payload: the month's spending, income and
+    history. Any write that would change the generated summary changes it.
+    """
+    canonical = json.dumps(summary_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def stored_summary(db: Session, user_id: int, year: int, month: int, fingerprint: str) -> Optional[Dict[str, Any]]:
+    """
+    The stored summary of a month, or None when there is none or it was
+    generated from different data
+    """
+    row = db.query(models.MonthlySummary).filter(
+        models.MonthlySummary.user_id == user_id,
+        models.MonthlySummary.year == year,
+        models.MonthlySummary.month == month
+    ).first()
+    if row is None or row.fingerprint != fingerprint:
+        return None
+    return json.loads(row.response)
+
+def store_summary(db: Session, user_id: int, year: int, month: int, fingerprint: str, response: Dict[str, Any]) -> None:
+    """
+    Store a generated summary, replacing the month's previous one
+    """
+    row = db.query(models.MonthlySummary).filter(
+        models.MonthlySummary.user_id == user_id,
+        models.MonthlySummary.year == year,
+        models.MonthlySummary.month == month
+    ).first()
+    if row is None:
+        row = models.MonthlySummary(user_id=user_id, year=year, month=month)
+        db.add(row)
+    row.fingerprint = fingerprint
+    row.response = json.dumps(response)
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request stored the same month first, its summary is as good
+        db.rollback()
@@ -0,0 +1,130 @@
+# backend/benchmarks/bench_categories.py
+"""
+Size of the transactions table and speed of category GROUP BY queries with
+category names stored as strings on every row, then after converting the
+database to the categories table (app.category_migrate).
+
+Run from the backend directory:
+    python -m benchmarks.bench_categories --transactions 500000 --users 1000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+
+from app.categories import CategoryCache
+from app.category_migrate import migrate_legacy_categories
+from app.database import ShardRouter
+
+# What users type, variants included
+RAW_CATEGORIES = [
+    "Food & Dining", "food & dining", "Food", "Groceries", "groceries ", "Transportation", "transport",
+    "Housing", "Rent", "Utilities", "Entertainment", "Shopping", "Healthcare", "Personal Care",
+    "Education", "Travel", "Subscriptions", "Other",
+]
+
+LEGACY_SCHEMA = [
+    "CREATE TABLE users (id INTEGER NOT NULL, PRIMARY KEY (id))",
+    """CREATE TABLE transactions (
+        id INTEGER NOT NULL, user_id INTEGER, amount FLOAT, category VARCHAR, date DATETIME,
+        description VARCHAR, PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES users (id)
+    )""",
+    "CREATE INDEX ix_transactions_id ON transactions (id)",
+]
+
+def seed(engine, transactions: int, users: int):
+    rng = random.Random(0)
+    start = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO users (id) VALUES (:id)"), [{"id": u} for u in range(1, users + 1)])
+        conn.execute(
+            text("INSERT INTO transactions (user_id, amount, category, date, description) VALUES (:u, :a, :c, :d, :s)"),
+            [
+                {
+                    "u": rng.randrange(1, users + 1),
+                    "a": round(rng.lognormvariate(3, 1), 2),
+                    "c": rng.choice(RAW_CATEGORIES),
+                    "d": start + timedelta(seconds=rng.randrange(365 * 86400)),
+                    "s": "Card payment",
+                }
+                for _ in range(transactions)
+            ]
+        )
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM"))
+
+def table_bytes(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT SUM(pgsize) FROM dbstat WHERE name = 'transactions'")).scalar()
+
+def timed(engine, query: str, params=None, repeat: int = 5) -> float:
+    with engine.connect() as conn:
+        conn.execute(text(query), params or {}).all()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            conn.execute(text(query), params or {}).all()
+        return (time.perf_counter() - started) / repeat
+
+def measure(engine, column: str, users: int, names=None) -> dict:
+    # Every user's totals by category in one pass
+    all_rows = timed(engine, f"SELECT user_id, {column}, SUM(amount) FROM transactions GROUP BY user_id, {column}")
+
+    # A month of spending by category per user, as spending_aggregates queries it
+    per_user = f"""
+        SELECT {column}, SUM(amount), COUNT(id) FROM transactions
+        WHERE user_id = :u AND date >= '2025-06-01' AND date < '2025-07-01' GROUP BY {column}
+    """
+    sample = range(1, min(users, 200) + 1)
+    with engine.connect() as conn:
+        started = time.perf_counter()
+        for user_id in sample:
+            rows = conn.execute(text(per_user), {"u": user_id}).all()
+            if names is not None:
+                # Names of the grouped IDs, from the in-memory cache
+                [names.name(user_id, category_id) for category_id, _, _ in rows]
+        per_user_ms = (time.perf_counter() - started) / len(sample) * 1000
+    return {"table_bytes": table_bytes(engine), "all_rows_ms": all_rows * 1000, "per_user_ms": per_user_ms}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=500000)
+    parser.add_argument("--users", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        url = f"sqlite:///{path}"
+        engine = create_engine(url)
+        seed(engine, args.transactions, args.users)
+        before = measure(engine, "category", args.users)
+        before["file_bytes"] = os.path.getsize(path)
+
+        started = time.perf_counter()
+        migrate_legacy_categories(engine)
+        migration_s = time.perf_counter() - started
+
+        names = CategoryCache(ShardRouter([url]))
+        for user_id in range(1, min(args.users, 200) + 1):
+            names.names(user_id)
+        after = measure(engine, "category_id", args.users, names)
+        after["file_bytes"] = os.path.getsize(path)
+
+    print(f"{args.transactions:,} transactions, {args.users:,} users, migration took {migration_s:.1f} s")
+    print(f"{'':<32} {'strings':>12} {'category IDs':>14}")
+    rows = [
+        ("transactions table (bytes)", "table_bytes", "{:,.0f}"),
+        ("database file (bytes)", "file_bytes", "{:,.0f}"),
+        ("all users by category (ms)", "all_rows_ms", "{:.1f}"),
+        ("per-user month by category (ms)", "per_user_ms", "{:.2f}"),
+    ]
+    for label, key, fmt in rows:
+        print(f"{label:<32} {fmt.format(before[key]):>12} {fmt.format(after[key]):>14}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# backend/benchmarks/bench_dashboard.py
+"""
+Cold-load latency of the dashboard: the requests the page used to make
+(every transaction, the month's income, goals and the available periods)
+against one GET /api/dashboard for the month.
+
+Run from the backend directory:
+    python -m benchmarks.bench_dashboard --years 5 --runs 50
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+MERCHANTS = ["Whole Foods Market", "Shell Gas", "Coffee shop", "Uber trip", "Amazon order", "Pharmacy", "Rent payment"]
+CATEGORIES = ["Food", "Transportation", "Shopping", "Healthcare", "Housing", "Entertainment"]
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+def seed(years: float, end: datetime) -> int:
+    from app import models
+    from app.categories import get_category_cache
+    from app.database import get_shard_router
+
+    rng = random.Random(0)
+    router = get_shard_router()
+    with router.engines[0].begin() as conn:
+        conn.execute(insert(models.User), [{"id": 1}])
+    ids = {name: get_category_cache().id_for(1, name) for name in CATEGORIES}
+
+    rows = []
+    day = end - timedelta(days=int(365.25 * years))
+    while day < end:
+        for _ in range(rng.randint(2, 6)):
+            rows.append({
+                "user_id": 1,
+                "amount": round(rng.lognormvariate(3, 0.8), 2),
+                "category_id": ids[rng.choice(CATEGORIES)],
+                "description": rng.choice(MERCHANTS),
+                "date": day + timedelta(minutes=rng.randrange(1440))
+            })
+        day += timedelta(days=1)
+    with router.engines[0].begin() as conn:
+        conn.execute(insert(models.Transaction), rows)
+        conn.execute(insert(models.UserIncome), [
+            {"user_id": 1, "year": y, "month": m, "income": 5000.0}
+            for y in range(end.year - int(years) - 1, end.year + 1) for m in range(1, 13)
+        ])
+        conn.execute(insert(models.Goal), [
+            {"user_id": 1, "description": f"Goal {i}", "target_amount": 1000.0 * (i + 1),
+             "deadline": end + timedelta(days=90 * (i + 1)), "goal_priority": i + 1}
+            for i in range(3)
+        ])
+    return len(rows)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=float, default=5)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # The app creates its database in the working directory when imported
+        os.chdir(directory)
+        from fastapi.testclient import TestClient
+        from app.main import app
+
+        end = datetime(2026, 1, 1)
+        count = seed(args.years, end)
+        month, year = 12, 2025
+        print(f"{args.years:g} years, {count:,} transactions, {args.runs} cold loads each")
+
+        client = TestClient(app)
+        old_requests = [
+            # The month is sent but ignored, the endpoint returns the whole history
+            ("/api/transactions", {"month": month, "year": year}),
+            ("/api/income", {"month": month, "year": year}),
+            ("/api/goals", None),
+            ("/api/available-periods", None),
+        ]
+
+        def get(path, params):
+            response = client.get(path, params=params)
+            response.raise_for_status()
+            return len(response.content)
+
+        def old_sequential():
+            return sum(get(path, params) for path, params in old_requests)
+
+        pool = ThreadPoolExecutor(max_workers=len(old_requests))
+
+        def old_concurrent():
+            return sum(pool.map(lambda request: get(*request), old_requests))
+
+        def dashboard(fields):
+            return lambda: get("/api/dashboard", {"month": month, "year": year, "fields": fields})
+
+        cases = [
+            ("4 requests, one after another", old_sequential),
+            ("4 requests, concurrent", old_concurrent),
+            ("/api/dashboard, page fields", dashboard("categories,income,goals,transactions,periods")),
+            ("/api/dashboard, all fields", dashboard(None)),
+        ]
+        print(f"{'':<32} {'p50 ms':>8} {'p99 ms':>8} {'bytes':>10}")
+        for label, load in cases:
+            load()  # warm the category cache and connections, as any earlier request would
+            timings, size = [], 0
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                size = load()
+                timings.append((time.perf_counter() - started) * 1000)
+            print(f"{label:<32} {percentile(timings, 50):8.2f} {percentile(timings, 99):8.2f} {size:>10,}")
+        pool.shutdown()
+        client.close()
+        os.chdir(cwd)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# backend/benchmarks/bench_group_commit.py
+"""
+Throughput and latency of concurrent single-transaction writes: committing
+each request on its own, as POST /api/transactions does by default, against
+handing the rows to the group-commit writer (TRANSACTION_GROUP_COMMIT=true).
+Clients are threads, like the thread pool FastAPI runs sync routes in.
+
+Run from the backend directory:
+    python -m benchmarks.bench_group_commit --clients 1 8 32 64 --writes 4000
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from app import models
+from app.categories import CategoryCache
+from app.database import ShardRouter
+from app.ingest import GroupCommitWriter
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+def per_request_commit(router: ShardRouter, user_id: int, values: dict) -> int:
+    # The body of create_transaction without group commit
+    db = router.session(user_id)
+    try:
+        db_transaction = models.Transaction(user_id=user_id, **values)
+        if not db.query(models.User).filter(models.User.id == user_id).first():
+            db.add(models.User(id=user_id))
+        db.add(db_transaction)
+        db.commit()
+        db.refresh(db_transaction)
+        return db_transaction.id
+    finally:
+        db.close()
+
+def run(mode: str, clients: int, writes: int, max_delay: float):
+    with tempfile.TemporaryDirectory() as directory:
+        router = ShardRouter([f"sqlite:///{os.path.join(directory, 'bench.db')}"])
+        router.create_all(models.Base.metadata)
+        writer = GroupCommitWriter(max_delay=max_delay, router=router)
+        categories = CategoryCache(router)
+        latencies = []
+        per_client = writes // clients
+
+        def client(client_id: int):
+            local = []
+            for i in range(per_client):
+                user_id = client_id % 16 + 1
+                values = {
+                    "amount": 12.5,
+                    "category_id": categories.id_for(user_id, "Groceries"),
+                    "description": "benchmark",
+                    "date": datetime(2026, 1, 1)
+                }
+                started = time.perf_counter()
+                if mode == "group":
+                    writer.submit(user_id, values)
+                else:
+                    per_request_commit(router, user_id, values)
+                local.append(time.perf_counter() - started)
+            latencies.extend(local)
+
+        threads = [threading.Thread(target=client, args=(c,)) for c in range(clients)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        db = router.session(1)
+        stored = db.query(models.Transaction).count()
+        db.close()
+        assert stored == per_client * clients, f"{stored} rows stored"
+        ms = [latency * 1000 for latency in latencies]
+        return stored / elapsed, percentile(ms, 50), percentile(ms, 99), writer.stats()["rows_per_batch"]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--writes", type=int, default=4000, help="Writes per run, split over the clients")
+    parser.add_argument("--max-delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    print(f"{'clients':>7} {'mode':>11} {'writes/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'rows/commit':>12}")
+    for clients in args.clients:
+        for mode in ("per-request", "group"):
+            rate, p50, p99, batch = run(mode, clients, args.writes, args.max_delay_ms / 1000)
+            batch = f"{batch:12.1f}" if mode == "group" else f"{1:12.1f}"
+            print(f"{clients:>7} {mode:>11} {rate:9,.0f} {p50:8.2f} {p99:8.2f} {batch}")
+
+if __name__ == "__main__":
+    main()
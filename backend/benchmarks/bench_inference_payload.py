@@ -0,0 +1,96 @@
+# backend/benchmarks/bench_inference_payload.py
+"""
+Compare the v1 (raw transactions) and v2 (SQL aggregates, compact gzip JSON)
+inference bridge payloads: bytes on the wire, time to build the payload and,
+with --bridge-url, end-to-end latency of POST /monthly_summary.
+
+Run from the backend directory:
+    python -m benchmarks.bench_inference_payload --transactions 100 1000 10000
+"""
+import argparse
+import gzip
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.aggregates import spending_aggregates, transaction_rows
+from app.database import Base
+
+CATEGORIES = ["Groceries", "Dining", "Rent", "Transport", "Utilities", "Shopping", "Health", "Travel"]
+
+def seed(n: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    rng = random.Random(0)
+    start = datetime(2025, 3, 1)
+    db.add(models.User(id=1))
+    categories = [models.Category(user_id=1, name=name) for name in CATEGORIES]
+    db.add_all(categories)
+    db.flush()
+    db.bulk_save_objects([
+        models.Transaction(
+            user_id=1,
+            amount=round(rng.lognormvariate(3, 1), 2),
+            category_id=rng.choice(categories).id,
+            date=start + timedelta(seconds=rng.randrange(31 * 86400)),
+            description=f"Purchase #{i}"
+        )
+        for i in range(n)
+    ])
+    db.commit()
+    return db
+
+def encode(version: int, payload) -> bytes:
+    if version == 1:
+        return json.dumps(payload).encode("utf-8")
+    return gzip.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), compresslevel=5)
+
+def build(db, version: int) -> dict:
+    start, end = datetime(2025, 3, 1), datetime(2025, 3, 31, 23, 59, 59)
+    payload = {"user_id": 1, "month": 3, "year": 2025, "income": 5000.0}
+    if version == 1:
+        payload["transactions"] = transaction_rows(db, 1, start, end)
+    else:
+        payload["aggregates"] = spending_aggregates(db, 1, start, end)
+    return payload
+
+def post(bridge_url: str, version: int, body: bytes) -> None:
+    headers = {"Content-Type": "application/json", "Cache-Control": "no-cache"}
+    if version == 2:
+        headers["Content-Encoding"] = "gzip"
+    response = requests.post(f"{bridge_url}/monthly_summary", data=body, headers=headers)
+    response.raise_for_status()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--bridge-url", help="Also time POST /monthly_summary against this bridge")
+    args = parser.parse_args()
+
+    print(f"{'rows':>7} {'ver':>3} {'bytes':>10} {'build ms':>9} {'e2e ms':>9}")
+    for n in args.transactions:
+        db = seed(n)
+        for version in (1, 2):
+            build_times, e2e_times = [], []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                body = encode(version, build(db, version))
+                build_times.append(time.perf_counter() - started)
+                if args.bridge_url:
+                    post(args.bridge_url, version, body)
+                    e2e_times.append(time.perf_counter() - started)
+            e2e = f"{statistics.median(e2e_times) * 1000:9.1f}" if e2e_times else f"{'-':>9}"
+            print(f"{n:>7} {'v' + str(version):>3} {len(body):>10} {statistics.median(build_times) * 1000:9.1f} {e2e}")
+        db.close()
+
+if __name__ == "__main__":
+    main()
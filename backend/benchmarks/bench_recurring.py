@@ -0,0 +1,136 @@
+# backend/benchmarks/bench_recurring.py
+"""
+Cost of keeping users' recurring-charge state current: detecting from the
+whole history on every read, as a stateless detector would, against the
+stored state caught up with only the transactions added since the last read.
+Also checks that the planted subscriptions and bills are the ones found.
+
+Run from the backend directory:
+    python -m benchmarks.bench_recurring --users 50 --years 5
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from app import models
+from app.database import ShardRouter
+from app.recurring import PERIODS, rebuild_state, recurring_charges, recurring_state
+
+# Noise: everyday spending at varying amounts, never recurring
+MERCHANTS = ["Whole Foods Market", "Shell Gas", "Coffee shop", "Uber trip", "Amazon order", "Pharmacy", "Restaurant"]
+
+# Subscriptions and bills: (description, amount, period)
+BILLS = [
+    ("Rent payment", 1500.0, "monthly"), ("NETFLIX.COM", 15.49, "monthly"), ("Spotify USA", 10.99, "monthly"),
+    ("City Power & Light", 85.0, "monthly"), ("Gym membership", 40.0, "monthly"), ("Cleaner", 60.0, "biweekly"),
+    ("Car insurance", 420.0, "quarterly"), ("Domain renewal", 20.0, "yearly"), ("Meal kit", 59.99, "weekly"),
+]
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+def user_history(rng: random.Random, user_id: int, start: datetime, end: datetime):
+    """
+    The user's transactions as (user_id, amount, date, description), with the
+    descriptions of the bills they pay
+    """
+    rows = []
+    bills = rng.sample(BILLS, rng.randint(3, 7))
+    for description, amount, period in bills:
+        day = start + timedelta(days=rng.randrange(int(PERIODS[period])))
+        while day < end:
+            # Charged a day or two late now and then, with an order number
+            jitter = timedelta(days=rng.choice([0, 0, 0, 1, 2]))
+            rows.append((user_id, amount, day + jitter, f"{description} #{rng.randint(1000, 9999)}"))
+            day += timedelta(days=PERIODS[period])
+    day = start
+    while day < end:
+        for _ in range(rng.randint(1, 5)):
+            rows.append((user_id, round(rng.lognormvariate(3, 0.8), 2), day, rng.choice(MERCHANTS)))
+        day += timedelta(days=1)
+    return rows, {description for description, _, _ in bills}
+
+def insert_rows(router: ShardRouter, rows) -> None:
+    rows = sorted(rows, key=lambda row: row[2])
+    with router.engines[0].begin() as conn:
+        conn.execute(insert(models.Transaction), [
+            {"user_id": user_id, "amount": amount, "date": day, "description": description}
+            for user_id, amount, day, description in rows
+        ])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--years", type=float, default=5)
+    parser.add_argument("--new-days", type=int, default=1, help="Days of new transactions between two reads")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    end = datetime(2026, 1, 1)
+    start = end - timedelta(days=int(365.25 * args.years))
+    with tempfile.TemporaryDirectory() as directory:
+        router = ShardRouter([f"sqlite:///{os.path.join(directory, 'bench.db')}"])
+        router.create_all(models.Base.metadata)
+        rows, planted = [], {}
+        for user_id in range(1, args.users + 1):
+            user_rows, planted[user_id] = user_history(rng, user_id, start, end)
+            rows.extend(user_rows)
+        with router.engines[0].begin() as conn:
+            conn.execute(insert(models.User), [{"id": user_id} for user_id in planted])
+        insert_rows(router, rows)
+        print(f"{args.users} users, {args.years:g} years, {len(rows):,} transactions")
+
+        full_ms, first_ms, caught_up_ms, incremental_ms, state_bytes = [], [], [], [], []
+        found, false_positives = 0, 0
+        db = router.session(1)
+        for user_id in planted:
+            started = time.perf_counter()
+            rebuild_state(db, user_id)
+            full_ms.append((time.perf_counter() - started) * 1000)
+
+            # The first read builds and stores the state
+            started = time.perf_counter()
+            state = recurring_state(db, user_id)
+            first_ms.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            recurring_state(db, user_id)
+            caught_up_ms.append((time.perf_counter() - started) * 1000)
+
+            row = db.query(models.RecurringExpenseState).filter(models.RecurringExpenseState.user_id == user_id).one()
+            state_bytes.append(len(row.state))
+            labels = {charge["description"].split(" #")[0] for charge in recurring_charges(state, end.date())}
+            found += len(labels & planted[user_id])
+            false_positives += len(labels - planted[user_id])
+
+        # A day of everyone's new spending, then every user reads again
+        new_rows = []
+        for user_id in planted:
+            new_rows.extend(user_history(rng, user_id, end, end + timedelta(days=args.new_days))[0])
+        insert_rows(router, new_rows)
+        for user_id in planted:
+            started = time.perf_counter()
+            recurring_state(db, user_id)
+            incremental_ms.append((time.perf_counter() - started) * 1000)
+        db.close()
+
+    print(f"{'':<38} {'p50 ms':>8} {'p99 ms':>8}")
+    for label, values in [
+        ("whole history (stateless)", full_ms),
+        ("first read, builds and stores state", first_ms),
+        (f"read after {args.new_days} day(s) of new spending", incremental_ms),
+        ("read with nothing new", caught_up_ms),
+    ]:
+        print(f"{label:<38} {percentile(values, 50):8.2f} {percentile(values, 99):8.2f}")
+    planted_count = sum(len(bills) for bills in planted.values())
+    print(f"stored state: {percentile(state_bytes, 50):,} bytes per user (p50)")
+    print(f"found {found} of {planted_count} planted bills, {false_positives} false positives")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# backend/benchmarks/bench_shards.py
+"""
+Write throughput of concurrent single-transaction inserts, each committed on
+its own as POST /api/transactions does, with users spread over 1, 2, 4 and 8
+database shards. Writers are separate processes, like uvicorn workers.
+
+Local SSDs sync in well under a millisecond, so on a host with few cores the
+writers are CPU bound before the database lock matters. --hold-ms keeps each
+write's lock for that long before committing (after the insert is flushed),
+standing in for the 1-10 ms a sync takes on network block storage.
+
+Run from the backend directory:
+    python -m benchmarks.bench_shards --shards 1 2 4 8 --writers 8 --writes 500
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from app import models
+from app.categories import CategoryCache
+from app.database import ShardRouter
+
+USERS = 64
+
+def urls(shards: int, template: str):
+    return [f"sqlite:///{template.format(shard=shard)}" for shard in range(shards)]
+
+def writer(template: str, shards: int, writer_id: int, writes: int, hold: float, start) -> float:
+    router = ShardRouter(urls(shards, template))
+    categories = CategoryCache(router)
+    rng = random.Random(writer_id)
+    start.wait()
+    started = time.perf_counter()
+    for i in range(writes):
+        user_id = rng.randrange(1, USERS + 1)
+        db = router.session(user_id)
+        try:
+            db.add(models.Transaction(
+                user_id=user_id,
+                amount=round(rng.lognormvariate(3, 1), 2),
+                category_id=categories.id_for(user_id, "Groceries"),
+                date=datetime(2026, 1, 1) + timedelta(minutes=i),
+                description="benchmark"
+            ))
+            if hold:
+                # Flushing takes the shard's write lock, held until the commit
+                db.flush()
+                time.sleep(hold)
+            db.commit()
+        finally:
+            db.close()
+    return time.perf_counter() - started
+
+def run(shards: int, writers: int, writes: int, hold: float) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        template = os.path.join(directory, "shard{shard}.db")
+        router = ShardRouter(urls(shards, template))
+        router.create_all(models.Base.metadata)
+        for user_id in range(1, USERS + 1):
+            db = router.session(user_id)
+            db.add(models.User(id=user_id))
+            db.commit()
+            db.close()
+        with multiprocessing.Manager() as manager:
+            start = manager.Barrier(writers + 1)
+            with multiprocessing.Pool(writers) as pool:
+                pending = pool.starmap_async(writer, [(template, shards, w, writes, hold, start) for w in range(writers)])
+                start.wait()
+                started = time.perf_counter()
+                pending.get()
+                return writers * writes / (time.perf_counter() - started)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=500, help="Commits per writer")
+    parser.add_argument("--hold-ms", type=float, default=0.0, help="Extra time each write holds the lock")
+    args = parser.parse_args()
+
+    print(f"{'shards':>6} {'writes/s':>10} {'speedup':>8}")
+    baseline = None
+    for shards in args.shards:
+        rate = run(shards, args.writers, args.writes, args.hold_ms / 1000)
+        baseline = baseline or rate
+        print(f"{shards:>6} {rate:10,.0f} {rate / baseline:8.2f}")
+
+if __name__ == "__main__":
+    main()
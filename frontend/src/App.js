@@ -1,10 +1,9 @@
 // frontend/src/App.js
-import React, { useState, useEffect } from 'react';
+import React, { useState } from 'react';
 import { BrowserRouter as Router, Routes, Route, Link, NavLink } from 'react-router-dom';
 import Dashboard from './components/Dashboard';
 import GoalPlanner from './components/GoalPlanner';
 import AISummary from './components/AISummary';
-import { getAvailablePeriods } from './api';
 import './styles/global.css';
 
 function App() {
@@ -12,31 +11,6 @@ function App() {
   const [selectedMonth, setSelectedMonth] = useState(currentDate.getMonth() + 1); // 1-12
   const [selectedYear, setSelectedYear] = useState(currentDate.getFullYear());
 
-  const [availablePeriods, setAvailablePeriods] = useState(null);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {
-    const fetchAvailablePeriods = async () => {
-      try {
-        const periods = await getAvailablePeriods();
-        setAvailablePeriods(periods);
-        
-        // Set default month/year to the most recent available
-        const latestYear = periods.years[periods.years.length - 1];
-        const latestMonth = Math.max(...periods.months[latestYear]);
-        
-        setSelectedMonth(latestMonth);
-        setSelectedYear(latestYear);
-      } catch (error) {
-        console.error('Error loading available periods:', error);
-      } finally {
-        setLoading(false);
-      }
-    };
-    
-    fetchAvailablePeriods();
-  }, []);
-
   // Handler for when month selection changes
   const handleMonthChange = ({ month, year }) => {
     setSelectedMonth(month);
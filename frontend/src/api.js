@@ -100,6 +100,16 @@ export const createGoal = async (goalData) => {
   }
 };
 
+export const refreshGoalPlans = async () => {
+  try {
+    const response = await api.post('/goals/refresh_plans');
+    return response.data;
+  } catch (error) {
+    console.error('Error refreshing goal plans:', error);
+    throw error;
+  }
+};
+
 export const deleteGoal = async (goalId) => {
   try {
     const response = await api.delete(`/goal/${goalId}`);
@@ -121,6 +131,75 @@ export const generateSummary = async (summaryData) => {
   }
 };
 
+// Stream a summary as server-sent events. onEvent(event, data) is called for the
+// "meta" event (deterministic totals), each "token" event and the final "done" event.
+export const streamSummary = async (summaryData, onEvent) => {
+  try {
+    const response = await fetch(`${API_URL}/summary/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(summaryData),
+    });
+    if (!response.ok) {
+      throw new Error(`Summary stream failed with status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      // Events are separated by a blank line
+      let boundary = buffer.indexOf('\n\n');
+      while (boundary !== -1) {
+        const rawEvent = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf('\n\n');
+
+        let event = 'message';
+        let data = '';
+        rawEvent.split('\n').forEach((line) => {
+          if (line.startsWith('event: ')) event = line.slice(7);
+          if (line.startsWith('data: ')) data += line.slice(6);
+        });
+        if (event === 'error') {
+          throw new Error(JSON.parse(data).detail);
+        }
+        onEvent(event, data ? JSON.parse(data) : null);
+      }
+    }
+  } catch (error) {
+    console.error('Error streaming summary:', error);
+    throw error;
+  }
+};
+
+// Dashboard: a month's spending by category, income, goals with progress, available
+// periods, the stored summary and the month's transactions in one request. fields
+// picks a subset of 'categories', 'income', 'goals', 'periods', 'summary', 'transactions'.
+export const getDashboard = async (month, year, fields) => {
+  try {
+    const params = {};
+    if (month && year) {
+      params.month = month;
+      params.year = year;
+    }
+    if (fields && fields.length > 0) {
+      params.fields = fields.join(',');
+    }
+
+    const response = await api.get('/dashboard', { params });
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching dashboard:', error);
+    throw error;
+  }
+};
+
 export const getAvailablePeriods = async () => {
   try {
     const response = await api.get('/available-periods');
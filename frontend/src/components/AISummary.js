@@ -10,7 +10,7 @@ import {
   Tooltip,
   Legend
 } from 'chart.js';
-import { generateSummary } from '../api';
+import { streamSummary } from '../api';
 
 // Register ChartJS components
 ChartJS.register(
@@ -92,12 +92,19 @@ const AISummary = ({ initialMonth, initialYear, availablePeriods }) => {
       setIsLoading(true);
       setError('');
 
-      const data = await generateSummary({
-        month,
-        year
-      });
+      setSummaryData(null);
 
-      setSummaryData(data);
+      // Totals arrive in the first event, the analysis text follows token by token
+      await streamSummary({ month, year }, (event, data) => {
+        if (event === 'meta') {
+          setSummaryData({ ...data, summary: '' });
+          setIsLoading(false);
+        } else if (event === 'token') {
+          setSummaryData(prev => ({ ...prev, summary: prev.summary + data.text }));
+        } else if (event === 'done') {
+          setSummaryData(prev => ({ ...prev, summary: data.summary }));
+        }
+      });
     } catch (error) {
       console.error('Error generating summary:', error);
       setError('Failed to generate summary. Please try again.');
@@ -234,6 +241,19 @@ const AISummary = ({ initialMonth, initialYear, availablePeriods }) => {
             </p>
           </div>
 
+          {summaryData.anomalies && summaryData.anomalies.length > 0 && (
+            <div style={{ marginBottom: '20px' }}>
+              <h4>Unusual Spending</h4>
+              <ul style={{ margin: 0 }}>
+                {summaryData.anomalies.map(anomaly => (
+                  <li key={anomaly.category}>
+                    {anomaly.category}: <strong>${anomaly.amount.toFixed(2)}</strong> vs a typical ${anomaly.baseline.toFixed(2)}
+                  </li>
+                ))}
+              </ul>
+            </div>
+          )}
+
           <div style={{ marginBottom: '20px' }}>
             <h4>AI Analysis</h4>
             <div style={{
@@ -15,7 +15,7 @@ import {
 import ExpenseModal from './ExpenseModal';
 import IncomeModal from './IncomeModal';
 import MonthSelector from './MonthSelector';
-import { getTransactions, getIncome, getGoals } from '../api';
+import { getDashboard } from '../api';
 
 // Register ChartJS components
 ChartJS.register(
@@ -28,6 +28,9 @@ ChartJS.register(
   Legend
 );
 
+// Dashboard parts shown on this page, available periods are added until they are known
+const DASHBOARD_FIELDS = ['categories', 'income', 'goals', 'transactions'];
+
 const Dashboard = ({ initialMonth, initialYear, onMonthChange, availablePeriods }) => {
   // Use initial month and year from props, or current date if not provided
   const [selectedMonth, setSelectedMonth] = useState(initialMonth || (new Date().getMonth() + 1)); // 1-12
@@ -37,6 +40,9 @@ const Dashboard = ({ initialMonth, initialYear, onMonthChange, availablePeriods
   const [filteredTransactions, setFilteredTransactions] = useState([]);
   const [income, setIncome] = useState(0);
   const [goals, setGoals] = useState([]);
+  const [categoryTotals, setCategoryTotals] = useState({});
+  const [totalSpending, setTotalSpending] = useState(0);
+  const [periods, setPeriods] = useState(availablePeriods || null);
   const [isExpenseModalOpen, setIsExpenseModalOpen] = useState(false);
   const [isIncomeModalOpen, setIsIncomeModalOpen] = useState(false);
   const [loading, setLoading] = useState(true);
@@ -57,14 +63,14 @@ const Dashboard = ({ initialMonth, initialYear, onMonthChange, availablePeriods
 
   // Validate if the current month/year combination is available
   useEffect(() => {
-    if (availablePeriods) {
-      const isValidYear = availablePeriods.years.includes(selectedYear);
-      const isValidMonth = isValidYear && availablePeriods.months[selectedYear]?.includes(selectedMonth);
+    if (periods && periods.years.length > 0) {
+      const isValidYear = periods.years.includes(selectedYear);
+      const isValidMonth = isValidYear && periods.months[selectedYear]?.includes(selectedMonth);
 
       if (!isValidYear || !isValidMonth) {
         // Find a valid month/year combination
-        const validYear = availablePeriods.years[availablePeriods.years.length - 1]; // default to latest year
-        const validMonth = availablePeriods.months[validYear][availablePeriods.months[validYear].length - 1]; // default to latest month
+        const validYear = periods.years[periods.years.length - 1]; // default to latest year
+        const validMonth = periods.months[validYear][periods.months[validYear].length - 1]; // default to latest month
 
         // Update both local state and parent state
         setSelectedMonth(validMonth);
@@ -75,21 +81,29 @@ const Dashboard = ({ initialMonth, initialYear, onMonthChange, availablePeriods
         }
       }
     }
-  }, [availablePeriods, selectedMonth, selectedYear, onMonthChange]);
+  }, [periods, selectedMonth, selectedYear, onMonthChange]);
+
+  // Apply whichever parts of the dashboard a response carries
+  const applyDashboard = (data) => {
+    if (data.transactions) setTransactions(data.transactions);
+    if (data.category_totals) setCategoryTotals(data.category_totals);
+    if (data.total_spending !== undefined) setTotalSpending(data.total_spending);
+    if (data.income !== undefined) setIncome(data.income);
+    if (data.goals) setGoals(data.goals);
+    if (data.periods) setPeriods(data.periods);
+  };
 
   useEffect(() => {
     const fetchData = async () => {
       try {
         setLoading(true);
-        const [transactionsData, incomeData, goalsData] = await Promise.all([
-          getTransactions(selectedMonth, selectedYear),
-          getIncome(selectedMonth, selectedYear),
-          getGoals()
-        ]);
-
-        setTransactions(transactionsData);
-        setIncome(incomeData.income);
-        setGoals(goalsData);
+        // One request for the whole page, the first one also brings the available periods
+        const data = await getDashboard(
+          selectedMonth,
+          selectedYear,
+          periods ? DASHBOARD_FIELDS : [...DASHBOARD_FIELDS, 'periods']
+        );
+        applyDashboard(data);
       } catch (error) {
         console.error('Error fetching dashboard data:', error);
       } finally {
@@ -100,31 +114,18 @@ const Dashboard = ({ initialMonth, initialYear, onMonthChange, availablePeriods
     fetchData();
   }, [selectedMonth, selectedYear]);
 
-  // Filter transactions by selected month and year
+  // Transactions arrive already limited to the selected month
   useEffect(() => {
-    if (transactions.length > 0) {
-      const filtered = transactions.filter(transaction => {
-        const transactionDate = new Date(transaction.date);
-        return (
-          transactionDate.getMonth() + 1 === selectedMonth &&
-          transactionDate.getFullYear() === selectedYear
-        );
-      });
-      setFilteredTransactions(filtered);
-      // Reset to first page when filter changes
-      setCurrentPage(1);
-    }
-  }, [transactions, selectedMonth, selectedYear]);
+    setFilteredTransactions(transactions);
+    // Reset to first page when the month changes
+    setCurrentPage(1);
+  }, [transactions]);
 
   const refreshData = async () => {
     try {
-      const [transactionsData, incomeData] = await Promise.all([
-        getTransactions(selectedMonth, selectedYear),
-        getIncome(selectedMonth, selectedYear)
-      ]);
-
-      setTransactions(transactionsData);
-      setIncome(incomeData.income);
+      // A new expense can open up a new month
+      const data = await getDashboard(selectedMonth, selectedYear, ['categories', 'income', 'transactions', 'periods']);
+      applyDashboard(data);
     } catch (error) {
       console.error('Error refreshing data:', error);
     }
@@ -140,22 +141,6 @@ const Dashboard = ({ initialMonth, initialYear, onMonthChange, availablePeriods
     }
   };
 
-  // Calculate total spending for the selected month
-  const totalSpending = filteredTransactions.reduce(
-    (sum, transaction) => sum + transaction.amount,
-    0
-  );
-
-  // Group transactions by category for the selected month
-  const categoryTotals = filteredTransactions.reduce((acc, transaction) => {
-    const { category, amount } = transaction;
-    if (!acc[category]) {
-      acc[category] = 0;
-    }
-    acc[category] += amount;
-    return acc;
-  }, {});
-
   // Prepare chart data
   const pieChartData = {
     labels: Object.keys(categoryTotals),
@@ -267,7 +252,7 @@ const Dashboard = ({ initialMonth, initialYear, onMonthChange, availablePeriods
           currentMonth={selectedMonth}
           currentYear={selectedYear}
           onChange={handleMonthChange}
-          availablePeriods={availablePeriods}
+          availablePeriods={periods}
         />
 
       {/* Show selected month info */}
@@ -432,7 +417,7 @@ const Dashboard = ({ initialMonth, initialYear, onMonthChange, availablePeriods
           onSave={refreshData}
           selectedMonth={selectedMonth}
           selectedYear={selectedYear}
-          availablePeriods={availablePeriods}
+          availablePeriods={periods}
         />
       )}
 
@@ -443,7 +428,7 @@ const Dashboard = ({ initialMonth, initialYear, onMonthChange, availablePeriods
           currentIncome={income}
           selectedMonth={selectedMonth}
           selectedYear={selectedYear}
-          availablePeriods={availablePeriods}
+          availablePeriods={periods}
         />
       )}
     </div>
@@ -2,7 +2,7 @@
 import React, { useState, useEffect, useRef } from 'react';
 import DatePicker from 'react-datepicker';
 import 'react-datepicker/dist/react-datepicker.css';
-import { createGoal, getGoals, deleteGoal } from '../api';
+import { createGoal, getGoals, deleteGoal, refreshGoalPlans } from '../api';
 import { useLocation } from 'react-router-dom';
 
 const GoalPlanner = () => {
@@ -11,6 +11,7 @@ const GoalPlanner = () => {
   const [deadline, setDeadline] = useState(new Date());
   const [goalPriority, setGoalPriority] = useState(1); // Default priority
   const [isSubmitting, setIsSubmitting] = useState(false);
+  const [isRefreshing, setIsRefreshing] = useState(false);
   const [error, setError] = useState('');
   const [success, setSuccess] = useState('');
   const [goals, setGoals] = useState([]);
@@ -71,6 +72,21 @@ const GoalPlanner = () => {
   };
 
 
+  const handleRefreshPlans = async () => {
+    try {
+      setIsRefreshing(true);
+      setGoals(await refreshGoalPlans());
+    } catch (error) {
+      console.error('Error refreshing goal plans:', error);
+      setError('Failed to refresh plans. Please try again.');
+      setTimeout(() => {
+        setError('');
+      }, 3000);
+    } finally {
+      setIsRefreshing(false);
+    }
+  };
+
   const handleSubmit = async (e) => {
     e.preventDefault();
 
@@ -103,14 +119,15 @@ const GoalPlanner = () => {
       setIsSubmitting(true);
       setError('');
 
-      const newGoal = await createGoal({
+      await createGoal({
         description,
         target_amount: parseFloat(targetAmount),
-        deadline: deadline.toISOString()
+        deadline: deadline.toISOString(),
+        goal_priority: goalPriority
       });
 
-      // Update goals list
-      setGoals([...goals, newGoal]);
+      // Reload all goals, since the new goal changes the plans of the others
+      setGoals(await getGoals());
 
       // Reset form
       setDescription('');
@@ -225,6 +242,14 @@ const GoalPlanner = () => {
         <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', marginBottom: '15px' }}>
           <h3 style={{ margin: 0 }}>Your Financial Goals</h3>
           <div style={{ display: 'flex', gap: '10px', marginRight: '15px' }}>
+            <button
+              className="btn btn-secondary"
+              style={{ padding: '6px 12px', fontSize: '14px' }}
+              onClick={handleRefreshPlans}
+              disabled={isRefreshing || goals.length === 0}
+            >
+              {isRefreshing ? 'Refreshing...' : 'Refresh Plans'}
+            </button>
             <span style={{ paddingTop: '5px' }}>Sort by:</span>
             <button
               className="btn btn-secondary"
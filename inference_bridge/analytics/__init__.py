@@ -0,0 +1,10 @@
+# inference_bridge/analytics/__init__.py
+from .anomaly import find_spending_anomalies, flag_anomalies, robust_z_scores
+from .feasibility import assess_goal_feasibility, months_until, net_flow_distribution, simulate_goals
+from .allocation import allocate_savings, plan_goal_allocations
+
+__all__ = [
+    "find_spending_anomalies", "flag_anomalies", "robust_z_scores",
+    "assess_goal_feasibility", "months_until", "net_flow_distribution", "simulate_goals",
+    "allocate_savings", "plan_goal_allocations",
+]
@@ -0,0 +1,111 @@
+# inference_bridge/analytics/allocation.py
+from datetime import datetime
+from typing import List, Optional, Tuple
+import numpy as np
+
+from inference_bridge.analytics.feasibility import (
+    feasibility_results, months_until, net_flow_distribution, parse_deadline, simulate_goals, simulation_seed
+)
+from inference_bridge.data.request.multi_goal_request import GoalSpec
+from inference_bridge.data.request.spending_aggregates import SpendingAggregates
+from inference_bridge.data.response.goal_response import GoalFeasibility
+
+
+def allocate_savings(
+    budget: float,
+    targets: np.ndarray,
+    months_available: np.ndarray,
+    priorities: np.ndarray,
+    margin: float = 0.1,
+) -> np.ndarray:
+    """
+    Split a monthly savings budget across competing goals.
+
+    Goals are funded in order of priority, highest first, and among equal
+    priorities by earliest deadline. Each goal gets the monthly amount that
+    reaches its target by its deadline plus margin, since saving exactly that
+    much on average is on time only half of the time. A goal whose amount no
+    longer fits is passed over, so cheaper lower-priority goals can still be
+    put on track, and then gets what is left in the same order. Budget left
+    over once every goal is on track is split in proportion to priority, so
+    the more important goals finish early. No goal gets more than its whole
+    target in a month.
+
+    Args:
+        budget: Savings available per month
+        targets: Amount to save per goal, shape (goals,)
+        months_available: Months until each goal's deadline, shape (goals,)
+        priorities: Priority per goal, higher is more important, shape (goals,)
+        margin: Extra funding as a fraction of the exact monthly amount
+
+    Returns:
+        Monthly allocation per goal, shape (goals,)
+    """
+    targets = np.asarray(targets, dtype=float)
+    priorities = np.asarray(priorities, dtype=float)
+    remaining = max(budget, 0.0)
+
+    required = (1 + margin) * targets / np.maximum(np.asarray(months_available, dtype=float), 1.0)
+    order = np.lexsort((months_available, -priorities))
+    allocation = np.zeros_like(required)
+
+    # A user has a handful of goals, so plain loops are fine here
+    for i in order:
+        if required[i] <= remaining:
+            allocation[i] = required[i]
+            remaining -= required[i]
+    for i in order:
+        if allocation[i] < required[i]:
+            allocation[i] = min(required[i], remaining)
+            remaining -= allocation[i]
+
+    if remaining > 0:
+        weights = np.maximum(priorities, 1.0)
+        allocation = np.minimum(allocation + remaining * weights / weights.sum(), targets)
+    return allocation
+
+
+def plan_goal_allocations(
+    goals: List[GoalSpec],
+    user_income: float,
+    spending: SpendingAggregates,
+    monthly_net_flows: Optional[List[float]] = None,
+    paths: int = 1000,
+    now: Optional[datetime] = None,
+) -> Tuple[List[GoalFeasibility], float]:
+    """
+    Allocate a user's expected savings across all their goals and simulate
+    each goal's feasibility on its share
+
+    The month-to-month variation of the savings is shared out in proportion to
+    the allocations, and all goals are simulated in one simulate_goals call.
+
+    Args:
+        goals: The user's goals
+        user_income: Monthly income
+        spending: Spending aggregates of the past months
+        monthly_net_flows: Income minus spending of past months, if known
+        paths: Trajectories to simulate per goal
+        now: Current time, defaults to datetime.now()
+
+    Returns:
+        The feasibility of each goal, in the order given, whose
+        expected_monthly_savings is its allocation, and the expected monthly
+        savings left unallocated
+    """
+    now = now or datetime.now()
+    targets = np.array([goal.target_amount for goal in goals], dtype=float)
+    months_remaining = np.array([months_until(parse_deadline(goal.deadline), now) for goal in goals])
+    priorities = np.array([goal.priority or 0 for goal in goals], dtype=float)
+
+    mean, std = net_flow_distribution(user_income, spending, monthly_net_flows)
+    allocation = allocate_savings(mean, targets, months_remaining, priorities)
+
+    share = allocation / allocation.sum() if allocation.sum() > 0 else np.zeros_like(allocation)
+    goal_inputs = [value for goal in goals for value in (goal.target_amount, goal.deadline, goal.priority or 0)]
+    probability, completion = simulate_goals(
+        targets, allocation, np.maximum(std * share, 1e-3), months_remaining, paths=paths,
+        seed=simulation_seed(mean, std, paths, *goal_inputs)
+    )
+    results = feasibility_results(targets, months_remaining, allocation, probability, completion, now)
+    return results, round(max(mean - float(allocation.sum()), 0.0), 2)
@@ -0,0 +1,128 @@
+# inference_bridge/analytics/anomaly.py
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from inference_bridge.data.request.category_history import CategoryHistory
+from inference_bridge.data.response.summary_response import CategoryAnomaly
+
+# Scales the median absolute deviation to a standard deviation under normality
+MAD_TO_SIGMA = 1.4826
+
+# Iglewicz and Hoaglin's cut-off for robust z-scores
+DEFAULT_THRESHOLD = 3.5
+
+
+def robust_z_scores(
+    current: np.ndarray,
+    history: np.ndarray,
+    min_scale: float = 10.0,
+    relative_floor: float = 0.35,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score each user's current category spending against their own history.
+
+    The baseline is the median of the history and the spread its median absolute
+    deviation, so one unusual past month does not mask or cause a flag. The
+    spread is floored at relative_floor of the baseline and at min_scale, so
+    categories with very steady spending do not flag on ordinary variation: a
+    MAD from a handful of months is noisy, and with the defaults spending has
+    to be more than about twice the baseline to reach a z-score of 3.5.
+
+    Args:
+        current: Spending of the current month, shape (users, categories)
+        history: Spending of past months, shape (users, months, categories),
+            NaN for months a user has no data for
+        min_scale: Smallest spread in currency units
+        relative_floor: Smallest spread as a fraction of the baseline
+
+    Returns:
+        Robust z-scores and baselines, both (users, categories), and the
+        number of history months per user, shape (users,)
+    """
+    padded = np.isnan(history).any()
+    if padded:
+        months = np.count_nonzero(~np.isnan(history[:, :, 0]), axis=1)
+        # Users without any history month would warn on all-NaN slices
+        filled = np.where(months[:, None, None] > 0, history, 0.0)
+        baseline = np.nanmedian(filled, axis=1)
+        spread = np.nanmedian(np.abs(filled - baseline[:, None, :]), axis=1)
+    else:
+        months = np.full(history.shape[0], history.shape[1])
+        baseline = np.median(history, axis=1)
+        spread = np.median(np.abs(history - baseline[:, None, :]), axis=1)
+
+    scale = np.maximum(MAD_TO_SIGMA * spread, np.maximum(relative_floor * baseline, min_scale))
+    return (current - baseline) / scale, baseline, months
+
+
+def flag_anomalies(
+    current: np.ndarray,
+    history: np.ndarray,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_history: int = 3,
+    min_amount: float = 25.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flag categories whose current spending is unusually high, for many users at once
+
+    Args:
+        current: Spending of the current month, shape (users, categories)
+        history: Spending of past months, shape (users, months, categories), NaN padded
+        threshold: Robust z-score at or above which spending is unusual
+        min_history: Users with fewer history months get no flags
+        min_amount: Spending below this is never unusual
+
+    Returns:
+        Boolean flags, z-scores and baselines, each (users, categories)
+    """
+    z, baseline, months = robust_z_scores(current, history)
+    flags = (z >= threshold) & (current >= min_amount) & (months >= min_history)[:, None]
+    return flags, z, baseline
+
+
+def find_spending_anomalies(
+    category_totals: Dict[str, float],
+    history: Optional[CategoryHistory],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_history: int = 3,
+    max_anomalies: int = 3,
+) -> Optional[List[CategoryAnomaly]]:
+    """
+    Find one user's categories with unusually high spending this month
+
+    Args:
+        category_totals: Spending by category of the current month
+        history: Spending by category of the preceding months
+        threshold: Robust z-score at or above which spending is unusual
+        min_history: Fewer history months than this are too few to judge
+        max_anomalies: Most anomalies to report
+
+    Returns:
+        The anomalies, most unusual first, or None without enough history
+    """
+    if history is None or len(history.months) < min_history:
+        return None
+
+    categories = list(dict.fromkeys(list(category_totals) + history.categories))
+    index = {category: i for i, category in enumerate(categories)}
+
+    current = np.zeros((1, len(categories)))
+    for category, amount in category_totals.items():
+        current[0, index[category]] = amount
+
+    past = np.zeros((1, len(history.months), len(categories)))
+    columns = [index[category] for category in history.categories]
+    past[0][:, columns] = np.asarray(history.totals, dtype=float)
+
+    flags, z, baseline = flag_anomalies(current, past, threshold=threshold, min_history=min_history)
+
+    flagged = sorted(np.flatnonzero(flags[0]), key=lambda i: z[0, i], reverse=True)[:max_anomalies]
+    return [
+        CategoryAnomaly(
+            category=categories[i],
+            amount=round(float(current[0, i]), 2),
+            baseline=round(float(baseline[0, i]), 2),
+            z_score=round(float(z[0, i]), 2),
+        )
+        for i in flagged
+    ]
@@ -0,0 +1,233 @@
+# inference_bridge/analytics/feasibility.py
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Tuple
+import hashlib
+import numpy as np
+
+from inference_bridge.data.request.spending_aggregates import SpendingAggregates
+from inference_bridge.data.response.goal_response import GoalFeasibility
+
+# Mean length of a Gregorian month
+AVERAGE_MONTH_DAYS = 365.2425 / 12
+
+# Months of spending covered by a goal request's aggregates
+SPENDING_WINDOW_MONTHS = 2
+
+
+def parse_deadline(deadline: str) -> datetime:
+    """
+    Parse an ISO deadline into a naive datetime comparable with datetime.now()
+    """
+    return datetime.fromisoformat(deadline.replace("Z", "+00:00")).replace(tzinfo=None)
+
+
+def months_until(deadline: datetime, now: Optional[datetime] = None) -> float:
+    """
+    Fractional months from now until the deadline, 0 once it has passed.
+
+    Counts days rather than calendar month numbers, so a deadline on the 1st of
+    next month is a few days away, not a whole month.
+    """
+    now = now or datetime.now()
+    return max((deadline - now).total_seconds() / 86400 / AVERAGE_MONTH_DAYS, 0.0)
+
+
+def simulation_seed(*inputs: Any) -> int:
+    """
+    Seed the simulation from its inputs, so the same goals on the same
+    finances always get the same estimate, and the prompts built from it stay
+    identical for the response cache and single-flight.
+
+    Amounts are rounded to cents and deadlines passed as given, rather than as
+    months from now, which change from one call to the next.
+    """
+    key = repr([round(float(value), 2) if isinstance(value, (int, float)) else value for value in inputs])
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def simulate_goals(
+    targets: np.ndarray,
+    net_mean: np.ndarray,
+    net_std: np.ndarray,
+    months_available: np.ndarray,
+    paths: int = 1000,
+    horizon: int = 120,
+    seed: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Monte Carlo savings trajectories for many goals at once.
+
+    Every month of every path saves a normally distributed net flow, and a path
+    completes once its running balance reaches the goal's target. The share of
+    completed paths after each whole month is interpolated linearly in between,
+    so deadlines and completion times are fractional months.
+
+    All goals share one set of standard normal random walks, scaled by each
+    goal's mean and spread (common random numbers), so a path reaches a target
+    after month k exactly when walk[k] >= (target - k * mean) / spread: one
+    comparison per goal, path and month, and drawing random numbers costs the
+    same for one goal or a thousand. A goal drops out once its deadline has
+    passed and half of its paths have completed.
+
+    Args:
+        targets: Amount to save per goal, shape (goals,)
+        net_mean: Mean monthly net flow per goal, shape (goals,)
+        net_std: Standard deviation of the monthly net flow, positive, shape (goals,)
+        months_available: Months until each goal's deadline, shape (goals,)
+        paths: Trajectories per goal
+        horizon: Months simulated at most, later completions count as never
+        seed: Seed of the random generator, for reproducible results
+
+    Returns:
+        The probability of completing by the deadline and the median completion
+        time in months (inf when under half the paths complete), both (goals,)
+    """
+    targets = np.asarray(targets, dtype=np.float32)
+    months_available = np.asarray(months_available, dtype=np.float32)
+    net_mean = np.asarray(net_mean, dtype=np.float32)
+    net_std = np.asarray(net_std, dtype=np.float32)
+    goals = targets.shape[0]
+
+    # Drawn a year at a time, as most goals resolve long before the horizon
+    rng = np.random.default_rng(seed)
+    walk = np.zeros((horizon, paths), dtype=np.float32)
+    drawn = 0
+
+    # done[g, k] is the share of goal g's paths completed after k months
+    done = np.zeros((goals, horizon + 1), dtype=np.float32)
+    done[targets <= 0] = 1.0
+    active = np.flatnonzero(targets > 0)
+    completed = np.zeros((active.size, paths), dtype=bool)
+
+    for month in range(1, horizon + 1):
+        if month > drawn:
+            steps = rng.standard_normal((min(12, horizon - drawn), paths), dtype=np.float32)
+            walk[drawn:drawn + len(steps)] = np.cumsum(steps, axis=0) + (walk[drawn - 1] if drawn else 0.0)
+            drawn += len(steps)
+
+        threshold = (targets[active] - month * net_mean[active]) / net_std[active]
+        completed |= walk[month - 1] >= threshold[:, None]
+        done[active, month] = np.count_nonzero(completed, axis=1) / paths
+
+        resolved = (month >= months_available[active]) & (done[active, month] >= 0.5)
+        if resolved.any():
+            # Their share stays put from here on
+            done[active[resolved], month + 1:] = done[active[resolved], month, None]
+            active, completed = active[~resolved], completed[~resolved]
+            if active.size == 0:
+                break
+
+    # Share completed by each deadline, interpolated within its month
+    deadline = np.clip(months_available, 0, horizon)
+    whole = np.minimum(deadline.astype(int), horizon - 1)
+    rows = np.arange(goals)
+    probability = done[rows, whole] + (deadline - whole) * (done[rows, whole + 1] - done[rows, whole])
+
+    # First month by which half the paths completed, interpolated within it
+    median = np.full(goals, np.inf)
+    half = done >= 0.5
+    reached = half.any(axis=1)
+    month = half.argmax(axis=1)[reached]
+    before, after = done[reached, np.maximum(month - 1, 0)], done[reached, month]
+    median[reached] = np.where(
+        month > 0, month - 1 + (0.5 - before) / np.maximum(after - before, 1e-6), 0.0
+    )
+    return probability, median
+
+
+def net_flow_distribution(
+    user_income: float,
+    spending: SpendingAggregates,
+    monthly_net_flows: Optional[List[float]] = None,
+    min_volatility: float = 0.1,
+) -> Tuple[float, float]:
+    """
+    Estimate the mean and standard deviation of a user's monthly net flow.
+
+    Uses the observed net flows of past months when there are at least two,
+    otherwise income minus the average spending of the request's window, with
+    the month-to-month spread extrapolated from the daily spending series.
+
+    Args:
+        user_income: Monthly income
+        spending: Spending aggregates of the request's window
+        monthly_net_flows: Income minus spending of past months
+        min_volatility: Smallest standard deviation as a fraction of income,
+            since a few months of data understate how much spending varies
+
+    Returns:
+        Mean and standard deviation of the monthly net flow
+    """
+    if monthly_net_flows and len(monthly_net_flows) >= 2:
+        flows = np.asarray(monthly_net_flows, dtype=float)
+        mean, std = float(flows.mean()), float(flows.std(ddof=1))
+    else:
+        mean = user_income - spending.total_spending / SPENDING_WINDOW_MONTHS
+        daily = np.asarray(spending.daily_spend, dtype=float)
+        # Days are treated as independent, so the spread grows with the square root of the month length
+        std = float(daily.std() * np.sqrt(AVERAGE_MONTH_DAYS)) if daily.size > 1 else 0.0
+    return mean, max(std, min_volatility * abs(user_income), 1.0)
+
+
+def feasibility_results(
+    targets: np.ndarray,
+    months_remaining: np.ndarray,
+    monthly_savings: np.ndarray,
+    probability: np.ndarray,
+    completion: np.ndarray,
+    now: datetime,
+) -> List[GoalFeasibility]:
+    """
+    Package simulate_goals output, one GoalFeasibility per goal
+    """
+    results = []
+    for target, months, savings, chance, median in zip(
+        targets, months_remaining, monthly_savings, probability, completion
+    ):
+        expected_completion_date = None
+        if np.isfinite(median):
+            expected_completion_date = (now + timedelta(days=float(median) * AVERAGE_MONTH_DAYS)).date().isoformat()
+        results.append(GoalFeasibility(
+            probability=round(float(chance), 3),
+            expected_completion_date=expected_completion_date,
+            months_remaining=round(float(months), 1),
+            required_monthly_savings=round(float(target) / max(float(months), 1.0), 2),
+            expected_monthly_savings=round(float(savings), 2),
+        ))
+    return results
+
+
+def assess_goal_feasibility(
+    target_amount: float,
+    deadline: str,
+    user_income: float,
+    spending: SpendingAggregates,
+    monthly_net_flows: Optional[List[float]] = None,
+    paths: int = 1000,
+    now: Optional[datetime] = None,
+) -> GoalFeasibility:
+    """
+    Simulate whether one goal can be reached by its deadline
+
+    Args:
+        target_amount: Amount to save
+        deadline: Deadline date in ISO format
+        user_income: Monthly income
+        spending: Spending aggregates of the past months
+        monthly_net_flows: Income minus spending of past months, if known
+        paths: Trajectories to simulate
+        now: Current time, defaults to datetime.now()
+
+    Returns:
+        The feasibility probability and expected completion date
+    """
+    now = now or datetime.now()
+    targets = np.array([target_amount])
+    months_remaining = np.array([months_until(parse_deadline(deadline), now)])
+    mean, std = net_flow_distribution(user_income, spending, monthly_net_flows)
+
+    probability, completion = simulate_goals(
+        targets, np.array([mean]), np.array([std]), months_remaining, paths=paths,
+        seed=simulation_seed(target_amount, deadline, mean, std, paths)
+    )
+    return feasibility_results(targets, months_remaining, np.array([mean]), probability, completion, now)[0]
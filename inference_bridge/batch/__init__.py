@@ -0,0 +1,4 @@
+# inference_bridge/batch/__init__.py
+from .job_store import JobStore, get_job_store
+
+__all__ = ["JobStore", "get_job_store"]
@@ -0,0 +1,178 @@
+# inference_bridge/batch/job_store.py
+from typing import List, Optional
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+ITEM_PENDING = "pending"
+ITEM_RUNNING = "running"
+ITEM_DONE = "done"
+ITEM_ERROR = "error"
+
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+
+# Identifies this process as the owner of the jobs it runs
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def lease_seconds() -> float:
+    """
+    How long a worker's claim on a job lasts without renewal, from
+    BATCH_JOB_LEASE_SECONDS; after that another worker may take the job over
+    """
+    return float(os.getenv("BATCH_JOB_LEASE_SECONDS", "60"))
+
+
+class JobStore:
+    """
+    Durable record of batch jobs and their items.
+
+    Every item keeps its request payload, so a job can be picked up again from
+    the database alone after the bridge restarts. Workers sharing the database
+    claim a job with a lease before running it, so only one of them runs it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS batch_jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                concurrency INTEGER NOT NULL,
+                requests_per_minute REAL NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                owner TEXT,
+                lease_until REAL
+            );
+            CREATE TABLE IF NOT EXISTS batch_items (
+                job_id TEXT NOT NULL,
+                idx INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                result TEXT,
+                error TEXT,
+                PRIMARY KEY (job_id, idx)
+            );
+            """
+        )
+        self._add_lease_columns(conn)
+
+    @staticmethod
+    def _add_lease_columns(conn: sqlite3.Connection) -> None:
+        """
+        Add the lease columns to a job table created before them. Checked under
+        the write lock, so workers starting together do not both add them.
+        """
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(batch_jobs)")}
+            if "owner" not in columns:
+                conn.execute("ALTER TABLE batch_jobs ADD COLUMN owner TEXT")
+            if "lease_until" not in columns:
+                conn.execute("ALTER TABLE batch_jobs ADD COLUMN lease_until REAL")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def create_job(self, payloads: List[str], concurrency: int, requests_per_minute: float,
+                   owner: str = WORKER_ID) -> str:
+        """
+        Store a new job, claimed by owner, who is expected to start it right away
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute(
+                "INSERT INTO batch_jobs (job_id, status, concurrency, requests_per_minute, created_at, updated_at, "
+                "owner, lease_until) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, JOB_RUNNING, concurrency, requests_per_minute, now, now, owner, now + lease_seconds()),
+            )
+            conn.executemany(
+                "INSERT INTO batch_items (job_id, idx, payload, status) VALUES (?, ?, ?, ?)",
+                [(job_id, idx, payload, ITEM_PENDING) for idx, payload in enumerate(payloads)],
+            )
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[sqlite3.Row]:
+        return self._connection().execute(
+            "SELECT * FROM batch_jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+
+    def get_items(self, job_id: str) -> List[sqlite3.Row]:
+        return self._connection().execute(
+            "SELECT * FROM batch_items WHERE job_id = ? ORDER BY idx", (job_id,)
+        ).fetchall()
+
+    def unfinished_items(self, job_id: str) -> List[sqlite3.Row]:
+        return self._connection().execute(
+            "SELECT * FROM batch_items WHERE job_id = ? AND status IN (?, ?) ORDER BY idx",
+            (job_id, ITEM_PENDING, ITEM_RUNNING),
+        ).fetchall()
+
+    def unfinished_jobs(self) -> List[sqlite3.Row]:
+        return self._connection().execute(
+            "SELECT * FROM batch_jobs WHERE status = ?", (JOB_RUNNING,)
+        ).fetchall()
+
+    def claim_job(self, job_id: str, owner: str = WORKER_ID) -> bool:
+        """
+        Take or renew the lease on an unfinished job. Succeeds when the job has
+        no owner, is already owner's, or its owner's lease has run out; one
+        UPDATE, so two workers can never both win.
+
+        Returns:
+            Whether owner now holds the job
+        """
+        now = time.time()
+        cursor = self._connection().execute(
+            "UPDATE batch_jobs SET owner = ?, lease_until = ?, updated_at = ? "
+            "WHERE job_id = ? AND status = ? AND (owner IS NULL OR owner = ? OR lease_until < ?)",
+            (owner, now + lease_seconds(), now, job_id, JOB_RUNNING, owner, now),
+        )
+        return cursor.rowcount == 1
+
+    def mark_item(self, job_id: str, idx: int, status: str, result: Optional[dict] = None,
+                  error: Optional[str] = None) -> None:
+        self._connection().execute(
+            "UPDATE batch_items SET status = ?, "
+            "attempts = attempts + CASE WHEN ? = 'running' THEN 1 ELSE 0 END, "
+            "result = ?, error = ? WHERE job_id = ? AND idx = ?",
+            (status, status, json.dumps(result) if result is not None else None, error, job_id, idx),
+        )
+
+    def finish_job(self, job_id: str) -> None:
+        self._connection().execute(
+            "UPDATE batch_jobs SET status = ?, updated_at = ?, owner = NULL, lease_until = NULL WHERE job_id = ?",
+            (JOB_COMPLETED, time.time(), job_id),
+        )
+
+
+_job_store: Optional[JobStore] = None
+
+
+def get_job_store() -> JobStore:
+    """
+    Return the process-wide job store at BATCH_JOB_DB
+    """
+    global _job_store
+    if _job_store is None:
+        _job_store = JobStore(os.getenv("BATCH_JOB_DB", "./batch_jobs.db"))
+    return _job_store
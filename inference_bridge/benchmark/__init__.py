@@ -0,0 +1 @@
+# inference_bridge/benchmark/__init__.py
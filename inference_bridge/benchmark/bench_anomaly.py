@@ -0,0 +1,92 @@
+# inference_bridge/benchmark/bench_anomaly.py
+"""
+Throughput of spending-anomaly scoring: the vectorized batch path
+(flag_anomalies over a users x months x categories array) against scoring
+users one at a time through find_spending_anomalies. Also checks that
+/monthly_summary answers a history whose totals do not match its months and
+categories with 422, rather than scoring a broadcast copy of it.
+
+Run from the repository root:
+    python -m inference_bridge.benchmark.bench_anomaly --users 1000 10000 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from inference_bridge.analytics.anomaly import find_spending_anomalies, flag_anomalies
+from inference_bridge.data.request.category_history import CategoryHistory
+
+
+def synthetic_users(users: int, months: int, categories: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    typical = rng.lognormal(4.5, 1.0, size=(users, 1, categories))
+    history = typical * rng.lognormal(0, 0.25, size=(users, months, categories))
+    current = typical[:, 0, :] * rng.lognormal(0, 0.25, size=(users, categories))
+    # One user in ten overspends in one category
+    spikes = rng.random(users) < 0.1
+    current[spikes, rng.integers(0, categories, spikes.sum())] *= 4
+    # A quarter of the users have only part of the history
+    short = rng.random(users) < 0.25
+    history[short, : months // 2, :] = np.nan
+    return current, history
+
+
+def check_malformed_history() -> None:
+    from fastapi.testclient import TestClient
+    from inference_bridge.main import app
+
+    request = {"user_id": 1, "month": 6, "year": 2025, "income": 4000, "transactions": []}
+    history = {"categories": ["Rent", "Food"], "months": ["2025-03", "2025-04", "2025-05"]}
+    malformed = {
+        "one row for three months": [[1500, 300]],
+        "one value per row for two categories": [[1500], [1500], [1500]],
+        "rows of uneven length": [[1500, 300], [1500], [1500, 300, 20]],
+    }
+    client = TestClient(app)
+    for label, totals in malformed.items():
+        response = client.post("/monthly_summary", json={**request, "history": {**history, "totals": totals}})
+        assert response.status_code == 422, f"{label}: {response.status_code}"
+        print(f"malformed history, {label}: {response.status_code}")
+    CategoryHistory(**history, totals=[[1500, 300], [1500, 320], [1500, 280]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--months", type=int, default=6)
+    parser.add_argument("--categories", type=int, default=12)
+    parser.add_argument("--single-user-sample", type=int, default=2000)
+    args = parser.parse_args()
+
+    names = [f"category_{i}" for i in range(args.categories)]
+    print(f"{'users':>8} {'batch ms':>9} {'users/s':>12} {'flagged':>8}")
+    for users in args.users:
+        current, history = synthetic_users(users, args.months, args.categories)
+        started = time.perf_counter()
+        flags, _, _ = flag_anomalies(current, history)
+        elapsed = time.perf_counter() - started
+        print(f"{users:>8} {elapsed * 1000:9.1f} {users / elapsed:12,.0f} {int(flags.any(axis=1).sum()):>8}")
+
+    # The per-request path used by /monthly_summary, for comparison
+    sample = min(args.single_user_sample, max(args.users))
+    current, history = synthetic_users(sample, args.months, args.categories)
+    requests = [
+        (dict(zip(names, current[u])), CategoryHistory(
+            categories=names,
+            months=[f"2025-{m + 1:02d}" for m in range(args.months)],
+            totals=np.nan_to_num(history[u]).tolist(),
+        ))
+        for u in range(sample)
+    ]
+    started = time.perf_counter()
+    for totals, past in requests:
+        find_spending_anomalies(totals, past)
+    elapsed = time.perf_counter() - started
+    print(f"single-user path: {sample / elapsed:,.0f} users/s ({elapsed / sample * 1e6:.0f} us per request)")
+
+    check_malformed_history()
+
+
+if __name__ == "__main__":
+    main()
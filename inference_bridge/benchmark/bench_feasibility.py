@@ -0,0 +1,86 @@
+# inference_bridge/benchmark/bench_feasibility.py
+"""
+Speed of the goal-feasibility Monte Carlo simulation (simulate_goals) for
+batches of goals, and its agreement with the closed form where one exists:
+with normal monthly flows the balance after the deadline's whole months is
+normal, which bounds the first-passage probability from below. Also checks
+that the same goal on the same finances always gets the same estimate.
+
+Run from the repository root:
+    python -m inference_bridge.benchmark.bench_feasibility --goals 1 100 300 1000
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from inference_bridge.analytics.allocation import plan_goal_allocations
+from inference_bridge.analytics.feasibility import assess_goal_feasibility, simulate_goals
+from inference_bridge.data.request.multi_goal_request import GoalSpec
+from inference_bridge.data.request.spending_aggregates import SpendingAggregates
+
+
+def synthetic_goals(goals: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    targets = rng.uniform(500, 20000, goals)
+    net_mean = rng.normal(800, 400, goals)
+    net_std = rng.uniform(50, 300, goals)
+    months_available = rng.uniform(1, 36, goals)
+    return targets, net_mean, net_std, months_available
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--goals", type=int, nargs="+", default=[1, 100, 300, 1000])
+    parser.add_argument("--paths", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'goals':>6} {'ms':>8} {'goals/s':>10}")
+    for goals in args.goals:
+        inputs = synthetic_goals(goals)
+        simulate_goals(*inputs, paths=args.paths)
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            simulate_goals(*inputs, paths=args.paths)
+        elapsed = (time.perf_counter() - started) / args.repeat
+        print(f"{goals:>6} {elapsed * 1000:8.1f} {goals / elapsed:10,.0f}")
+
+    # Whole-month deadlines, where the balance at the deadline is N(k * mean, k * std^2)
+    targets, net_mean, net_std, _ = synthetic_goals(200, seed=1)
+    months = np.random.default_rng(2).integers(1, 36, 200).astype(float)
+    probability, _ = simulate_goals(targets, net_mean, net_std, months, paths=args.paths, seed=3)
+    at_deadline = np.array([
+        0.5 * math.erfc((t - k * m) / (s * math.sqrt(k)) / math.sqrt(2))
+        for t, m, s, k in zip(targets, net_mean, net_std, months)
+    ])
+    print(
+        f"simulated minus balance-at-deadline probability: mean {np.mean(probability - at_deadline):+.3f}, "
+        f"min {np.min(probability - at_deadline):+.3f}"
+    )
+
+    # Repeated requests for the same goal must agree, their prompts and plans depend on it
+    spending = SpendingAggregates(categories=["Food"], category_totals=[7000.0], daily_spend=list(np.random.default_rng(4).gamma(2, 60, 60)))
+    estimates = {
+        assess_goal_feasibility(9000.0, "2028-01-01T00:00:00", 4200.0, spending, paths=args.paths).probability
+        for _ in range(5)
+    }
+    assert len(estimates) == 1, f"the same goal got different probabilities: {sorted(estimates)}"
+    print(f"repeated single-goal estimate: {estimates.pop():.3f}")
+
+    goals = [
+        GoalSpec(goal_id=i + 1, goal_description=f"Goal {i + 1}", target_amount=3000.0 * (i + 1),
+                 deadline=f"{2027 + i}-06-01T00:00:00", priority=5 - i)
+        for i in range(4)
+    ]
+    plans = {
+        tuple(f.probability for f in plan_goal_allocations(goals, 4200.0, spending, paths=args.paths)[0])
+        for _ in range(5)
+    }
+    assert len(plans) == 1, f"the same goals got different probabilities: {sorted(plans)}"
+    print(f"repeated multi-goal estimates: {', '.join(f'{p:.3f}' for p in plans.pop())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# inference_bridge/benchmark/bench_prompt_budget.py
+"""
+Prompt size against input size: builds goal-planning, multi-goal planning
+and monthly-summary prompts the way their processors do, from 0 up to 50k
+transactions over many categories with long descriptions and 60 goals, and checks that every prompt stays within
+its token budget; fails with an AssertionError if one does not. Budgets
+have to leave room for the fixed instructions, about 600 tokens for goal
+planning, which no input changes.
+
+Run from the repository root:
+    python -m inference_bridge.benchmark.bench_prompt_budget --budgets 800 1200 4000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from inference_bridge.analytics.allocation import plan_goal_allocations
+from inference_bridge.analytics.feasibility import assess_goal_feasibility
+from inference_bridge.data.request import GoalPlanningRequest, MultiGoalPlanningRequest, SummaryRequest
+from inference_bridge.processors.summary_processor import SummaryProcessor
+from inference_bridge.prompt_builder.prompt_builder import PromptBuilder
+
+
+def synthetic_transactions(count: int, categories: int, seed: int = 0):
+    rng = random.Random(seed)
+    names = [f"Category {i} with a fairly long and descriptive name" for i in range(categories)]
+    start = datetime(2025, 11, 1)
+    return [
+        {
+            "amount": round(rng.lognormvariate(3, 1), 2),
+            "category": rng.choice(names),
+            "description": f"Purchase {i} at a merchant whose name goes on and on " * rng.randint(1, 4),
+            "date": (start + timedelta(minutes=rng.randrange(60 * 24 * 60))).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def goal_planning_prompt(transactions, max_tokens: int) -> str:
+    request = GoalPlanningRequest(
+        goal_id=1,
+        goal_description="Save for a house deposit " * 20,
+        target_amount=40000,
+        deadline="2028-01-01T00:00:00",
+        user_income=5000,
+        transactions=transactions,
+        priority=3,
+    )
+    spending = request.spending
+    feasibility = assess_goal_feasibility(
+        target_amount=request.target_amount,
+        deadline=request.deadline,
+        user_income=request.user_income,
+        spending=spending,
+        monthly_net_flows=request.monthly_net_flows
+    )
+    return PromptBuilder.build_goal_planning_prompt(
+        goal_description=request.goal_description,
+        target_amount=request.target_amount,
+        deadline=request.deadline,
+        user_income=request.user_income,
+        transactions=spending.top_transactions,
+        priority=request.priority,
+        category_totals=spending.totals_by_category(),
+        category_counts=spending.counts_by_category(),
+        transaction_count=spending.transaction_count,
+        feasibility=feasibility,
+        max_tokens=max_tokens
+    )
+
+
+def multi_goal_planning_prompt(transactions, max_tokens: int, goals: int = 60) -> str:
+    request = MultiGoalPlanningRequest(
+        goals=[
+            {
+                "goal_id": i + 1,
+                "goal_description": f"Goal {i + 1}, saving up for something important " * 5,
+                "target_amount": 1000 + 500 * i,
+                "deadline": f"{2026 + i % 4}-06-01T00:00:00",
+                "priority": i % 5 + 1,
+            }
+            for i in range(goals)
+        ],
+        user_income=5000,
+        transactions=transactions,
+    )
+    spending = request.spending
+    feasibilities, unallocated_savings = plan_goal_allocations(
+        goals=request.goals,
+        user_income=request.user_income,
+        spending=spending,
+        monthly_net_flows=request.monthly_net_flows
+    )
+    prompt, _ = PromptBuilder.build_multi_goal_planning_prompt(
+        goals=request.goals,
+        feasibilities=feasibilities,
+        user_income=request.user_income,
+        transactions=spending.top_transactions,
+        category_totals=spending.totals_by_category(),
+        category_counts=spending.counts_by_category(),
+        transaction_count=spending.transaction_count,
+        unallocated_savings=unallocated_savings,
+        max_tokens=max_tokens
+    )
+    return prompt
+
+
+def monthly_summary_prompt(transactions, max_tokens: int) -> str:
+    request = SummaryRequest(user_id=1, month=12, year=2025, income=5000, transactions=transactions)
+    top_categories, total_spending, budget_status, anomalies = SummaryProcessor.aggregate(request)
+    return PromptBuilder.build_monthly_summary_prompt(
+        month=request.month,
+        year=request.year,
+        income=request.income,
+        total_spending=total_spending,
+        budget_status=budget_status,
+        category_totals=top_categories,
+        transactions=request.spending.top_transactions,
+        transaction_count=request.spending.transaction_count,
+        anomalies=anomalies,
+        max_tokens=max_tokens
+    )
+
+
+BUILDERS = {
+    "goal_planning": goal_planning_prompt,
+    "multi_goal": multi_goal_planning_prompt,
+    "monthly_summary": monthly_summary_prompt,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, nargs="+", default=[0, 1, 10, 1000, 50000])
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--budgets", type=int, nargs="+", default=[800, 1200, 4000])
+    args = parser.parse_args()
+
+    over = 0
+    print(f"{'prompt':<16} {'transactions':>12} {'budget':>7} {'tokens':>7} {'build ms':>9}")
+    for count in args.transactions:
+        transactions = synthetic_transactions(count, args.categories)
+        for name, build in BUILDERS.items():
+            for budget in args.budgets:
+                started = time.perf_counter()
+                prompt = build(transactions, budget)
+                elapsed = time.perf_counter() - started
+                tokens = PromptBuilder.count_tokens(prompt)
+                flag = "" if tokens <= budget else "  OVER BUDGET"
+                over += tokens > budget
+                print(f"{name:<16} {count:>12,} {budget:>7} {tokens:>7} {elapsed * 1000:9.1f}{flag}")
+    assert not over, f"{over} prompts exceeded their token budget"
+    print("every prompt within its budget")
+
+
+if __name__ == "__main__":
+    main()
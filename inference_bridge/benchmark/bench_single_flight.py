@@ -0,0 +1,116 @@
+# inference_bridge/benchmark/bench_single_flight.py
+"""
+Upstream call count under a burst of identical requests: fires N concurrent
+generate_text calls with the same prompt through CachedClient, cancels the
+first caller (the one that started the upstream call) while it is in flight,
+and counts the upstream calls the LocalProvider saw. A burst of distinct
+prompts is run for comparison. Fails with an AssertionError if a burst of
+identical requests makes more than one upstream call, or if cancelling the
+first caller cancels the call for the rest. Finally checks that an interactive
+caller joining a queued bulk call moves it ahead of the bulk calls queued
+before it.
+
+Run from the repository root:
+    python -m inference_bridge.benchmark.bench_single_flight --burst 50 --rounds 5
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from inference_bridge.client.cached_client import CachedClient
+from inference_bridge.client.local_provider import LocalProvider
+from inference_bridge.client.providers import set_provider
+from inference_bridge.data.response.goal_response import GoalGenResponse
+from inference_bridge.utils.admission import AdmissionController, Priority
+from inference_bridge.utils.single_flight import SingleFlight
+
+
+async def burst(client: CachedClient, prompts, cancel_after: float):
+    """
+    Fire one call per prompt at once and cancel the first while it waits
+
+    Returns:
+        Calls that returned a response, calls that were cancelled, wall time in ms
+    """
+    started = time.perf_counter()
+    tasks = [asyncio.ensure_future(client.generate_text(prompt, GoalGenResponse)) for prompt in prompts]
+    await asyncio.sleep(cancel_after)
+    tasks[0].cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = (time.perf_counter() - started) * 1000
+    answered = sum(isinstance(result, str) for result in results)
+    cancelled = sum(isinstance(result, asyncio.CancelledError) for result in results)
+    return answered, cancelled, elapsed
+
+
+async def joined_priority() -> None:
+    """
+    Queue two bulk calls behind a busy slot, join the second from an
+    interactive caller and check that it is served first
+    """
+    client = CachedClient(flights=SingleFlight(), admission=AdmissionController(max_concurrency=1))
+    finished = []
+
+    async def call(prompt: str, priority: Priority, label: str):
+        await client.generate_text(prompt, GoalGenResponse, priority=priority)
+        finished.append(label)
+
+    tasks = []
+    for prompt, priority, label in [
+        ("Busy slot", Priority.BULK, "busy"),
+        ("Bulk queued first", Priority.BULK, "bulk first"),
+        ("Bulk queued second", Priority.BULK, "bulk second"),
+        ("Bulk queued second", Priority.INTERACTIVE, "interactive joining bulk second"),
+    ]:
+        tasks.append(asyncio.ensure_future(call(prompt, priority, label)))
+        await asyncio.sleep(0.01)
+    await asyncio.gather(*tasks)
+    print(f"served in order: {', '.join(finished)}")
+    assert finished.index("bulk second") < finished.index("bulk first"), \
+        "an interactive caller waited behind the queue position of the bulk call it joined"
+
+
+async def run(args) -> None:
+    provider = LocalProvider(latency_ms=args.latency_ms, latency_spread=0.0, latency_distribution="fixed")
+    set_provider(provider)
+    flights = SingleFlight()
+    client = CachedClient(flights=flights)
+    cancel_after = args.latency_ms / 1000 / 4
+
+    print(f"{'burst':<10} {'round':>5} {'callers':>8} {'answered':>9} {'cancelled':>10} "
+          f"{'upstream':>9} {'coalesced':>10} {'wall ms':>8}")
+    for kind in ("identical", "distinct"):
+        for round_number in range(args.rounds):
+            if kind == "identical":
+                prompts = [f"Plan for goal {round_number}"] * args.burst
+            else:
+                prompts = [f"Plan for goal {round_number}, caller {i}" for i in range(args.burst)]
+            calls_before = provider.calls
+            flights_before = flights.stats()
+            answered, cancelled, elapsed = await burst(client, prompts, cancel_after)
+            upstream = provider.calls - calls_before
+            coalesced = flights.stats()["coalesced_calls"] - flights_before["coalesced_calls"]
+            print(f"{kind:<10} {round_number:>5} {args.burst:>8} {answered:>9} {cancelled:>10} "
+                  f"{upstream:>9} {coalesced:>10} {elapsed:8.1f}")
+            if kind == "identical":
+                assert upstream == 1, f"{upstream} upstream calls for one burst of identical requests"
+                assert answered == args.burst - 1, "cancelling the first caller cancelled the shared call"
+    print(f"in flight after the bursts: {flights.stats()['in_flight']}")
+    await joined_priority()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--burst", type=int, default=50, help="Concurrent callers per burst")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Latency of every upstream call")
+    args = parser.parse_args()
+
+    # Responses must come from the upstream call, not from the cache of an earlier round
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+# inference_bridge/benchmark/replay.py
+"""
+Replay recorded bridge traffic against the bridge running in-process, with a
+stub upstream that answers every call after the latency recorded for it.
+
+Record traffic by starting the bridge with REQUEST_RECORD_PATH set (see
+utils/request_recorder.py), or pass --synthetic N to generate a recording.
+Requests are sent open loop with Poisson arrivals at --rate per second, at
+the recorded timing sped up by --speed, or closed loop by --concurrency
+clients back to back. Open-loop latency counts from the scheduled arrival, so
+time spent waiting for a free client counts too.
+
+Reports throughput, latency percentiles per endpoint next to the recorded
+ones, event-loop lag and upstream call counts. Bridge settings come from the
+environment as usual (BRIDGE_MAX_CONCURRENCY, RESPONSE_CACHE_ENABLED, ...),
+the response cache and batch job database default to a temporary directory.
+
+Run from the repository root:
+    python -m inference_bridge.benchmark.replay --recording requests.jsonl --rate 50 --requests 2000
+    python -m inference_bridge.benchmark.replay --synthetic 500 --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from inference_bridge.client.local_provider import LocalProvider
+
+# Upstream latency in seconds recorded for the request being replayed
+replay_latency: ContextVar[Optional[float]] = ContextVar("replay_latency", default=None)
+
+
+class ReplayProvider(LocalProvider):
+    """
+    LocalProvider whose calls take the upstream latency recorded for the
+    request being replayed. Calls without one (the request was served from the
+    cache or coalesced when recorded) draw from the recorded latencies.
+    """
+
+    def __init__(self, latencies: List[float], completion_tokens: int = 60, seed: Optional[int] = 0):
+        super().__init__(completion_tokens=completion_tokens, seed=seed, model="replay-stub")
+        self.latencies = latencies
+
+    def sample_latency(self) -> float:
+        recorded = replay_latency.get()
+        if recorded is not None:
+            return recorded
+        if self.latencies:
+            return self.rng.choice(self.latencies)
+        return super().sample_latency()
+
+
+def load_recording(path: str) -> List[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def synthetic_recording(requests: int, seed: int = 0) -> List[dict]:
+    """
+    A recording-shaped mix of goal planning and monthly summary requests,
+    with lognormal upstream latencies around 800 ms
+    """
+    rng = random.Random(seed)
+    categories = ["Groceries", "Rent", "Transport", "Dining", "Utilities", "Entertainment", "Health"]
+    records, offset = [], 0.0
+    for _ in range(requests):
+        offset += rng.expovariate(10)
+        aggregates = {
+            "categories": categories,
+            "category_totals": [round(rng.uniform(20, 900), 2) for _ in categories],
+            "category_counts": [rng.randint(1, 20) for _ in categories],
+            "start_date": "2026-08-01",
+            "daily_spend": [round(rng.uniform(0, 120), 2) for _ in range(61)],
+        }
+        income = round(rng.uniform(2500, 6000), 2)
+        if rng.random() < 0.5:
+            path = "/goal_planning"
+            body = {
+                "goal_id": 1,
+                "goal_description": "Savings goal",
+                "target_amount": round(rng.uniform(500, 30000), -1),
+                "deadline": f"{rng.randint(2027, 2029)}-0{rng.randint(1, 9)}-01",
+                "user_income": income,
+                "aggregates": aggregates,
+            }
+        else:
+            path = "/monthly_summary"
+            aggregates["daily_spend"] = aggregates["daily_spend"][:30]
+            body = {"user_id": 1, "month": 9, "year": 2026, "income": income, "aggregates": aggregates}
+        records.append({
+            "offset_s": round(offset, 3),
+            "path": path,
+            "headers": {},
+            "body": body,
+            "status": 200,
+            "upstream_ms": round(800 * rng.lognormvariate(0, 0.5), 2),
+            "completion_tokens": 60,
+        })
+    return records
+
+
+def arrival_times(records: List[dict], requests: int, rate: float, speed: float, seed: int) -> Optional[List[float]]:
+    """
+    Seconds after the start at which each request is sent, None for closed loop
+    """
+    if rate > 0:
+        rng = random.Random(seed)
+        times, now = [], 0.0
+        for _ in range(requests):
+            now += rng.expovariate(rate)
+            times.append(now)
+        return times
+    if speed > 0:
+        offsets = [record.get("offset_s", 0.0) for record in records]
+        first, span = offsets[0], max(offsets[-1] - offsets[0], 0.0) + 0.1
+        # Past the end of the recording it starts over
+        return [
+            ((offsets[i % len(records)] - first) + (i // len(records)) * span) / speed
+            for i in range(requests)
+        ]
+    return None
+
+
+async def monitor_loop_lag(lags: List[float], interval: float = 0.005) -> None:
+    """
+    Record how late the event loop wakes up a task sleeping for interval
+    """
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def replay(app, records: List[dict], requests: int, concurrency: int, arrivals: Optional[List[float]]) -> dict:
+    import httpx
+
+    slots = asyncio.Semaphore(concurrency)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Counter = Counter()
+    lags: List[float] = []
+
+    async def send(client, record: dict, scheduled: Optional[float]) -> None:
+        async with slots:
+            started = scheduled if scheduled is not None else time.perf_counter()
+            upstream_ms = record.get("upstream_ms")
+            # Read by ReplayProvider, the request runs in this task's context
+            replay_latency.set(upstream_ms / 1000 if upstream_ms is not None else None)
+            try:
+                response = await client.post(record["path"], json=record["body"], headers=record.get("headers") or {})
+                status = response.status_code
+            except Exception as e:
+                status = type(e).__name__
+            latencies[record["path"]].append(time.perf_counter() - started)
+            statuses[status] += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bridge", timeout=None) as client:
+        monitor = asyncio.create_task(monitor_loop_lag(lags))
+        started = time.perf_counter()
+        tasks = []
+        for i in range(requests):
+            record = records[i % len(records)]
+            scheduled = None
+            if arrivals is not None:
+                scheduled = started + arrivals[i]
+                await asyncio.sleep(max(scheduled - time.perf_counter(), 0))
+            tasks.append(asyncio.create_task(send(client, record, scheduled)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+        monitor.cancel()
+
+    return {"elapsed": elapsed, "latencies": latencies, "statuses": statuses, "lags": lags}
+
+
+def percentiles(values_ms: List[float]) -> dict:
+    values = np.asarray(values_ms, dtype=float)
+    if values.size == 0:
+        return {}
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {"count": int(values.size), "p50": round(p50, 1), "p90": round(p90, 1), "p99": round(p99, 1), "max": round(values.max(), 1)}
+
+
+def summarize(outcome: dict, records: List[dict], provider: ReplayProvider, flights: dict, target_rate: float) -> dict:
+    requests = sum(outcome["statuses"].values())
+    recorded = defaultdict(list)
+    for record in records:
+        if record.get("duration_ms") is not None:
+            recorded[record["path"]].append(record["duration_ms"])
+
+    endpoints = {}
+    for path, seconds in sorted(outcome["latencies"].items()):
+        endpoints[path] = {"replayed": percentiles([s * 1000 for s in seconds]), "recorded": percentiles(recorded[path])}
+    all_ms = [s * 1000 for seconds in outcome["latencies"].values() for s in seconds]
+    endpoints["all"] = {"replayed": percentiles(all_ms), "recorded": percentiles([ms for v in recorded.values() for ms in v])}
+
+    calls = provider.stats()
+    return {
+        "requests": requests,
+        "elapsed_s": round(outcome["elapsed"], 2),
+        "throughput_rps": round(requests / outcome["elapsed"], 1),
+        "target_rps": target_rate or None,
+        "statuses": {str(status): count for status, count in sorted(outcome["statuses"].items(), key=str)},
+        "latency_ms": endpoints,
+        "loop_lag_ms": percentiles([lag * 1000 for lag in outcome["lags"]]),
+        "upstream": {
+            "calls": calls["calls"],
+            "calls_per_request": round(calls["calls"] / max(requests, 1), 3),
+            "errors": calls["errors"],
+            "prompt_tokens": calls["prompt_tokens"],
+            "completion_tokens": calls["completion_tokens"],
+            "coalesced": flights.get("coalesced_calls", 0),
+        },
+    }
+
+
+def print_report(report: dict) -> None:
+    target = f" (target {report['target_rps']} req/s)" if report["target_rps"] else ""
+    print(f"{report['requests']} requests in {report['elapsed_s']} s: {report['throughput_rps']} req/s{target}")
+    print("status: " + ", ".join(f"{status} x{count}" for status, count in report["statuses"].items()))
+    print(f"{'latency ms':<26} {'':>9} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for path, rows in report["latency_ms"].items():
+        for kind in ("replayed", "recorded"):
+            row = rows[kind]
+            if row:
+                print(f"{path:<26} {kind:>9} {row['p50']:8.1f} {row['p90']:8.1f} {row['p99']:8.1f} {row['max']:8.1f}")
+    lag = report["loop_lag_ms"]
+    print(f"event loop lag ms: p50 {lag['p50']:.2f}, p99 {lag['p99']:.2f}, max {lag['max']:.2f}")
+    upstream = report["upstream"]
+    print(
+        f"upstream: {upstream['calls']} calls ({upstream['calls_per_request']} per request), "
+        f"{upstream['errors']} errors, {upstream['coalesced']} coalesced, "
+        f"{upstream['prompt_tokens']} prompt / {upstream['completion_tokens']} completion tokens"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--recording", help="JSON lines file written by the request recorder")
+    source.add_argument("--synthetic", type=int, metavar="N", help="Replay N generated requests instead")
+    parser.add_argument("--requests", type=int, help="Requests to send, cycling through the recording (default: all of it once)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Open loop, Poisson arrivals per second")
+    parser.add_argument("--speed", type=float, default=0.0, help="Open loop at the recorded timing, sped up by this factor")
+    parser.add_argument("--concurrency", type=int, default=64, help="Requests in flight at most")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Also write the report as JSON to this file")
+    args = parser.parse_args()
+
+    records = load_recording(args.recording) if args.recording else synthetic_recording(args.synthetic, args.seed)
+    if not records:
+        parser.error("the recording is empty")
+    requests = args.requests or len(records)
+
+    # Keep the benchmark away from the bridge's own databases and logs
+    scratch = tempfile.mkdtemp(prefix="bridge-replay-")
+    os.environ.setdefault("RESPONSE_CACHE_PATH", os.path.join(scratch, "cache.db"))
+    os.environ.setdefault("BATCH_JOB_DB", os.path.join(scratch, "batch_jobs.db"))
+    os.environ.setdefault("ACCESS_LOG_ENABLED", "false")
+    os.environ.pop("REQUEST_RECORD_PATH", None)
+
+    from inference_bridge.client.cached_client import upstream_flights
+    from inference_bridge.client.providers import set_provider
+    from inference_bridge.main import app
+
+    # Per-request info logs would dominate the output
+    logging.getLogger().setLevel(logging.WARNING)
+
+    latencies = [r["upstream_ms"] / 1000 for r in records if r.get("upstream_ms") is not None]
+    tokens = [r["completion_tokens"] for r in records if r.get("completion_tokens")]
+    provider = ReplayProvider(latencies, completion_tokens=int(np.median(tokens)) if tokens else 60, seed=args.seed)
+    set_provider(provider)
+
+    arrivals = arrival_times(records, requests, args.rate, args.speed, args.seed)
+    outcome = asyncio.run(replay(app, records, requests, args.concurrency, arrivals))
+    report = summarize(outcome, records, provider, upstream_flights.stats(), args.rate)
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
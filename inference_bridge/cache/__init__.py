@@ -0,0 +1,4 @@
+# inference_bridge/cache/__init__.py
+from .response_cache import ResponseCache, get_response_cache
+
+__all__ = ["ResponseCache", "get_response_cache"]
@@ -0,0 +1,276 @@
+# inference_bridge/cache/response_cache.py
+from collections import OrderedDict
+from typing import Optional, Type
+from pydantic import BaseModel
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryLRU:
+    """
+    Thread-safe in-memory LRU with per-entry expiry
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteStore:
+    """
+    Disk tier backed by a SQLite file, shared by every worker process on the host
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes_since_evict = 0
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_access "
+            "ON llm_response_cache (last_access)"
+        )
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str):
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, expires_at FROM llm_response_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at <= now:
+            conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+            return None
+        conn.execute(
+            "UPDATE llm_response_cache SET last_access = ? WHERE key = ?", (now, key)
+        )
+        return value, expires_at
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_response_cache (key, value, expires_at, last_access) "
+            "VALUES (?, ?, ?, ?)",
+            (key, value, expires_at, time.time()),
+        )
+        # Evicting on every write would turn each insert into a table scan
+        self._writes_since_evict += 1
+        if self._writes_since_evict >= 50:
+            self._writes_since_evict = 0
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop expired rows, then the least recently used rows above max_entries
+
+        Returns:
+            Number of rows removed
+        """
+        conn = self._connection()
+        removed = conn.execute(
+            "DELETE FROM llm_response_cache WHERE expires_at <= ?", (time.time(),)
+        ).rowcount
+        removed += conn.execute(
+            """
+            DELETE FROM llm_response_cache WHERE key IN (
+                SELECT key FROM llm_response_cache
+                ORDER BY last_access DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        ).rowcount
+        return removed
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM llm_response_cache")
+
+
+class ResponseCache:
+    """
+    Two-tier cache for structured LLM responses.
+
+    Entries are keyed on a hash of the model, the prompt and the JSON schema of the
+    response format, so any change to one of them produces a fresh upstream call.
+    Lookups go to the in-memory LRU first and fall back to the SQLite tier, which
+    is shared by all worker processes pointing at the same file.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 86400,
+        memory_entries: int = 1024,
+        disk_path: Optional[str] = None,
+        disk_entries: int = 10000,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.memory = MemoryLRU(memory_entries)
+        self.disk = SqliteStore(disk_path, disk_entries) if disk_path else None
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.stores = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str, response_format: Optional[Type[BaseModel]]) -> str:
+        """
+        Build the cache key for an upstream call
+
+        Args:
+            model: The model name the prompt is sent to
+            prompt: The fully rendered prompt
+            response_format: The pydantic model used as structured output schema,
+                None for plain-text (streamed) completions
+
+        Returns:
+            Hex digest identifying the call
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "prompt": prompt,
+                "schema": response_format.model_json_schema() if response_format else None,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is not None:
+            self.hits += 1
+            self.memory_hits += 1
+            return value
+
+        if self.disk is not None:
+            try:
+                row = self.disk.get(key)
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache disk read failed: {e}")
+                row = None
+            if row is not None:
+                value, expires_at = row
+                # Promote into the memory tier for the next lookup
+                self.memory.set(key, value, expires_at)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        self.memory.set(key, value, expires_at)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value, expires_at)
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache disk write failed: {e}")
+        self.stores += 1
+
+    def record_bypass(self) -> None:
+        self.bypasses += 1
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "stores": self.stores,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory),
+        }
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Return the process-wide response cache configured from environment variables,
+    or None when caching is disabled with RESPONSE_CACHE_ENABLED=false
+    """
+    global _response_cache
+    if os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() != "true":
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "86400")),
+            memory_entries=int(os.getenv("RESPONSE_CACHE_MEMORY_ENTRIES", "1024")),
+            disk_path=os.getenv("RESPONSE_CACHE_PATH", "./inference_cache.db") or None,
+            disk_entries=int(os.getenv("RESPONSE_CACHE_DISK_ENTRIES", "10000")),
+        )
+        logger.info(f"Response cache initialized (disk: {_response_cache.disk is not None})")
+    return _response_cache
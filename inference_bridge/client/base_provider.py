@@ -0,0 +1,41 @@
+# inference_bridge/client/base_provider.py
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional, Type
+from pydantic import BaseModel
+
+
+class InferenceProvider(ABC):
+    """
+    Interface every LLM backend of the bridge implements
+    """
+
+    model: str
+
+    @abstractmethod
+    async def generate(
+        self, prompt: str, response_format: Type[BaseModel], deadline: Optional[float] = None
+    ) -> str:
+        """
+        Generate a structured response
+
+        Args:
+            prompt: The prompt to send to the model
+            response_format: The pydantic model used as structured output schema
+            deadline: time.monotonic() value the call has to finish by, None for no limit
+
+        Returns:
+            The generated JSON text
+        """
+
+    @abstractmethod
+    def stream_text(self, prompt: str, deadline: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Stream a plain-text completion
+
+        Args:
+            prompt: The prompt to send to the model
+            deadline: time.monotonic() value the stream has to start by, None for no limit
+
+        Yields:
+            Text deltas in generation order
+        """
@@ -0,0 +1,171 @@
+# inference_bridge/client/cached_client.py
+from typing import AsyncIterator, Optional, Type
+from pydantic import BaseModel, ValidationError
+import asyncio
+import logging
+
+from inference_bridge.cache.response_cache import ResponseCache, get_response_cache
+from inference_bridge.client.base_provider import InferenceProvider
+from inference_bridge.client.providers import get_provider
+from inference_bridge.exception.inference_exception import DeadlineExceededException
+from inference_bridge.utils.admission import AdmissionController, AdmissionTicket, Priority, get_admission_controller
+from inference_bridge.utils.deadline import remaining
+from inference_bridge.utils.single_flight import SingleFlight
+from inference_bridge.utils.telemetry import annotate, span
+
+logger = logging.getLogger(__name__)
+
+# Shared by every processor instance so identical concurrent requests coalesce
+upstream_flights = SingleFlight()
+
+
+class CachedClient:
+    """
+    Sits between the processors and the inference provider, serves repeated prompts from
+    the response cache, coalesces identical in-flight upstream calls and admits
+    the remaining ones through the admission controller
+    """
+
+    def __init__(
+        self,
+        client: Optional[InferenceProvider] = None,
+        cache: Optional[ResponseCache] = None,
+        flights: Optional[SingleFlight] = None,
+        admission: Optional[AdmissionController] = None,
+    ):
+        self.client = client or get_provider()
+        self.cache = cache if cache is not None else get_response_cache()
+        self.flights = flights if flights is not None else upstream_flights
+        self.admission = admission if admission is not None else get_admission_controller()
+
+    @property
+    def model(self) -> str:
+        return self.client.model
+
+    async def generate_text(
+        self,
+        prompt: str,
+        response_format: Type[BaseModel],
+        bypass_cache: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> str:
+        """
+        Generate a structured response, consulting the cache first
+
+        Args:
+            prompt: The prompt to send to the API
+            response_format: The pydantic model used as structured output schema
+            bypass_cache: Skip the cache lookup and refresh the entry with a new response
+            priority: Scheduling class used if the call has to wait for an upstream slot
+            deadline: time.monotonic() value to answer by, bounds the queue wait and the upstream call
+
+        Returns:
+            The generated JSON text
+        """
+        key = ResponseCache.make_key(self.model, prompt, response_format)
+
+        if self.cache is not None:
+            if bypass_cache:
+                self.cache.record_bypass()
+                annotate(cache="bypass")
+            else:
+                with span("cache_lookup"):
+                    cached = self.cache.get(key)
+                if cached is not None:
+                    logger.info(f"Response cache hit for {response_format.__name__}")
+                    annotate(cache="hit")
+                    return cached
+                annotate(cache="miss")
+
+        # A call already in flight is fresh enough for bypassing callers too. The
+        # shared call runs under the first caller's deadline, every caller still
+        # stops waiting at its own. While queued it waits at the highest priority
+        # of its callers.
+        ticket = AdmissionTicket(priority)
+        flight = self.flights.do(
+            key, lambda: self._generate_and_store(key, prompt, response_format, ticket, deadline), ticket
+        )
+        try:
+            return await asyncio.wait_for(flight, timeout=remaining(deadline))
+        except asyncio.TimeoutError:
+            raise DeadlineExceededException()
+
+    async def _generate_and_store(
+        self, key: str, prompt: str, response_format: Type[BaseModel], ticket: AdmissionTicket,
+        deadline: Optional[float] = None
+    ) -> str:
+        async with self.admission.slot(max_wait=self._max_queue_wait(deadline), ticket=ticket):
+            annotate(model=self.model)
+            with span("upstream"):
+                content = await self.client.generate(prompt, response_format, deadline=deadline)
+
+        if self.cache is None:
+            return content
+
+        # Never cache a response that does not match the schema
+        try:
+            with span("parse"):
+                response_format.model_validate_json(content)
+        except (ValidationError, ValueError, TypeError):
+            logger.warning(f"Not caching invalid {response_format.__name__} response")
+            return content
+
+        self.cache.set(key, content)
+        return content
+
+    async def stream_text(
+        self,
+        prompt: str,
+        bypass_cache: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a plain-text completion, replaying it in one piece on a cache hit.
+
+        Streams are not coalesced, each one holds its own upstream slot for as
+        long as tokens are flowing.
+
+        Args:
+            prompt: The prompt to send to the API
+            bypass_cache: Skip the cache lookup and refresh the entry with a new response
+            priority: Scheduling class used if the call has to wait for an upstream slot
+            deadline: time.monotonic() value the first token has to arrive by
+
+        Yields:
+            Text deltas in generation order
+        """
+        key = ResponseCache.make_key(self.model, prompt, None)
+
+        if self.cache is not None:
+            if bypass_cache:
+                self.cache.record_bypass()
+                annotate(cache="bypass")
+            else:
+                with span("cache_lookup"):
+                    cached = self.cache.get(key)
+                if cached is not None:
+                    logger.info("Response cache hit for streamed completion")
+                    annotate(cache="hit")
+                    yield cached
+                    return
+                annotate(cache="miss")
+
+        parts = []
+        async with self.admission.slot(priority, max_wait=self._max_queue_wait(deadline)):
+            annotate(model=self.model)
+            # Includes the time the consumer takes per token, which is the stream's pace anyway
+            with span("upstream"):
+                async for delta in self.client.stream_text(prompt, deadline=deadline):
+                    parts.append(delta)
+                    yield delta
+
+        # Only a stream that ran to completion is worth caching
+        if self.cache is not None and parts:
+            self.cache.set(key, "".join(parts))
+
+    def _max_queue_wait(self, deadline: Optional[float]) -> Optional[float]:
+        # Waiting for a slot past the deadline is pointless
+        left = remaining(deadline)
+        return None if left is None else min(left, self.admission.max_queue_wait)
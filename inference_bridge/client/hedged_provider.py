@@ -0,0 +1,95 @@
+# inference_bridge/client/hedged_provider.py
+from typing import AsyncIterator, Optional, Type
+from pydantic import BaseModel
+import asyncio
+import logging
+
+from inference_bridge.client.base_provider import InferenceProvider
+from inference_bridge.exception.inference_exception import DeadlineExceededException
+from inference_bridge.utils.deadline import remaining
+from inference_bridge.utils.telemetry import annotate
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedProvider(InferenceProvider):
+    """
+    Wraps a primary provider with a hedge against its latency tail.
+
+    When the primary has not answered hedge_after seconds into a call, the same
+    prompt is also sent to the hedge provider, typically a cheaper or faster
+    model. Whichever answers first successfully wins and the other call is
+    cancelled. A primary that fails before hedge_after falls back to the hedge
+    right away. A hedge is only fired when the deadline leaves time for it.
+    """
+
+    def __init__(self, primary: InferenceProvider, hedge: InferenceProvider, hedge_after: float):
+        self.primary = primary
+        self.hedge = hedge
+        self.hedge_after = hedge_after
+        self.model = primary.model
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.deadline_misses = 0
+
+    async def generate(
+        self, prompt: str, response_format: Type[BaseModel], deadline: Optional[float] = None
+    ) -> str:
+        self.calls += 1
+        primary = asyncio.ensure_future(self.primary.generate(prompt, response_format, deadline=deadline))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self._hedge_delay(deadline))
+            if primary in done and primary.exception() is None:
+                return primary.result()
+
+            # Hedge a slow primary, and fall back to the hedge model when it failed outright
+            error = primary.exception() if primary in done else None
+            if remaining(deadline) != 0:
+                self.hedged += 1
+                annotate(hedged=True)
+                reason = f"failed ({error})" if error else f"slower than {self.hedge_after:.2f}s"
+                logger.info(f"{self.primary.model} {reason}, hedging with {self.hedge.model}")
+                pending.add(asyncio.ensure_future(self.hedge.generate(prompt, response_format, deadline=deadline)))
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining(deadline), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise DeadlineExceededException()
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                            annotate(hedge_won=True)
+                        return task.result()
+                    error = task.exception()
+                    logger.warning(f"{'Primary' if task is primary else 'Hedged'} call failed: {error}")
+            raise error or DeadlineExceededException()
+        except DeadlineExceededException:
+            self.deadline_misses += 1
+            raise
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stream_text(self, prompt: str, deadline: Optional[float] = None) -> AsyncIterator[str]:
+        # Tokens already relayed cannot be taken back, streams are never hedged
+        return self.primary.stream_text(prompt, deadline=deadline)
+
+    def _hedge_delay(self, deadline: Optional[float]) -> float:
+        left = remaining(deadline)
+        return self.hedge_after if left is None else min(self.hedge_after, left)
+
+    def stats(self) -> dict:
+        return {
+            "primary_model": self.primary.model,
+            "hedge_model": self.hedge.model,
+            "hedge_after_seconds": self.hedge_after,
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "deadline_misses": self.deadline_misses,
+        }
@@ -0,0 +1,169 @@
+# inference_bridge/client/local_provider.py
+from typing import Any, AsyncIterator, Dict, List, Optional, Type, Union, get_args, get_origin
+from pydantic import BaseModel
+import asyncio
+import logging
+import os
+import random
+
+from inference_bridge.client.base_provider import InferenceProvider
+from inference_bridge.exception.inference_exception import DeadlineExceededException, SimulatedInferenceException
+from inference_bridge.utils.deadline import remaining
+from inference_bridge.utils.telemetry import add_tokens
+
+logger = logging.getLogger(__name__)
+
+FILLER_WORDS = (
+    "you", "spent", "on", "groceries", "this", "month", "which", "is", "within", "budget",
+    "consider", "setting", "aside", "a", "fixed", "amount", "for", "savings", "each", "week",
+    "dining", "out", "rose", "compared", "to", "last", "period", "keep", "up", "the", "progress",
+)
+
+
+class LocalProvider(InferenceProvider):
+    """
+    Deterministic offline stand-in for the OpenAI API, for load tests and benchmarks.
+
+    Responses are schema-valid instances of the requested response format filled
+    with filler text. Latency is drawn from a configurable distribution, a
+    configurable fraction of calls fail, and the completion length follows a
+    configured token count. A fixed seed makes runs reproducible.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 800.0,
+        latency_spread: float = 0.5,
+        latency_distribution: str = "lognormal",
+        error_rate: float = 0.0,
+        completion_tokens: int = 60,
+        seed: Optional[int] = 0,
+        model: str = "local-fake",
+    ):
+        self.model = model
+        self.latency_ms = latency_ms
+        self.latency_spread = latency_spread
+        self.latency_distribution = latency_distribution
+        self.error_rate = error_rate
+        self.completion_tokens = completion_tokens
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.errors = 0
+        self.prompt_tokens_total = 0
+        self.completion_tokens_total = 0
+
+    @classmethod
+    def from_env(cls, model: Optional[str] = None) -> "LocalProvider":
+        seed = os.getenv("LOCAL_PROVIDER_SEED", "0")
+        return cls(
+            model=model or "local-fake",
+            latency_ms=float(os.getenv("LOCAL_PROVIDER_LATENCY_MS", "800")),
+            latency_spread=float(os.getenv("LOCAL_PROVIDER_LATENCY_SPREAD", "0.5")),
+            latency_distribution=os.getenv("LOCAL_PROVIDER_LATENCY_DISTRIBUTION", "lognormal"),
+            error_rate=float(os.getenv("LOCAL_PROVIDER_ERROR_RATE", "0")),
+            completion_tokens=int(os.getenv("LOCAL_PROVIDER_COMPLETION_TOKENS", "60")),
+            seed=int(seed) if seed else None,
+        )
+
+    def sample_latency(self) -> float:
+        """
+        Draw one call latency in seconds.
+
+        lognormal: median latency_ms, latency_spread is sigma of the log
+        normal: mean latency_ms, latency_spread is the stddev as a fraction of the mean
+        uniform: latency_ms +/- latency_spread * latency_ms
+        fixed: always latency_ms
+        """
+        if self.latency_distribution == "fixed":
+            latency = self.latency_ms
+        elif self.latency_distribution == "uniform":
+            latency = self.rng.uniform(
+                self.latency_ms * (1 - self.latency_spread), self.latency_ms * (1 + self.latency_spread)
+            )
+        elif self.latency_distribution == "normal":
+            latency = self.rng.gauss(self.latency_ms, self.latency_ms * self.latency_spread)
+        else:
+            latency = self.latency_ms * self.rng.lognormvariate(0, self.latency_spread)
+        return max(latency, 0.0) / 1000.0
+
+    async def generate(
+        self, prompt: str, response_format: Type[BaseModel], deadline: Optional[float] = None
+    ) -> str:
+        self._start_call(prompt)
+        await self._sleep_until(self.sample_latency(), deadline)
+        if self.rng.random() < self.error_rate:
+            self.errors += 1
+            raise SimulatedInferenceException()
+
+        instance = response_format(**self._fake_fields(response_format))
+        return instance.model_dump_json()
+
+    async def stream_text(self, prompt: str, deadline: Optional[float] = None) -> AsyncIterator[str]:
+        self._start_call(prompt)
+        latency = self.sample_latency()
+        words = self._filler(self.completion_tokens).split(" ")
+
+        # Roughly a fifth of the time goes to the first token, the rest is spread evenly
+        await self._sleep_until(latency * 0.2, deadline)
+        if self.rng.random() < self.error_rate:
+            self.errors += 1
+            raise SimulatedInferenceException()
+        per_token = latency * 0.8 / max(len(words), 1)
+        for i, word in enumerate(words):
+            if i:
+                await asyncio.sleep(per_token)
+            yield word if i == 0 else " " + word
+
+    async def _sleep_until(self, latency: float, deadline: Optional[float]) -> None:
+        # Like an HTTP timeout set to the deadline, give up when it passes first
+        left = remaining(deadline)
+        if left is not None and latency > left:
+            await asyncio.sleep(left)
+            self.errors += 1
+            raise DeadlineExceededException()
+        await asyncio.sleep(latency)
+
+    def _start_call(self, prompt: str) -> None:
+        self.calls += 1
+        # About four characters per token for English text
+        prompt_tokens = len(prompt) // 4
+        self.prompt_tokens_total += prompt_tokens
+        self.completion_tokens_total += self.completion_tokens
+        add_tokens(prompt_tokens, self.completion_tokens)
+
+    def _filler(self, tokens: int) -> str:
+        return " ".join(self.rng.choice(FILLER_WORDS) for _ in range(max(tokens, 1)))
+
+    def _fake_fields(self, response_format: Type[BaseModel]) -> Dict[str, Any]:
+        return {
+            name: self._fake_value(field.annotation)
+            for name, field in response_format.model_fields.items()
+        }
+
+    def _fake_value(self, annotation: Any) -> Any:
+        origin = get_origin(annotation)
+        if origin is Union:
+            # Optional[X] and other unions: fake the first non-None member
+            members = [arg for arg in get_args(annotation) if arg is not type(None)]
+            return self._fake_value(members[0]) if members else None
+        if origin in (list, List):
+            return [self._fake_value(get_args(annotation)[0])] if get_args(annotation) else []
+        if origin in (dict, Dict):
+            return {}
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return annotation(**self._fake_fields(annotation))
+        if annotation is bool:
+            return self.rng.random() < 0.5
+        if annotation is int:
+            return self.rng.randint(0, 100)
+        if annotation is float:
+            return round(self.rng.uniform(0, 1000), 2)
+        return self._filler(self.completion_tokens)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens_total,
+            "completion_tokens": self.completion_tokens_total,
+        }
@@ -1,20 +1,27 @@
 # inference_bridge/client/openai_client.py
 import os
-from openai import OpenAI
+import asyncio
+from typing import Optional
+from openai import OpenAI, AsyncOpenAI, APITimeoutError
 import logging
+from .base_provider import InferenceProvider
+from ..exception.inference_exception import DeadlineExceededException
+from ..utils.deadline import check_deadline, remaining
 from ..utils.retry_async import retry_with_exponential_backoff
+from ..utils.telemetry import add_tokens
 
 logger = logging.getLogger(__name__)
 
-class OpenAIClient:
-    def __init__(self):
+class OpenAIClient(InferenceProvider):
+    def __init__(self, model: Optional[str] = None):
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             logger.error("OPENAI_API_KEY environment variable not set")
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
         self.client = OpenAI(api_key=api_key)
-        self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")  # Allow model to be configured via env var
+        self.async_client = AsyncOpenAI(api_key=api_key)  # Used for token streaming
+        self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")  # Allow model to be configured via env var
         logger.info(f"OpenAI client initialized with model: {self.model}")
 
     @retry_with_exponential_backoff(max_retries=3)
@@ -44,6 +51,36 @@ class OpenAIClient:
             logger.error(f"Error generating text with OpenAI: {e}")
             raise
 
+    @retry_with_exponential_backoff(max_retries=3)
+    async def generate(self, prompt, response_format, deadline=None):
+        """
+        Generate a structured response without blocking the event loop
+        
+        Args:
+            prompt: The prompt to send to the API
+            response_format: The pydantic model used as structured output schema
+            deadline: time.monotonic() value the call has to finish by, bounds
+                the HTTP timeout and the retries
+            
+        Returns:
+            The generated text response
+        """
+        check_deadline(deadline)
+        
+        # Retries are left to retry_with_exponential_backoff, which knows the deadline
+        client = self.client.with_options(max_retries=0)
+        if deadline is not None:
+            client = client.with_options(timeout=remaining(deadline))
+        
+        try:
+            # The SDK's parse call is blocking, run it in a worker thread
+            return await asyncio.to_thread(self._parse, client, prompt, response_format)
+        except APITimeoutError as e:
+            if deadline is not None:
+                # The HTTP timeout was the time left until the deadline
+                raise DeadlineExceededException() from e
+            raise
+
     def generate_text(self, prompt, response_format):
         """
         Generate text using the OpenAI API (synchronous version)
@@ -55,23 +92,59 @@ class OpenAIClient:
             The generated text response
         """
         try:
-            logger.info(f"Sending prompt to OpenAI (length: {len(prompt)} chars)")
-            
-            response = self.client.beta.chat.completions.parse(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful financial assistant."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5,
-                max_tokens=1000,
-                response_format = response_format
-            )
-            
-            content = response.choices[0].message.content
-            
-            return content
-            
+            return self._parse(self.client, prompt, response_format)
         except Exception as e:
             # Return a fallback response instead of crashing
-            return f"Error generating text with OpenAI: {e}"
\ No newline at end of file
+            return f"Error generating text with OpenAI: {e}"
+
+    def _parse(self, client, prompt, response_format):
+        logger.info(f"Sending prompt to OpenAI (length: {len(prompt)} chars, model: {self.model})")
+        
+        response = client.beta.chat.completions.parse(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": "You are a helpful financial assistant."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.5,
+            max_tokens=1000,
+            response_format = response_format
+        )
+        
+        if response.usage is not None:
+            add_tokens(response.usage.prompt_tokens, response.usage.completion_tokens)
+        return response.choices[0].message.content
+
+    async def stream_text(self, prompt, deadline=None):
+        """
+        Stream plain-text tokens from the OpenAI API as they are generated
+
+        Args:
+            prompt: The prompt to send to the API
+            deadline: time.monotonic() value the stream has to start by
+
+        Yields:
+            Text deltas in generation order
+        """
+        logger.info(f"Streaming prompt to OpenAI (length: {len(prompt)} chars)")
+
+        client = self.async_client
+        if deadline is not None:
+            client = client.with_options(timeout=remaining(deadline))
+        stream = await client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": "You are a helpful financial assistant."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.5,
+            max_tokens=1000,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        async for chunk in stream:
+            # Usage arrives in a final chunk without choices
+            if chunk.usage is not None:
+                add_tokens(chunk.usage.prompt_tokens, chunk.usage.completion_tokens)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
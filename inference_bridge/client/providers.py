@@ -0,0 +1,62 @@
+# inference_bridge/client/providers.py
+from typing import Optional
+import logging
+import os
+
+from inference_bridge.client.base_provider import InferenceProvider
+
+logger = logging.getLogger(__name__)
+
+_provider: Optional[InferenceProvider] = None
+
+
+def create_provider(name: str, model: Optional[str] = None) -> InferenceProvider:
+    """
+    Build the provider registered under name
+
+    Args:
+        name: "openai" or "local"
+        model: Model to use instead of the provider's configured default
+
+    Returns:
+        A new provider instance
+    """
+    if name == "openai":
+        from inference_bridge.client.openai_client import OpenAIClient
+        return OpenAIClient(model=model)
+    if name == "local":
+        from inference_bridge.client.local_provider import LocalProvider
+        return LocalProvider.from_env(model=model)
+    raise ValueError(f"Unknown inference provider: {name}")
+
+
+def get_provider() -> InferenceProvider:
+    """
+    Return the process-wide provider selected with INFERENCE_PROVIDER (default "openai").
+
+    With INFERENCE_HEDGE_MODEL set, calls slower than INFERENCE_HEDGE_AFTER_MS
+    are hedged with that model, on INFERENCE_HEDGE_PROVIDER (default: the same provider).
+    """
+    global _provider
+    if _provider is None:
+        name = os.getenv("INFERENCE_PROVIDER", "openai").lower()
+        _provider = create_provider(name)
+        logger.info(f"Using inference provider {name} (model: {_provider.model})")
+
+        hedge_model = os.getenv("INFERENCE_HEDGE_MODEL")
+        if hedge_model:
+            from inference_bridge.client.hedged_provider import HedgedProvider
+            hedge_name = os.getenv("INFERENCE_HEDGE_PROVIDER", name).lower()
+            hedge_after = float(os.getenv("INFERENCE_HEDGE_AFTER_MS", "2500")) / 1000
+            _provider = HedgedProvider(_provider, create_provider(hedge_name, model=hedge_model), hedge_after)
+            logger.info(f"Hedging calls slower than {hedge_after:.2f}s with {hedge_name} ({hedge_model})")
+    return _provider
+
+
+def set_provider(provider: InferenceProvider) -> None:
+    """
+    Replace the process-wide provider, e.g. with a stub for replay benchmarks.
+    Clients created from here on use it.
+    """
+    global _provider
+    _provider = provider
@@ -0,0 +1,87 @@
+# inference_bridge/controllers/batch_controller.py
+from inference_bridge.batch.job_store import (
+    get_job_store, ITEM_DONE, ITEM_ERROR
+)
+from inference_bridge.data.request.batch_request import BatchSummaryRequest
+from inference_bridge.data.request.summary_request import SummaryRequest
+from inference_bridge.data.response.batch_response import BatchItemResult, BatchJobResponse
+from inference_bridge.processors.batch_processor import start_batch_job
+from typing import Optional
+import logging
+import json
+import os
+
+logger = logging.getLogger(__name__)
+
+async def submit_summary_batch(request: BatchSummaryRequest) -> BatchJobResponse:
+    """
+    Persist a batch of monthly summary requests and start processing it
+
+    Args:
+        request: The batch of summary requests and its concurrency/rate settings
+
+    Returns:
+        The new job with its ID and initial progress
+    """
+    try:
+        concurrency = request.concurrency or int(os.getenv("BATCH_CONCURRENCY", "4"))
+        requests_per_minute = request.requests_per_minute or float(os.getenv("BATCH_REQUESTS_PER_MINUTE", "60"))
+
+        store = get_job_store()
+        job_id = store.create_job(
+            [item.model_dump_json() for item in request.items],
+            concurrency=concurrency,
+            requests_per_minute=requests_per_minute
+        )
+        logger.info(f"Created batch job {job_id} with {len(request.items)} items")
+
+        start_batch_job(job_id)
+        return get_batch_job(job_id, include_items=False)
+
+    except Exception as e:
+        logger.error(f"Error in batch summary controller: {e}")
+        raise
+
+def get_batch_job(job_id: str, include_items: bool = True) -> Optional[BatchJobResponse]:
+    """
+    Report the progress of a batch job
+
+    Args:
+        job_id: The ID returned when the job was submitted
+        include_items: Include per-item status, partial results and errors
+
+    Returns:
+        The job progress, or None if the job does not exist
+    """
+    store = get_job_store()
+    job = store.get_job(job_id)
+    if job is None:
+        return None
+
+    items = store.get_items(job_id)
+    done = sum(1 for item in items if item["status"] == ITEM_DONE)
+    failed = sum(1 for item in items if item["status"] == ITEM_ERROR)
+
+    item_results = []
+    if include_items:
+        for item in items:
+            request = SummaryRequest.model_validate_json(item["payload"])
+            item_results.append(BatchItemResult(
+                index=item["idx"],
+                user_id=request.user_id,
+                year=request.year,
+                month=request.month,
+                status=item["status"],
+                result=json.loads(item["result"]) if item["result"] else None,
+                error=item["error"]
+            ))
+
+    return BatchJobResponse(
+        job_id=job_id,
+        status=job["status"],
+        total=len(items),
+        done=done,
+        failed=failed,
+        pending=len(items) - done - failed,
+        items=item_results
+    )
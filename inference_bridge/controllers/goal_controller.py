@@ -1,18 +1,27 @@
 # inference_bridge/controllers/goal_controller.py
 from inference_bridge.data.request.goal_request import GoalPlanningRequest
+from inference_bridge.data.request.multi_goal_request import MultiGoalPlanningRequest
 from inference_bridge.data.response.goal_response import GoalPlanningResponse
+from inference_bridge.data.response.multi_goal_response import MultiGoalPlanningResponse
 from inference_bridge.processors.goal_processor import GoalProcessor
+from inference_bridge.processors.multi_goal_processor import MultiGoalProcessor
+from inference_bridge.utils.admission import Priority
+from typing import Optional
 import logging
-import json
 
 logger = logging.getLogger(__name__)
 
-async def process_goal_planning(request: GoalPlanningRequest) -> GoalPlanningResponse:
+async def process_goal_planning(request: GoalPlanningRequest, bypass_cache: bool = False,
+                                priority: Priority = Priority.INTERACTIVE,
+                                deadline: Optional[float] = None) -> GoalPlanningResponse:
     """
     Process a goal planning request by passing it to the appropriate processor
     
     Args:
         request: The goal planning request data
+        bypass_cache: Skip the response cache and refresh it with a new result
+        priority: Scheduling class of the upstream call
+        deadline: time.monotonic() value the plan has to be ready by
         
     Returns:
         The goal planning response with AI-generated plan
@@ -22,10 +31,34 @@ async def process_goal_planning(request: GoalPlanningRequest) -> GoalPlanningRes
         processor = GoalProcessor()
         
         # Process the request
-        result = await processor.process(request)
-        result = json.loads(result)
+        result = await processor.process(request, bypass_cache=bypass_cache, priority=priority, deadline=deadline)
+        result = result.model_dump()
         return result
     
     except Exception as e:
         logger.error(f"Error in goal planning controller: {e}")
-        raise
\ No newline at end of file
+        raise
+
+async def process_multi_goal_planning(request: MultiGoalPlanningRequest, bypass_cache: bool = False,
+                                      priority: Priority = Priority.INTERACTIVE,
+                                      deadline: Optional[float] = None) -> MultiGoalPlanningResponse:
+    """
+    Process a joint plan for all of a user's goals by passing it to the multi-goal processor
+    
+    Args:
+        request: The multi-goal planning request data
+        bypass_cache: Skip the response cache and refresh it with a new result
+        priority: Scheduling class of the upstream call
+        deadline: time.monotonic() value the plans have to be ready by
+        
+    Returns:
+        The plan, monthly allocation and feasibility of every goal
+    """
+    try:
+        processor = MultiGoalProcessor()
+        result = await processor.process(request, bypass_cache=bypass_cache, priority=priority, deadline=deadline)
+        return result.model_dump()
+    
+    except Exception as e:
+        logger.error(f"Error in multi-goal planning controller: {e}")
+        raise
@@ -2,17 +2,27 @@
 from inference_bridge.data.request.summary_request import SummaryRequest
 from inference_bridge.data.response.summary_response import SummaryResponse
 from inference_bridge.processors.summary_processor import SummaryProcessor
+from inference_bridge.exception.inference_exception import AdmissionRejectedException, DeadlineExceededException
+from inference_bridge.utils.admission import Priority
+from inference_bridge.utils.telemetry import annotate
+from typing import AsyncIterator, Optional
 import logging
 import json
+import time
 
 logger = logging.getLogger(__name__)
 
-async def process_monthly_summary(request: SummaryRequest) -> SummaryResponse:
+async def process_monthly_summary(request: SummaryRequest, bypass_cache: bool = False,
+                                priority: Priority = Priority.INTERACTIVE,
+                                deadline: Optional[float] = None) -> SummaryResponse:
     """
     Process a monthly summary request by passing it to the appropriate processor
     
     Args:
         request: The monthly summary request data
+        bypass_cache: Skip the response cache and refresh it with a new result
+        priority: Scheduling class of the upstream call
+        deadline: time.monotonic() value the summary has to be ready by
         
     Returns:
         The monthly summary response with AI-generated insights
@@ -22,10 +32,60 @@ async def process_monthly_summary(request: SummaryRequest) -> SummaryResponse:
         processor = SummaryProcessor()
         
         # Process the request
-        result = await processor.process(request)
+        result = await processor.process(request, bypass_cache=bypass_cache, priority=priority, deadline=deadline)
         result = result.model_dump()
         return result
     
     except Exception as e:
         logger.error(f"Error in monthly summary controller: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+def format_sse(event: str, data: dict) -> str:
+    """
+    Encode one server-sent event
+    """
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_monthly_summary(request: SummaryRequest, bypass_cache: bool = False,
+                                 priority: Priority = Priority.INTERACTIVE,
+                                 deadline: Optional[float] = None) -> AsyncIterator[str]:
+    """
+    Stream a monthly summary as server-sent events
+    
+    Args:
+        request: The monthly summary request data
+        bypass_cache: Skip the response cache and refresh it with a new result
+        priority: Scheduling class of the upstream call
+        deadline: time.monotonic() value the first token has to arrive by
+        
+    Yields:
+        Encoded "meta", "token" and "done" events, or a final "error" event
+    """
+    started = time.perf_counter()
+    first_token_ms = None
+    try:
+        processor = SummaryProcessor()
+        async for event, data in processor.stream(
+            request, bypass_cache=bypass_cache, priority=priority, deadline=deadline
+        ):
+            if event == "token" and first_token_ms is None:
+                first_token_ms = (time.perf_counter() - started) * 1000
+                annotate(first_token_ms=round(first_token_ms, 2))
+            yield format_sse(event, data)
+        
+        total_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Streamed monthly summary: first token after {first_token_ms or total_ms:.0f} ms, "
+            f"completed after {total_ms:.0f} ms"
+        )
+    
+    except AdmissionRejectedException as e:
+        # Headers are already sent, report the rejection in-band
+        yield format_sse("error", {"status": 429, "detail": str(e), "retry_after": e.retry_after})
+    except DeadlineExceededException as e:
+        yield format_sse("error", {"status": 504, "detail": str(e)})
+    except Exception as e:
+        logger.error(f"Error in monthly summary stream: {e}")
+        yield format_sse("error", {"status": 500, "detail": str(e)})
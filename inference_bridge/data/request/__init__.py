@@ -1,5 +1,12 @@
 # inference_bridge/data/request/__init__.py
 from .goal_request import GoalPlanningRequest
-from .summary_request import SummaryRequest, TransactionData
+from .multi_goal_request import GoalSpec, MultiGoalPlanningRequest
+from .summary_request import SummaryRequest
+from .transaction_data import TransactionData
+from .spending_aggregates import SpendingAggregates
+from .category_history import CategoryHistory
+from .batch_request import BatchSummaryRequest
+from .profile_request import ProfileRequest
+from .recurring_expenses import RecurringCharge, RecurringExpenses
 
-__all__ = ["GoalPlanningRequest", "SummaryRequest", "TransactionData"]
\ No newline at end of file
+__all__ = ["GoalPlanningRequest", "GoalSpec", "MultiGoalPlanningRequest", "SummaryRequest", "TransactionData", "SpendingAggregates", "CategoryHistory", "BatchSummaryRequest", "ProfileRequest", "RecurringCharge", "RecurringExpenses"]
@@ -0,0 +1,9 @@
+# inference_bridge/data/request/batch_request.py
+from pydantic import Field, BaseModel
+from typing import List, Optional
+from .summary_request import SummaryRequest
+
+class BatchSummaryRequest(BaseModel):
+    items: List[SummaryRequest] = Field(..., min_length=1, description="Monthly summary requests to precompute")
+    concurrency: Optional[int] = Field(None, ge=1, le=64, description="Maximum items processed at once")
+    requests_per_minute: Optional[float] = Field(None, gt=0, description="Upper bound on the upstream request rate")
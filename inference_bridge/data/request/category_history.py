@@ -0,0 +1,23 @@
+# inference_bridge/data/request/category_history.py
+from pydantic import Field, BaseModel, model_validator
+from typing import List
+
+class CategoryHistory(BaseModel):
+    """
+    Spending per category in the months before the requested one.
+
+    totals holds one row per month, parallel to months, with one value per
+    category, parallel to categories. A category without spending in a month is 0.
+    """
+    categories: List[str] = Field(default_factory=list, description="Category names")
+    months: List[str] = Field(default_factory=list, description="Months as YYYY-MM, oldest first")
+    totals: List[List[float]] = Field(default_factory=list, description="Spending per month and category")
+
+    @model_validator(mode="after")
+    def check_shape(self):
+        if len(self.totals) != len(self.months):
+            raise ValueError(f"totals has {len(self.totals)} rows for {len(self.months)} months")
+        for month, row in zip(self.months, self.totals):
+            if len(row) != len(self.categories):
+                raise ValueError(f"totals for {month} has {len(row)} values for {len(self.categories)} categories")
+        return self
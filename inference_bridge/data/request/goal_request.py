@@ -1,18 +1,26 @@
 # inference_bridge/data/request/goal_request.py
-from pydantic import Field, BaseModel
+from functools import cached_property
+from pydantic import AliasChoices, Field, BaseModel
 from typing import Optional, List
+from .transaction_data import TransactionData
+from .spending_aggregates import SpendingAggregates
+from .recurring_expenses import RecurringExpenses
 
-class TransactionData(BaseModel):
-    amount: float = Field(..., description="The transaction amount")
-    category: str = Field(..., description="The transaction category")
-    date: str = Field(..., description="The transaction date in ISO format")
-    description: Optional[str] = Field(None, description="The transaction description")
-    
 class GoalPlanningRequest(BaseModel):
     goal_id: int = Field(..., description="The ID of the goal")
     goal_description: str = Field(..., description="The description of the goal")
     target_amount: float = Field(..., description="The target amount to save")
     deadline: str = Field(..., description="The deadline date in ISO format")
     user_income: float = Field(..., description="The user's monthly income")
-    transactions: List[TransactionData] = Field(..., description="List of transactions for the specified month")
-    priority: Optional[int] = Field(None, description="The priority of the goal")
\ No newline at end of file
+    transactions: List[TransactionData] = Field(default_factory=list, description="Raw transactions of the past 2 months (v1)")
+    aggregates: Optional[SpendingAggregates] = Field(None, description="Pre-aggregated spending of the past 2 months (v2)")
+    priority: Optional[int] = Field(None, validation_alias=AliasChoices("priority", "goal_priority"), description="The priority of the goal")
+    monthly_net_flows: List[float] = Field(default_factory=list, description="Income minus spending of past months, oldest first")
+    recurring: Optional[RecurringExpenses] = Field(None, description="Fixed monthly obligations found in the user's history")
+
+    @cached_property
+    def spending(self) -> SpendingAggregates:
+        """
+        The request's spending features, whichever schema it was sent in
+        """
+        return self.aggregates or SpendingAggregates.from_transactions(self.transactions)
@@ -0,0 +1,29 @@
+# inference_bridge/data/request/multi_goal_request.py
+from functools import cached_property
+from pydantic import AliasChoices, Field, BaseModel
+from typing import Optional, List
+from .transaction_data import TransactionData
+from .spending_aggregates import SpendingAggregates
+from .recurring_expenses import RecurringExpenses
+
+class GoalSpec(BaseModel):
+    goal_id: int = Field(..., description="The ID of the goal")
+    goal_description: str = Field(..., description="The description of the goal")
+    target_amount: float = Field(..., description="The target amount to save")
+    deadline: str = Field(..., description="The deadline date in ISO format")
+    priority: Optional[int] = Field(None, validation_alias=AliasChoices("priority", "goal_priority"), description="The priority of the goal")
+
+class MultiGoalPlanningRequest(BaseModel):
+    goals: List[GoalSpec] = Field(..., min_length=1, description="All of the user's goals, which share the same income")
+    user_income: float = Field(..., description="The user's monthly income")
+    transactions: List[TransactionData] = Field(default_factory=list, description="Raw transactions of the past 2 months (v1)")
+    aggregates: Optional[SpendingAggregates] = Field(None, description="Pre-aggregated spending of the past 2 months (v2)")
+    monthly_net_flows: List[float] = Field(default_factory=list, description="Income minus spending of past months, oldest first")
+    recurring: Optional[RecurringExpenses] = Field(None, description="Fixed monthly obligations found in the user's history")
+
+    @cached_property
+    def spending(self) -> SpendingAggregates:
+        """
+        The request's spending features, whichever schema it was sent in
+        """
+        return self.aggregates or SpendingAggregates.from_transactions(self.transactions)
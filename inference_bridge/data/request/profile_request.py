@@ -0,0 +1,20 @@
+# inference_bridge/data/request/profile_request.py
+from pydantic import Field, BaseModel, model_validator
+from typing import Optional
+
+class ProfileRequest(BaseModel):
+    route: Optional[str] = Field(None, description="Route path as declared, e.g. /monthly_summary; all routes when omitted")
+    method: Optional[str] = Field(None, description="Only requests with this HTTP method")
+    requests: Optional[int] = Field(None, ge=1, le=10000, description="Profile the next N requests to the route")
+    seconds: Optional[float] = Field(None, gt=0, le=300, description="Profile for a fixed time window")
+    interval_ms: float = Field(10.0, ge=1, le=1000, description="Time between stack samples")
+    timeout_s: float = Field(60.0, gt=0, le=600, description="Give up waiting for the requests after this long")
+    idle: bool = Field(False, description="Keep samples of threads waiting on a lock, queue or selector")
+
+    @model_validator(mode="after")
+    def check_mode(self):
+        if (self.requests is None) == (self.seconds is None):
+            raise ValueError("Set exactly one of requests and seconds")
+        if self.requests is not None and self.route is None:
+            raise ValueError("Profiling the next requests needs a route")
+        return self
@@ -0,0 +1,19 @@
+# inference_bridge/data/request/recurring_expenses.py
+from pydantic import Field, BaseModel
+from typing import List
+
+class RecurringCharge(BaseModel):
+    description: str = Field(..., description="Description of the latest charge")
+    category: str = Field(..., description="The charge's category")
+    amount: float = Field(..., description="Average amount per charge")
+    period: str = Field(..., description="weekly, biweekly, monthly, quarterly or yearly")
+    monthly_amount: float = Field(..., description="The charge as a monthly cost")
+
+class RecurringExpenses(BaseModel):
+    """
+    Subscriptions and bills the backend found in the user's whole history,
+    split from the rest of their recent spending
+    """
+    fixed_monthly: float = Field(..., description="Monthly cost of all recurring charges")
+    discretionary_monthly: float = Field(..., description="Average monthly spending besides the recurring charges")
+    charges: List[RecurringCharge] = Field(default_factory=list, description="The recurring charges, largest monthly cost first")
@@ -0,0 +1,67 @@
+# inference_bridge/data/request/spending_aggregates.py
+from collections import defaultdict
+from datetime import date
+from pydantic import Field, BaseModel
+from typing import Dict, List, Optional
+import heapq
+from .transaction_data import TransactionData
+
+class SpendingAggregates(BaseModel):
+    """
+    Pre-aggregated spending features (request schema v2).
+
+    Per-category values are parallel arrays and the daily series is positional,
+    which keeps the payload small and independent of the number of transactions.
+    """
+    categories: List[str] = Field(default_factory=list, description="Category names")
+    category_totals: List[float] = Field(default_factory=list, description="Spending per category, parallel to categories")
+    category_counts: List[int] = Field(default_factory=list, description="Transactions per category, parallel to categories")
+    start_date: Optional[str] = Field(None, description="ISO date of the first entry of daily_spend")
+    daily_spend: List[float] = Field(default_factory=list, description="Spending per day from start_date on")
+    top_transactions: List[TransactionData] = Field(default_factory=list, description="The largest transactions of the window")
+
+    @property
+    def total_spending(self) -> float:
+        return sum(self.category_totals)
+
+    @property
+    def transaction_count(self) -> int:
+        return sum(self.category_counts)
+
+    def totals_by_category(self) -> Dict[str, float]:
+        return dict(zip(self.categories, self.category_totals))
+
+    def counts_by_category(self) -> Dict[str, int]:
+        return dict(zip(self.categories, self.category_counts))
+
+    @classmethod
+    def from_transactions(cls, transactions: List[TransactionData], top_n: int = 20) -> "SpendingAggregates":
+        """
+        Derive the aggregates from a v1 request's raw transaction list
+        """
+        totals = defaultdict(float)
+        counts = defaultdict(int)
+        daily = defaultdict(float)
+        for t in transactions:
+            totals[t.category] += t.amount
+            counts[t.category] += 1
+            daily[t.date[:10]] += t.amount
+
+        start_date, daily_spend = None, []
+        if daily:
+            days = sorted(daily)
+            first = date.fromisoformat(days[0])
+            span = (date.fromisoformat(days[-1]) - first).days + 1
+            daily_spend = [0.0] * span
+            for day, amount in daily.items():
+                daily_spend[(date.fromisoformat(day) - first).days] = amount
+            start_date = first.isoformat()
+
+        return cls(
+            categories=list(totals),
+            category_totals=list(totals.values()),
+            category_counts=[counts[c] for c in totals],
+            start_date=start_date,
+            daily_spend=daily_spend,
+            top_transactions=heapq.nlargest(top_n, transactions, key=lambda t: t.amount),
+        )
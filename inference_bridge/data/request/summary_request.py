@@ -1,16 +1,23 @@
 # inference_bridge/data/request/summary_request.py
+from functools import cached_property
 from pydantic import Field, BaseModel
 from typing import List, Optional
-
-class TransactionData(BaseModel):
-    amount: float = Field(..., description="The transaction amount")
-    category: str = Field(..., description="The transaction category")
-    date: str = Field(..., description="The transaction date in ISO format")
-    description: Optional[str] = Field(None, description="The transaction description")
+from .transaction_data import TransactionData
+from .spending_aggregates import SpendingAggregates
+from .category_history import CategoryHistory
 
 class SummaryRequest(BaseModel):
     user_id: int = Field(..., description="The ID of the user")
     month: int = Field(..., description="The month number (1-12)")
     year: int = Field(..., description="The year")
     income: float = Field(..., description="The user's monthly income")
-    transactions: List[TransactionData] = Field(..., description="List of transactions for the specified month")
\ No newline at end of file
+    transactions: List[TransactionData] = Field(default_factory=list, description="Raw transactions of the specified month (v1)")
+    aggregates: Optional[SpendingAggregates] = Field(None, description="Pre-aggregated spending of the specified month (v2)")
+    history: Optional[CategoryHistory] = Field(None, description="Spending by category of the preceding months, enables anomaly detection")
+
+    @cached_property
+    def spending(self) -> SpendingAggregates:
+        """
+        The request's spending features, whichever schema it was sent in
+        """
+        return self.aggregates or SpendingAggregates.from_transactions(self.transactions)
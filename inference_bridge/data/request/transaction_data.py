@@ -0,0 +1,9 @@
+# inference_bridge/data/request/transaction_data.py
+from pydantic import Field, BaseModel
+from typing import Optional
+
+class TransactionData(BaseModel):
+    amount: float = Field(..., description="The transaction amount")
+    category: str = Field(..., description="The transaction category")
+    date: str = Field(..., description="The transaction date in ISO format")
+    description: Optional[str] = Field(None, description="The transaction description")
@@ -1,5 +1,7 @@
 # inference_bridge/data/response/__init__.py
-from .goal_response import GoalPlanningResponse
-from .summary_response import SummaryResponse
+from .goal_response import GoalFeasibility, GoalPlanningResponse
+from .multi_goal_response import GoalPlanItem, MultiGoalPlanningResponse
+from .summary_response import CategoryAnomaly, SummaryResponse
+from .batch_response import BatchItemResult, BatchJobResponse
 
-__all__ = ["GoalPlanningResponse", "SummaryResponse"]
\ No newline at end of file
+__all__ = ["GoalPlanningResponse", "GoalFeasibility", "GoalPlanItem", "MultiGoalPlanningResponse", "SummaryResponse", "CategoryAnomaly", "BatchItemResult", "BatchJobResponse"]
\ No newline at end of file
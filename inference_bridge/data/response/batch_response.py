@@ -0,0 +1,22 @@
+# inference_bridge/data/response/batch_response.py
+from pydantic import Field, BaseModel
+from typing import List, Optional
+from .summary_response import SummaryResponse
+
+class BatchItemResult(BaseModel):
+    index: int = Field(..., description="Position of the item in the submitted batch")
+    user_id: int = Field(..., description="The ID of the user")
+    year: int = Field(..., description="The year")
+    month: int = Field(..., description="The month number (1-12)")
+    status: str = Field(..., description="pending, running, done or error")
+    result: Optional[SummaryResponse] = Field(None, description="The summary once the item is done")
+    error: Optional[str] = Field(None, description="Why the item failed")
+
+class BatchJobResponse(BaseModel):
+    job_id: str = Field(..., description="The ID used to poll the job")
+    status: str = Field(..., description="running or completed")
+    total: int = Field(..., description="Number of items in the job")
+    done: int = Field(..., description="Items with a summary")
+    failed: int = Field(..., description="Items that failed permanently")
+    pending: int = Field(..., description="Items not finished yet")
+    items: List[BatchItemResult] = Field(default_factory=list, description="Per-item status, partial results and errors")
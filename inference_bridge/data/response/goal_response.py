@@ -1,5 +1,18 @@
 # inference_bridge/data/response/goal_response.py
 from pydantic import Field, BaseModel
+from typing import Optional
+
+class GoalGenResponse(BaseModel):
+    plan: str = Field(..., description="The AI-generated savings plan")
+
+class GoalFeasibility(BaseModel):
+    probability: float = Field(..., description="Share of simulated savings trajectories that reach the target by the deadline")
+    expected_completion_date: Optional[str] = Field(None, description="ISO date by which half of the trajectories reach the target, None if beyond the simulated horizon")
+    months_remaining: float = Field(..., description="Months from now until the deadline")
+    required_monthly_savings: float = Field(..., description="Savings per month needed to reach the target by the deadline")
+    expected_monthly_savings: float = Field(..., description="Mean monthly savings toward the goal the simulation assumes")
+
 class GoalPlanningResponse(BaseModel):
     plan: str = Field(..., description="The AI-generated savings plan")
     is_realistic: bool = Field(..., description="Whether the goal is realistic based on current finances")
+    feasibility: Optional[GoalFeasibility] = Field(None, description="Simulated feasibility the plan is based on")
@@ -0,0 +1,19 @@
+# inference_bridge/data/response/multi_goal_response.py
+from pydantic import Field, BaseModel
+from typing import List
+from .goal_response import GoalPlanningResponse
+
+class GoalPlanText(BaseModel):
+    goal_id: int = Field(..., description="The ID of the goal the plan is for")
+    plan: str = Field(..., description="The AI-generated savings plan")
+
+class MultiGoalGenResponse(BaseModel):
+    plans: List[GoalPlanText] = Field(..., description="One savings plan per goal")
+
+class GoalPlanItem(GoalPlanningResponse):
+    goal_id: int = Field(..., description="The ID of the goal")
+    monthly_allocation: float = Field(..., description="Savings per month set aside for this goal")
+
+class MultiGoalPlanningResponse(BaseModel):
+    plans: List[GoalPlanItem] = Field(..., description="The plan of every goal, in request order")
+    unallocated_savings: float = Field(..., description="Expected monthly savings left over once every goal is funded")
@@ -1,12 +1,19 @@
 # inference_bridge/data/response/summary_response.py
 from pydantic import Field, BaseModel
-from typing import Dict
+from typing import Dict, List
 
 class SummaryGenResponse(BaseModel):
     summary: str = Field(..., description="The AI-generated summary and analysis")
     
+class CategoryAnomaly(BaseModel):
+    category: str = Field(..., description="The category with unusually high spending")
+    amount: float = Field(..., description="Spending in the category this month")
+    baseline: float = Field(..., description="Median monthly spending in the category over the history")
+    z_score: float = Field(..., description="Robust z-score of this month's spending against the history")
+    
 class SummaryResponse(BaseModel):
     summary: str
     top_categories: Dict[str, float] = Field(..., description="Spending by category")
     total_spending: float = Field(..., description="Total spending for the period")
     budget_status: str = Field(..., description="Whether the user is under or over budget")
+    anomalies: List[CategoryAnomaly] = Field(default_factory=list, description="Categories with unusually high spending, most unusual first")
@@ -33,3 +33,41 @@ Error code format: 2xx
 class OpenaiInferenceException(InferenceException):
     def __init__(self, message: str) -> None:
         super().__init__(code="INF_201", message=message)
+
+
+class SimulatedInferenceException(InferenceException):
+    def __init__(self) -> None:
+        super().__init__(code="INF_202", message="Local provider simulated an upstream failure")
+
+
+"""
+Capacity exceptions raised by admission control
+Error code format: 3xx
+"""
+
+
+class AdmissionRejectedException(InferenceException):
+    def __init__(self, code: str, message: str, retry_after: int) -> None:
+        super().__init__(code=code, message=message)
+        self.retry_after = retry_after
+
+
+class QueueFullException(AdmissionRejectedException):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(code="INF_301", message="Inference queue is full", retry_after=retry_after)
+
+
+class QueueTimeoutException(AdmissionRejectedException):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(code="INF_302", message="Timed out waiting for an inference slot", retry_after=retry_after)
+
+
+"""
+Timeout exceptions raised when a request's deadline cannot be met
+Error code format: 4xx
+"""
+
+
+class DeadlineExceededException(InferenceException):
+    def __init__(self) -> None:
+        super().__init__(code="INF_401", message="Request deadline exceeded before the model answered")
@@ -1,15 +1,52 @@
 # inference_bridge/main.py
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from typing import Optional
 from dotenv import load_dotenv
+import asyncio
 import logging
+import os
+import time
 
 # Import request/response models from data package
-from inference_bridge.data.request import GoalPlanningRequest, SummaryRequest
-from inference_bridge.data.response import GoalPlanningResponse, SummaryResponse
+from inference_bridge.data.request import GoalPlanningRequest, MultiGoalPlanningRequest, SummaryRequest, BatchSummaryRequest, ProfileRequest
+from inference_bridge.data.response import GoalPlanningResponse, MultiGoalPlanningResponse, SummaryResponse, BatchJobResponse
 
 # Import controllers
-from inference_bridge.controllers.goal_controller import process_goal_planning
-from inference_bridge.controllers.summary_controller import process_monthly_summary
+from inference_bridge.controllers.goal_controller import process_goal_planning, process_multi_goal_planning
+from inference_bridge.controllers.summary_controller import process_monthly_summary, stream_monthly_summary
+from inference_bridge.controllers.batch_controller import submit_summary_batch, get_batch_job
+from inference_bridge.processors.batch_processor import watch_unfinished_jobs
+
+# Import response cache and request coalescing
+from inference_bridge.cache.response_cache import get_response_cache
+from inference_bridge.client.cached_client import upstream_flights
+
+# Import request decoding
+from inference_bridge.utils.gzip_request import GzipRequestMiddleware
+
+# Import admission control
+from inference_bridge.exception.inference_exception import AdmissionRejectedException
+from inference_bridge.utils.admission import Priority, get_admission_controller
+
+# Import deadline propagation and hedging
+from inference_bridge.exception.inference_exception import DeadlineExceededException
+from inference_bridge.utils.deadline import deadline_from_header
+from inference_bridge.client.hedged_provider import HedgedProvider
+from inference_bridge.client.providers import get_provider
+
+# Import per-request telemetry
+from inference_bridge.utils.metrics import get_metrics
+from inference_bridge.utils.telemetry import mark
+from inference_bridge.utils.telemetry_middleware import TelemetryMiddleware
+
+# Import traffic recording for replay benchmarks
+from inference_bridge.utils.request_recorder import RequestRecorder, recorder_from_env
+
+# Import the on-demand sampling profiler
+from inference_bridge.utils.profiler import (
+    ProfileCapture, ProfilerMiddleware, get_profiler, is_admin, profiler_token, routes_for
+)
 
 # Setup logging
 logging.basicConfig(
@@ -20,36 +57,304 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Access log lines are JSON documents, written without the usual prefix
+access_handler = logging.StreamHandler()
+access_handler.setFormatter(logging.Formatter("%(message)s"))
+access_logger = logging.getLogger("inference_bridge.access")
+access_logger.addHandler(access_handler)
+access_logger.propagate = False
+
 # Create FastAPI app
 app = FastAPI(title="CoinForLooP Inference Bridge")
 
+# Record sanitized traffic for replay benchmarks, innermost so bodies arrive inflated
+recorder_options = recorder_from_env()
+if recorder_options:
+    app.add_middleware(RequestRecorder, **recorder_options)
+    logger.info(f"Recording requests to {recorder_options['path']}")
+
+# Accept gzip-compressed request payloads from the backend
+app.add_middleware(GzipRequestMiddleware)
+
+# Time every request, outermost so decoding is included
+app.add_middleware(
+    TelemetryMiddleware,
+    access_log=os.getenv("ACCESS_LOG_ENABLED", "true").lower() in ("1", "true", "yes"),
+)
+
+# Count requests for profile captures, only when the admin profiling endpoint is enabled
+if profiler_token():
+    app.add_middleware(ProfilerMiddleware, profiler=get_profiler())
+
+
+@app.on_event("startup")
+async def resume_batch_jobs():
+    """
+    Pick up batch jobs interrupted by a crash or restart, or left behind by
+    another worker, for as long as the bridge runs
+    """
+    app.state.batch_job_watcher = asyncio.create_task(watch_unfinished_jobs())
+
+
+def should_bypass_cache(cache_control: Optional[str], cache_bypass: Optional[str]) -> bool:
+    """
+    Honor either "X-Cache-Bypass: 1" or "Cache-Control: no-cache" on a request
+    """
+    if cache_bypass and cache_bypass.lower() in ("1", "true", "yes"):
+        return True
+    return bool(cache_control and "no-cache" in cache_control.lower())
+
+
+def shed_load(e: AdmissionRejectedException) -> HTTPException:
+    """
+    Translate an admission rejection into 429 Too Many Requests with Retry-After
+    """
+    return HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
 
 # Goal planning endpoint
 @app.post("/goal_planning", response_model=GoalPlanningResponse)
-async def goal_planning(request: GoalPlanningRequest):
+async def goal_planning(
+    request: GoalPlanningRequest,
+    cache_control: Optional[str] = Header(None),
+    x_cache_bypass: Optional[str] = Header(None),
+    x_request_priority: Optional[str] = Header(None),
+    x_request_timeout_ms: Optional[str] = Header(None),
+):
     """
     Generate an AI savings plan for a financial goal
     """
+    # Everything so far was reading, inflating and validating the request body
+    mark("validation")
     try:
-        return await process_goal_planning(request)
+        return await process_goal_planning(
+            request,
+            bypass_cache=should_bypass_cache(cache_control, x_cache_bypass),
+            priority=Priority.from_header(x_request_priority),
+            deadline=deadline_from_header(x_request_timeout_ms),
+        )
+    except AdmissionRejectedException as e:
+        raise shed_load(e)
+    except DeadlineExceededException as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Error processing goal planning: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Joint planning of all of a user's goals
+@app.post("/multi_goal_planning", response_model=MultiGoalPlanningResponse)
+async def multi_goal_planning(
+    request: MultiGoalPlanningRequest,
+    cache_control: Optional[str] = Header(None),
+    x_cache_bypass: Optional[str] = Header(None),
+    x_request_priority: Optional[str] = Header(None),
+    x_request_timeout_ms: Optional[str] = Header(None),
+):
+    """
+    Allocate monthly savings across a user's goals and generate all their plans in one model call
+    """
+    mark("validation")
+    try:
+        return await process_multi_goal_planning(
+            request,
+            bypass_cache=should_bypass_cache(cache_control, x_cache_bypass),
+            priority=Priority.from_header(x_request_priority),
+            deadline=deadline_from_header(x_request_timeout_ms),
+        )
+    except AdmissionRejectedException as e:
+        raise shed_load(e)
+    except DeadlineExceededException as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error processing multi-goal planning: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # Monthly summary endpoint
 @app.post("/monthly_summary", response_model=SummaryResponse)
-async def monthly_summary(request: SummaryRequest):
+async def monthly_summary(
+    request: SummaryRequest,
+    cache_control: Optional[str] = Header(None),
+    x_cache_bypass: Optional[str] = Header(None),
+    x_request_priority: Optional[str] = Header(None),
+    x_request_timeout_ms: Optional[str] = Header(None),
+):
     """
     Generate AI insights for monthly spending analysis
     """
+    mark("validation")
     try:
-        return await process_monthly_summary(request)
+        return await process_monthly_summary(
+            request,
+            bypass_cache=should_bypass_cache(cache_control, x_cache_bypass),
+            priority=Priority.from_header(x_request_priority),
+            deadline=deadline_from_header(x_request_timeout_ms),
+        )
+    except AdmissionRejectedException as e:
+        raise shed_load(e)
+    except DeadlineExceededException as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Error processing monthly summary: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Streaming monthly summary endpoint
+@app.post("/monthly_summary/stream")
+async def monthly_summary_stream(
+    request: SummaryRequest,
+    cache_control: Optional[str] = Header(None),
+    x_cache_bypass: Optional[str] = Header(None),
+    x_request_priority: Optional[str] = Header(None),
+    x_request_timeout_ms: Optional[str] = Header(None),
+):
+    """
+    Stream AI insights for monthly spending analysis as server-sent events.
+    The first event carries top_categories, total_spending and budget_status.
+    """
+    mark("validation")
+    events = stream_monthly_summary(
+        request,
+        bypass_cache=should_bypass_cache(cache_control, x_cache_bypass),
+        priority=Priority.from_header(x_request_priority),
+        deadline=deadline_from_header(x_request_timeout_ms),
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# Batch summary precomputation endpoints
+@app.post("/batch/monthly_summary", response_model=BatchJobResponse, status_code=202)
+async def batch_monthly_summary(request: BatchSummaryRequest):
+    """
+    Queue many monthly summaries for background generation and return the job ID
+    """
+    mark("validation")
+    try:
+        return await submit_summary_batch(request)
+    except Exception as e:
+        logger.error(f"Error submitting summary batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/batch/jobs/{job_id}", response_model=BatchJobResponse)
+async def batch_job_status(job_id: str, include_items: bool = True):
+    """
+    Report progress, partial results and per-item errors of a batch job
+    """
+    job = get_batch_job(job_id, include_items=include_items)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+    return job
+
+
+# Response cache counters
+@app.get("/cache/stats")
+async def cache_stats():
+    """
+    Report hit/miss counters of the LLM response cache and upstream call coalescing
+    """
+    cache = get_response_cache()
+    stats = {"enabled": False} if cache is None else {"enabled": True, **cache.stats()}
+    stats["single_flight"] = upstream_flights.stats()
+    return stats
+
+
+# Admission control metrics
+@app.get("/admission/stats")
+async def admission_stats():
+    """
+    Report queue depth, in-flight calls, wait times and shed requests
+    """
+    return get_admission_controller().stats()
+
+
+# Hedged request metrics
+@app.get("/hedging/stats")
+async def hedging_stats():
+    """
+    Report how often calls were hedged and how often the hedge answered first
+    """
+    try:
+        provider = get_provider()
+    except Exception as e:
+        # No provider could be configured (e.g. OPENAI_API_KEY unset), so nothing is hedged
+        logger.warning(f"No inference provider for hedging stats: {e}")
+        return {"enabled": False}
+    if not isinstance(provider, HedgedProvider):
+        return {"enabled": False}
+    return {"enabled": True, **provider.stats()}
+
+
+# On-demand profiling
+@app.post("/admin/profile", response_class=PlainTextResponse)
+async def admin_profile(request: ProfileRequest, x_admin_token: Optional[str] = Header(None)):
+    """
+    Sample the stacks of the next N requests to a route, or of a time window,
+    and return them as collapsed stacks for flamegraph.pl or speedscope.
+    Requires the X-Admin-Token header to match PROFILER_ADMIN_TOKEN.
+    """
+    if not is_admin(x_admin_token):
+        raise HTTPException(status_code=404, detail="Not Found")
+    routes = routes_for(app, request.route, request.method) if request.route else []
+    if request.route and not routes:
+        raise HTTPException(status_code=404, detail=f"No route {request.route}")
+
+    profiler = get_profiler()
+    capture = ProfileCapture(
+        routes=routes,
+        method=request.method,
+        requests=request.requests,
+        seconds=request.seconds,
+        interval=request.interval_ms / 1000,
+        idle=request.idle,
+    )
+    try:
+        profiler.start(capture)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    try:
+        timeout = request.timeout_s if request.requests is not None else request.seconds + 1
+        await asyncio.to_thread(capture.done.wait, timeout)
+    finally:
+        profiler.stop(capture)
+
+    summary = capture.summary()
+    logger.info(f"Captured profile of {request.route or 'all routes'}: {summary}")
+    return PlainTextResponse(
+        capture.collapsed(),
+        headers={
+            "Content-Disposition": f"attachment; filename=bridge-{int(time.time())}.collapsed",
+            **{f"X-Profile-{key.replace('_', '-').title()}": str(value) for key, value in summary.items()},
+        },
+    )
+
+
+# Prometheus metrics
+def _hedging_stats():
+    provider = get_provider()
+    return provider.stats() if isinstance(provider, HedgedProvider) else None
+
+
+get_metrics().register_collector("bridge_cache", lambda: get_response_cache() and get_response_cache().stats())
+get_metrics().register_collector("bridge_single_flight", upstream_flights.stats)
+get_metrics().register_collector("bridge_admission", lambda: get_admission_controller().stats())
+get_metrics().register_collector("bridge_hedging", _hedging_stats)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Export request counts, latency histograms, per-stage timings, token usage
+    and cache, coalescing and hedging outcomes in the Prometheus text format
+    """
+    return PlainTextResponse(get_metrics().render(), media_type="text/plain; version=0.0.4")
+
+
 # For development
 if __name__ == "__main__":
     import uvicorn
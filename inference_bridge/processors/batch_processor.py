@@ -0,0 +1,173 @@
+# inference_bridge/processors/batch_processor.py
+from typing import Dict
+from openai import RateLimitError
+from inference_bridge.batch.job_store import (
+    JobStore, ITEM_DONE, ITEM_ERROR, ITEM_PENDING, ITEM_RUNNING, get_job_store, lease_seconds
+)
+from inference_bridge.data.request.summary_request import SummaryRequest
+from inference_bridge.exception.inference_exception import AdmissionRejectedException
+from inference_bridge.processors.summary_processor import SummaryProcessor
+from inference_bridge.utils.admission import Priority
+from inference_bridge.utils.metrics import get_metrics
+from inference_bridge.utils.pacer import RatePacer
+from inference_bridge.utils.telemetry import start_trace
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Running job tasks, keyed by job ID, so they are not garbage collected mid-flight
+_running_jobs: Dict[str, asyncio.Task] = {}
+
+MAX_ATTEMPTS = 5
+
+
+class BatchProcessor:
+    """
+    Fans the items of a batch job out through SummaryProcessor.
+
+    Up to `concurrency` items run at once, paced to the job's request rate, at
+    bulk priority so interactive traffic is admitted first. Items shed by
+    admission control or rate limited upstream are retried after backing off;
+    other failures are recorded on the item. Progress is written to the job store
+    after every item, so an interrupted job resumes with the unfinished items.
+    The job's lease is renewed while it runs; a worker that loses it stops, as
+    another worker has taken the job over.
+    """
+
+    def __init__(self, job_id: str, store: JobStore = None):
+        self.job_id = job_id
+        self.store = store or get_job_store()
+        job = self.store.get_job(job_id)
+        self.concurrency = job["concurrency"]
+        self.pacer = RatePacer(max_rate=job["requests_per_minute"] / 60.0)
+        self.processor = SummaryProcessor()
+
+    async def run(self) -> None:
+        queue = asyncio.Queue()
+        for item in self.store.unfinished_items(self.job_id):
+            queue.put_nowait((item["idx"], item["payload"], item["attempts"]))
+
+        logger.info(f"Batch job {self.job_id}: {queue.qsize()} items to process")
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(self.concurrency)]
+        finished = asyncio.create_task(queue.join())
+        renewing = asyncio.create_task(self._renew_lease())
+        try:
+            done, _ = await asyncio.wait({finished, renewing}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in [*workers, finished, renewing]:
+                task.cancel()
+
+        if finished not in done:
+            logger.warning(f"Batch job {self.job_id}: lease lost to another worker, stopping")
+            return
+        self.store.finish_job(self.job_id)
+        logger.info(f"Batch job {self.job_id} completed")
+
+    async def _renew_lease(self) -> None:
+        """
+        Renew the job's lease every third of its length, return once it is lost
+        """
+        while True:
+            await asyncio.sleep(lease_seconds() / 3)
+            if not self.store.claim_job(self.job_id):
+                return
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            idx, payload, attempts = await queue.get()
+            try:
+                await self._process_item(queue, idx, payload, attempts)
+            finally:
+                queue.task_done()
+
+    async def _process_item(self, queue: asyncio.Queue, idx: int, payload: str, attempts: int) -> None:
+        await self.pacer.wait()
+        self.store.mark_item(self.job_id, idx, ITEM_RUNNING)
+        # Each item is traced on its own, like a request to /monthly_summary
+        with start_trace("batch:/monthly_summary", f"{self.job_id}:{idx}") as trace:
+            status = 500
+            try:
+                status = await self._run_item(queue, idx, payload, attempts)
+            finally:
+                get_metrics().record(trace, status)
+
+    async def _run_item(self, queue: asyncio.Queue, idx: int, payload: str, attempts: int) -> int:
+        """
+        Process one item and record its outcome
+
+        Returns:
+            The HTTP status the item would have been answered with
+        """
+        try:
+            request = SummaryRequest.model_validate_json(payload)
+            result = await self.processor.process(request, priority=Priority.BULK)
+        except (AdmissionRejectedException, RateLimitError) as e:
+            retry_after = getattr(e, "retry_after", 1)
+            self.pacer.on_throttled(retry_after)
+            if attempts + 1 < MAX_ATTEMPTS:
+                logger.warning(f"Batch job {self.job_id} item {idx} throttled, retrying")
+                self.store.mark_item(self.job_id, idx, ITEM_PENDING)
+                queue.put_nowait((idx, payload, attempts + 1))
+            else:
+                self.store.mark_item(self.job_id, idx, ITEM_ERROR, error=str(e))
+            return 429
+        except Exception as e:
+            logger.error(f"Batch job {self.job_id} item {idx} failed: {e}")
+            self.store.mark_item(self.job_id, idx, ITEM_ERROR, error=str(e))
+            return 500
+
+        self.pacer.on_success()
+        self.store.mark_item(self.job_id, idx, ITEM_DONE, result=result.model_dump())
+        return 200
+
+
+def start_batch_job(job_id: str) -> bool:
+    """
+    Run a batch job in the background unless it is already running, here or
+    on another worker sharing the job store
+
+    Returns:
+        Whether this worker runs the job
+    """
+    if job_id in _running_jobs:
+        return True
+    if not get_job_store().claim_job(job_id):
+        return False
+    task = asyncio.create_task(BatchProcessor(job_id).run())
+    _running_jobs[job_id] = task
+    task.add_done_callback(lambda _: _running_jobs.pop(job_id, None))
+    return True
+
+
+def resume_unfinished_jobs() -> int:
+    """
+    Restart the unfinished jobs no live worker holds: ones interrupted when the
+    bridge last stopped, or whose worker stopped renewing its lease
+
+    Returns:
+        Number of jobs resumed
+    """
+    resumed = 0
+    for job in get_job_store().unfinished_jobs():
+        if job["job_id"] in _running_jobs:
+            continue
+        if start_batch_job(job["job_id"]):
+            logger.info(f"Resumed batch job {job['job_id']}")
+            resumed += 1
+    return resumed
+
+
+async def watch_unfinished_jobs() -> None:
+    """
+    Resume unfinished jobs at startup and whenever a lease runs out, so the job
+    of a worker that died is taken over by one of the others
+    """
+    while True:
+        try:
+            resumed = resume_unfinished_jobs()
+            if resumed:
+                logger.info(f"Resumed {resumed} batch job(s)")
+        except Exception as e:
+            logger.error(f"Error resuming batch jobs: {e}")
+        await asyncio.sleep(lease_seconds())
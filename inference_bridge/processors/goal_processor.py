@@ -1,43 +1,139 @@
 # inference_bridge/processors/goal_processor.py
 from datetime import datetime
-from inference_bridge.client.openai_client import OpenAIClient
+from typing import Optional
+from inference_bridge.analytics.feasibility import assess_goal_feasibility, parse_deadline
+from inference_bridge.client.cached_client import CachedClient
+from inference_bridge.utils.admission import Priority
+from inference_bridge.utils.telemetry import annotate, span
 from inference_bridge.prompt_builder.prompt_builder import PromptBuilder
 from inference_bridge.data.request.goal_request import GoalPlanningRequest
-from inference_bridge.data.response.goal_response import GoalPlanningResponse
+from inference_bridge.data.response.goal_response import GoalFeasibility, GoalGenResponse, GoalPlanningResponse
 import logging
+import json
+import os
 
 logger = logging.getLogger(__name__)
 
+def skip_model_above() -> float:
+    """
+    Simulated feasibility probability from which a goal gets a local plan
+    without a model call, from GOAL_SKIP_MODEL_ABOVE (above 1 disables it)
+    """
+    return float(os.getenv("GOAL_SKIP_MODEL_ABOVE", "0.95"))
+
+def skip_model_below() -> float:
+    """
+    Simulated feasibility probability under which a goal gets a local plan
+    without a model call, from GOAL_SKIP_MODEL_BELOW (0 disables it)
+    """
+    return float(os.getenv("GOAL_SKIP_MODEL_BELOW", "0.05"))
+
+def needs_model(probability: float) -> bool:
+    """
+    Whether a goal's plan is worth a model call: clearly feasible goals need
+    no advice on what to cut, clearly infeasible ones get the same advice
+    whatever the model writes
+    """
+    return skip_model_below() <= probability < skip_model_above()
+
 class GoalProcessor:
     def __init__(self):
-        self.openai_client = OpenAIClient()
+        self.client = CachedClient()
     
-    async def process(self, request: GoalPlanningRequest):
+    async def process(self, request: GoalPlanningRequest, bypass_cache: bool = False,
+                      priority: Priority = Priority.INTERACTIVE, deadline: Optional[float] = None) -> GoalPlanningResponse:
         """
         Process a goal planning request
         
         Args:
             request: Goal planning request data
+            bypass_cache: Ignore any cached plan and generate a new one
+            priority: Scheduling class of the upstream call
+            deadline: time.monotonic() value the plan has to be ready by
             
         Returns:
             Goal planning response with AI-generated plan
         """
         try:
+            # Accept both raw transactions (v1) and pre-aggregated spending (v2)
+            spending = request.spending
+            
+            # Feasibility is simulated here rather than left for the model to judge
+            with span("feasibility"):
+                feasibility = assess_goal_feasibility(
+                    target_amount=request.target_amount,
+                    deadline=request.deadline,
+                    user_income=request.user_income,
+                    spending=spending,
+                    monthly_net_flows=request.monthly_net_flows
+                )
+            is_realistic = feasibility.probability >= 0.5
+            
+            # A clearly feasible or clearly infeasible goal gets a local plan
+            if not needs_model(feasibility.probability):
+                annotate(model_call="skipped")
+                return GoalPlanningResponse(
+                    plan=self.local_plan(request.target_amount, request.deadline, feasibility),
+                    is_realistic=is_realistic,
+                    feasibility=feasibility
+                )
+            
             # Build prompt using the PromptBuilder
-            prompt = PromptBuilder.build_goal_planning_prompt(
-                goal_description=request.goal_description,
-                target_amount=request.target_amount,
-                deadline=request.deadline,
-                user_income=request.user_income,
-                transactions=request.transactions,
-                priority=request.priority
-            )
+            with span("prompt_build"):
+                prompt = PromptBuilder.build_goal_planning_prompt(
+                    goal_description=request.goal_description,
+                    target_amount=request.target_amount,
+                    deadline=request.deadline,
+                    user_income=request.user_income,
+                    transactions=spending.top_transactions,
+                    priority=request.priority,
+                    category_totals=spending.totals_by_category(),
+                    category_counts=spending.counts_by_category(),
+                    transaction_count=spending.transaction_count,
+                    feasibility=feasibility,
+                    recurring=request.recurring
+                )
+            logger.info(f"Built goal planning prompt ({PromptBuilder.count_tokens(prompt)} tokens)")
             
             # Generate AI response
-            plan = self.openai_client.generate_text(prompt,response_format = GoalPlanningResponse)
+            plan = await self.client.generate_text(
+                prompt,
+                response_format=GoalGenResponse,
+                bypass_cache=bypass_cache,
+                priority=priority,
+                deadline=deadline
+            )
+            with span("parse"):
+                plan = json.loads(plan)["plan"]
 
-            return plan
+            return GoalPlanningResponse(plan=plan, is_realistic=is_realistic, feasibility=feasibility)
         
         except Exception as e:
             logger.error(f"Error processing goal planning request: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    @staticmethod
+    def local_plan(target_amount: float, deadline: str, feasibility: GoalFeasibility) -> str:
+        """
+        Plan text written from the simulation alone, for goals that need no model call
+        """
+        deadline_date = parse_deadline(deadline)
+        if feasibility.probability < 0.5:
+            return (
+                f"This goal looks challenging based on your finances. Reaching ${target_amount:.2f} by "
+                f"{deadline_date.strftime('%B %d, %Y')} takes about ${feasibility.required_monthly_savings:.2f} "
+                f"a month, while about ${max(feasibility.expected_monthly_savings, 0):.2f} is available. "
+                "Consider cutting back on your largest expenses or extending the deadline."
+            )
+        plan = (
+            f"This goal appears achievable based on your finances. Setting aside about "
+            f"${feasibility.required_monthly_savings:.2f} a month reaches ${target_amount:.2f} "
+            f"by {deadline_date.strftime('%B %d, %Y')}"
+        )
+        if feasibility.expected_completion_date:
+            completion = datetime.fromisoformat(feasibility.expected_completion_date)
+            plan += (
+                f", and at your current pace of about ${feasibility.expected_monthly_savings:.2f} a month "
+                f"you could get there around {completion.strftime('%B %Y')}"
+            )
+        return plan + ". Move the amount to savings right after payday so it does not get spent."
@@ -0,0 +1,113 @@
+# inference_bridge/processors/multi_goal_processor.py
+from typing import Optional
+from inference_bridge.analytics.allocation import plan_goal_allocations
+from inference_bridge.client.cached_client import CachedClient
+from inference_bridge.processors.goal_processor import GoalProcessor, needs_model
+from inference_bridge.utils.admission import Priority
+from inference_bridge.utils.telemetry import annotate, span
+from inference_bridge.prompt_builder.prompt_builder import PromptBuilder
+from inference_bridge.data.request.multi_goal_request import MultiGoalPlanningRequest
+from inference_bridge.data.response.multi_goal_response import GoalPlanItem, MultiGoalGenResponse, MultiGoalPlanningResponse
+import logging
+import json
+
+logger = logging.getLogger(__name__)
+
+class MultiGoalProcessor:
+    def __init__(self):
+        self.client = CachedClient()
+    
+    async def process(self, request: MultiGoalPlanningRequest, bypass_cache: bool = False,
+                      priority: Priority = Priority.INTERACTIVE,
+                      deadline: Optional[float] = None) -> MultiGoalPlanningResponse:
+        """
+        Plan all of a user's goals together: allocate the monthly savings across
+        them, simulate each goal on its share, then write every plan that needs
+        the model in a single call
+        
+        Args:
+            request: Multi-goal planning request data
+            bypass_cache: Ignore any cached plans and generate new ones
+            priority: Scheduling class of the upstream call
+            deadline: time.monotonic() value the plans have to be ready by
+            
+        Returns:
+            The plan, allocation and feasibility of every goal
+        """
+        try:
+            # Accept both raw transactions (v1) and pre-aggregated spending (v2)
+            spending = request.spending
+            
+            with span("feasibility"):
+                feasibilities, unallocated_savings = plan_goal_allocations(
+                    goals=request.goals,
+                    user_income=request.user_income,
+                    spending=spending,
+                    monthly_net_flows=request.monthly_net_flows
+                )
+            annotate(goals=len(request.goals))
+            
+            # Clearly feasible and clearly infeasible goals get a local plan, the rest share one model call
+            pending = [
+                (goal, feasibility) for goal, feasibility in zip(request.goals, feasibilities)
+                if needs_model(feasibility.probability)
+            ]
+            plans, listed_ids = {}, []
+            if pending:
+                with span("prompt_build"):
+                    prompt, listed_ids = PromptBuilder.build_multi_goal_planning_prompt(
+                        goals=[goal for goal, _ in pending],
+                        feasibilities=[feasibility for _, feasibility in pending],
+                        user_income=request.user_income,
+                        transactions=spending.top_transactions,
+                        category_totals=spending.totals_by_category(),
+                        category_counts=spending.counts_by_category(),
+                        transaction_count=spending.transaction_count,
+                        unallocated_savings=unallocated_savings,
+                        recurring=request.recurring
+                    )
+                logger.info(
+                    f"Built multi-goal planning prompt for {len(listed_ids)} of {len(request.goals)} goals "
+                    f"({PromptBuilder.count_tokens(prompt)} tokens)"
+                )
+                if len(listed_ids) < len(pending):
+                    # Goals past the token budget get local plans, like goals the model leaves out
+                    annotate(goals_over_budget=len(pending) - len(listed_ids))
+            if listed_ids:
+                content = await self.client.generate_text(
+                    prompt,
+                    response_format=MultiGoalGenResponse,
+                    bypass_cache=bypass_cache,
+                    priority=priority,
+                    deadline=deadline
+                )
+                pending_ids = set(listed_ids)
+                with span("parse"):
+                    plans = {
+                        item["goal_id"]: item["plan"] for item in json.loads(content)["plans"]
+                        if item["goal_id"] in pending_ids
+                    }
+                
+                missing = [goal_id for goal_id in pending_ids if goal_id not in plans]
+                if missing:
+                    logger.warning(f"Model returned no plan for goals {missing}, using local plans")
+            else:
+                annotate(model_call="skipped")
+            
+            return MultiGoalPlanningResponse(
+                plans=[
+                    GoalPlanItem(
+                        goal_id=goal.goal_id,
+                        plan=plans.get(goal.goal_id) or GoalProcessor.local_plan(goal.target_amount, goal.deadline, feasibility),
+                        is_realistic=feasibility.probability >= 0.5,
+                        monthly_allocation=feasibility.expected_monthly_savings,
+                        feasibility=feasibility
+                    )
+                    for goal, feasibility in zip(request.goals, feasibilities)
+                ],
+                unallocated_savings=unallocated_savings
+            )
+        
+        except Exception as e:
+            logger.error(f"Error processing multi-goal planning request: {e}")
+            raise
@@ -1,9 +1,12 @@
 # inference_bridge/processors/summary_processor.py
-from collections import defaultdict
-from inference_bridge.client.openai_client import OpenAIClient
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from inference_bridge.analytics.anomaly import find_spending_anomalies
+from inference_bridge.client.cached_client import CachedClient
+from inference_bridge.utils.admission import Priority
+from inference_bridge.utils.telemetry import span
 from inference_bridge.prompt_builder.prompt_builder import PromptBuilder
 from inference_bridge.data.request.summary_request import SummaryRequest
-from inference_bridge.data.response.summary_response import SummaryResponse
+from inference_bridge.data.response.summary_response import CategoryAnomaly, SummaryResponse
 from inference_bridge.data.response.summary_response import SummaryGenResponse
 import logging
 import json
@@ -12,56 +15,129 @@ logger = logging.getLogger(__name__)
 
 class SummaryProcessor:
     def __init__(self):
-        self.openai_client = OpenAIClient()
+        self.client = CachedClient()
     
-    async def process(self, request: SummaryRequest) -> SummaryResponse:
+    async def process(self, request: SummaryRequest, bypass_cache: bool = False,
+                      priority: Priority = Priority.INTERACTIVE, deadline: Optional[float] = None) -> SummaryResponse:
         """
         Process a monthly summary request
         
         Args:
             request: Monthly summary request data
+            bypass_cache: Ignore any cached summary and generate a new one
+            priority: Scheduling class of the upstream call
+            deadline: time.monotonic() value the summary has to be ready by
             
         Returns:
             Monthly summary response with AI-generated insights
         """
         try:
-            # Calculate totals by category
-            category_totals = defaultdict(float)
-            for transaction in request.transactions:
-                category_totals[transaction.category] += transaction.amount
-            
-            # Convert to regular dict for JSON serialization
-            top_categories = dict(category_totals)
-            
-            # Calculate total spending
-            total_spending = sum(transaction.amount for transaction in request.transactions)
-            
-            # Determine if under or over budget
-            budget_status = "Under Budget" if total_spending < request.income else "Over Budget"
-            
-            # Build prompt using the PromptBuilder
-            prompt = PromptBuilder.build_monthly_summary_prompt(
-                month=request.month,
-                year=request.year,
-                income=request.income,
-                total_spending=total_spending,
-                budget_status=budget_status,
-                category_totals=top_categories,
-                transactions=request.transactions
-            )
+            top_categories, total_spending, budget_status, anomalies = self.aggregate(request)
+            prompt = self.build_prompt(request, top_categories, total_spending, budget_status, anomalies)
             
             # Generate AI response
-            summary = self.openai_client.generate_text(prompt, response_format=SummaryGenResponse)
-            summary = json.loads(summary)
-            summary = summary["summary"]
+            summary = await self.client.generate_text(
+                prompt,
+                response_format=SummaryGenResponse,
+                bypass_cache=bypass_cache,
+                priority=priority,
+                deadline=deadline
+            )
+            with span("parse"):
+                summary = json.loads(summary)
+                summary = summary["summary"]
             # Return the response
             return SummaryResponse(
                 summary=summary,
                 top_categories=top_categories,
                 total_spending=total_spending,
-                budget_status=budget_status
+                budget_status=budget_status,
+                anomalies=anomalies or []
             )
         
         except Exception as e:
             logger.error(f"Error processing monthly summary request: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    async def stream(self, request: SummaryRequest, bypass_cache: bool = False,
+                     priority: Priority = Priority.INTERACTIVE,
+                     deadline: Optional[float] = None) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Process a monthly summary request, streaming the AI summary as it is generated
+        
+        Args:
+            request: Monthly summary request data
+            bypass_cache: Ignore any cached summary and generate a new one
+            priority: Scheduling class of the upstream call
+            deadline: time.monotonic() value the first token has to arrive by
+            
+        Yields:
+            (event, data) pairs: one "meta" event with the deterministic fields,
+            "token" events with summary text deltas, then a "done" event
+        """
+        top_categories, total_spending, budget_status, anomalies = self.aggregate(request)
+        
+        # The deterministic fields are known before the model produces anything
+        yield "meta", {
+            "top_categories": top_categories,
+            "total_spending": total_spending,
+            "budget_status": budget_status,
+            "anomalies": [anomaly.model_dump() for anomaly in anomalies or []]
+        }
+        
+        prompt = self.build_prompt(request, top_categories, total_spending, budget_status, anomalies)
+        parts = []
+        async for delta in self.client.stream_text(
+            prompt, bypass_cache=bypass_cache, priority=priority, deadline=deadline
+        ):
+            parts.append(delta)
+            yield "token", {"text": delta}
+        
+        yield "done", {"summary": "".join(parts)}
+
+    @staticmethod
+    def aggregate(request: SummaryRequest) -> Tuple[Dict[str, float], float, str, Optional[List[CategoryAnomaly]]]:
+        """
+        Compute the deterministic part of a summary
+        
+        Args:
+            request: Monthly summary request data
+            
+        Returns:
+            Spending by category, total spending, budget status and the categories
+            with unusually high spending (None without enough history)
+        """
+        # Accept both raw transactions (v1) and pre-aggregated spending (v2)
+        spending = request.spending
+        top_categories = spending.totals_by_category()
+        total_spending = spending.total_spending
+        
+        # Determine if under or over budget
+        budget_status = "Under Budget" if total_spending < request.income else "Over Budget"
+        
+        # Unusual categories are computed here rather than left for the model to guess
+        with span("anomaly_detection"):
+            anomalies = find_spending_anomalies(top_categories, request.history)
+        
+        return top_categories, total_spending, budget_status, anomalies
+
+    @staticmethod
+    def build_prompt(request: SummaryRequest, top_categories: Dict[str, float],
+                     total_spending: float, budget_status: str,
+                     anomalies: Optional[List[CategoryAnomaly]] = None) -> str:
+        # Build prompt using the PromptBuilder
+        with span("prompt_build"):
+            prompt = PromptBuilder.build_monthly_summary_prompt(
+                month=request.month,
+                year=request.year,
+                income=request.income,
+                total_spending=total_spending,
+                budget_status=budget_status,
+                category_totals=top_categories,
+                transactions=request.spending.top_transactions,
+                transaction_count=request.spending.transaction_count,
+                anomalies=anomalies,
+                history_months=len(request.history.months) if request.history else 0
+            )
+        logger.info(f"Built monthly summary prompt ({PromptBuilder.count_tokens(prompt)} tokens)")
+        return prompt
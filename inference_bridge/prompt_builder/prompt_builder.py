@@ -1,9 +1,153 @@
 # inference_bridge/prompt_builder/prompt_builder.py
+from collections import defaultdict
+import heapq
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from inference_bridge.analytics.feasibility import months_until, parse_deadline
+from .token_counter import count_tokens, default_prompt_budget
+
+# Goal descriptions are user text of any length, cut to this many characters
+MAX_GOAL_DESCRIPTION_CHARS = 120
+
+
+def _field(transaction: Any, name: str, default: Any) -> Any:
+    # Handle both dictionary and object formats
+    if isinstance(transaction, dict):
+        value = transaction.get(name, default)
+    else:
+        value = getattr(transaction, name, default)
+    return default if value is None else value
+
+
+def _goal_description(goal_description: str) -> str:
+    goal_description = " ".join(goal_description.split())
+    if len(goal_description) <= MAX_GOAL_DESCRIPTION_CHARS:
+        return goal_description
+    return goal_description[:MAX_GOAL_DESCRIPTION_CHARS - 3].rstrip() + "..."
+
+
+def _transaction_line(transaction: Any) -> str:
+    amount = _field(transaction, "amount", 0)
+    category = _field(transaction, "category", "Uncategorized")
+    date = _field(transaction, "date", "")[:10]
+    description = _field(transaction, "description", "No description")
+    return f"- ${amount:.2f} on {category} ({date}): {description}"
+
+
+def _category_lines(category_totals: Dict, total_spending: float, category_counts: Optional[Dict] = None,
+                    max_categories: int = 5) -> List[str]:
+    """
+    One line per category, largest first, with the tail folded into "Other categories"
+    """
+    sorted_categories = sorted(category_totals.items(), key=lambda x: x[1], reverse=True)
+
+    lines = []
+    for category, amount in sorted_categories[:max_categories]:
+        percentage = (amount / total_spending * 100) if total_spending > 0 else 0
+        count = f", {category_counts[category]} transactions" if category_counts else ""
+        lines.append(f"- {category}: ${amount:.2f} ({percentage:.1f}%{count})")
+
+    if len(sorted_categories) > max_categories:
+        other_amount = sum(amount for _, amount in sorted_categories[max_categories:])
+        other_percentage = (other_amount / total_spending * 100) if total_spending > 0 else 0
+        lines.append(f"- Other categories: ${other_amount:.2f} ({other_percentage:.1f}%)")
+    return lines
+
+
+def _recurring_section(recurring: Any, max_charges: int = 5, indent: str = "    ") -> str:
+    """
+    The fixed/discretionary split of the user's spending with the largest
+    recurring charges, as a prompt section; empty without recurring data
+    """
+    if recurring is None:
+        return ""
+    charges = _field(recurring, "charges", [])
+    lines = [
+        "FIXED AND DISCRETIONARY SPENDING (recurring charges found in the user's history):",
+        f"- Fixed monthly obligations: ${_field(recurring, 'fixed_monthly', 0):.2f} across {len(charges)} recurring charges",
+        f"- Discretionary spending: about ${_field(recurring, 'discretionary_monthly', 0):.2f} per month",
+    ]
+    for charge in charges[:max_charges]:
+        period = _field(charge, "period", "monthly")
+        monthly = "" if period == "monthly" else f" (${_field(charge, 'monthly_amount', 0):.2f} a month)"
+        lines.append(
+            f"- {_field(charge, 'description', '')} ({_field(charge, 'category', 'Other')}): "
+            f"${_field(charge, 'amount', 0):.2f} {period}{monthly}"
+        )
+    if len(charges) > max_charges:
+        lines.append(f"- ... and {len(charges) - max_charges} more recurring charges")
+    lines.append("- Suggest cuts to discretionary spending or subscriptions that can be cancelled, not to fixed bills")
+    return "\n" + "\n".join(indent + line for line in lines) + "\n"
+
+
+def _sample_transactions(transactions: List, category_totals: Dict, limit: int) -> List:
+    """
+    Pick the limit transactions that tell the model the most: the largest
+    transaction of each category (biggest categories first), then the largest
+    of the remaining ones
+    """
+    by_category = defaultdict(list)
+    for t in transactions:
+        by_category[_field(t, "category", "Uncategorized")].append(t)
+
+    amount = lambda t: _field(t, "amount", 0)
+    categories = sorted(by_category, key=lambda c: category_totals.get(c, 0), reverse=True)[:limit]
+    leaders = [max(by_category[c], key=amount) for c in categories]
+    chosen = set(map(id, leaders))
+    rest = heapq.nlargest(
+        limit - len(leaders), (t for t in transactions if id(t) not in chosen), key=amount
+    )
+    return leaders + rest
+
+
+def _fit_lines(lines: List[str], budget: int) -> Tuple[List[str], int]:
+    """
+    Keep leading lines while they fit in budget tokens
+
+    Returns:
+        The kept lines and the tokens they use
+    """
+    kept, used = [], 0
+    for line in lines:
+        cost = count_tokens(line + "\n")
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+    return kept, used
+
+
+def _fit_sections(base_prompt: str, category_lines: List[str], transaction_lines: List[str],
+                  total_transactions: int, max_tokens: int, indent: str = "") -> Tuple[str, str]:
+    """
+    Fill the category breakdown, then the sample transactions, into whatever the
+    fixed part of the prompt leaves of the token budget
+    """
+    category_lines = [indent + line for line in category_lines]
+    transaction_lines = [indent + line for line in transaction_lines]
+
+    # Reserve room for the "... and N more" line, which is added whatever else fits
+    more_line_cost = count_tokens(f"{indent}- ... and {total_transactions} more transactions\n")
+    remaining = max_tokens - count_tokens(base_prompt) - more_line_cost
+    categories, used = _fit_lines(category_lines, remaining)
+    remaining -= used
+
+    samples, _ = _fit_lines(transaction_lines, remaining)
+    if total_transactions > len(samples):
+        samples.append(f"{indent}- ... and {total_transactions - len(samples)} more transactions")
+
+    return "\n".join(categories), "\n".join(samples)
 
 
 class PromptBuilder:
+    @staticmethod
+    def count_tokens(prompt: str) -> int:
+        """
+        Count the tokens of a built prompt with the local tokenizer
+        """
+        return count_tokens(prompt)
+
     @staticmethod
     def build_goal_planning_prompt(
         goal_description: str,
@@ -12,54 +156,106 @@ class PromptBuilder:
         user_income: float,
         transactions: List,
         priority: Optional[int] = 0,
+        max_tokens: Optional[int] = None,
+        category_totals: Optional[Dict] = None,
+        category_counts: Optional[Dict] = None,
+        transaction_count: Optional[int] = None,
+        feasibility: Optional[Any] = None,
+        recurring: Optional[Any] = None,
     ) -> str:
         """
         Build a prompt for financial goal planning.
 
+        Transactions are condensed into spending aggregates plus a sample of the
+        most informative transactions, sized so the whole prompt fits max_tokens
+        no matter how many transactions the user has.
+
         Args:
             goal_description: Description of the financial goal
             target_amount: Amount to save
             deadline: Deadline date in ISO format
             user_income: Monthly income
-            transactions: List of transaction data for previous 2 months
+            transactions: List of transaction data for previous 2 months, or a
+                sample of it when the aggregates below are given
             priority: Priority level of the goal (0-5, with 5 being highest)
+            max_tokens: Token budget for the prompt, defaults to PROMPT_TOKEN_BUDGET
+            category_totals: Precomputed spending by category
+            category_counts: Precomputed transaction count by category
+            transaction_count: Total number of transactions in the window
+            feasibility: Simulated feasibility of the goal, which the plan is
+                told to follow; None leaves the assessment to the model
+            recurring: Fixed monthly obligations and discretionary spending
+                found in the user's history, so the plan cuts the right things
 
         Returns:
             Formatted prompt for the language model
         """
-        # Parse the deadline
-        deadline_date = datetime.fromisoformat(deadline.replace("Z", "+00:00"))
-        current_date = datetime.now()
-
-        # Calculate months remaining until deadline
-        months_remaining = (
-            (deadline_date.year - current_date.year) * 12
-            + deadline_date.month
-            - current_date.month
-        )
+        max_tokens = max_tokens or default_prompt_budget()
 
-        # Calculate required monthly savings
-        required_monthly_savings = (
-            target_amount / months_remaining if months_remaining > 0 else target_amount
-        )
+        # Months remaining counted in days, not calendar month numbers
+        deadline_date = parse_deadline(deadline)
+        months_remaining = months_until(deadline_date)
+
+        # The whole target is due within the month when less than one remains
+        required_monthly_savings = target_amount / max(months_remaining, 1.0)
 
         # Format priority
-        priority_text = "Not specified" if priority == 0 else f"{priority}/5"
+        priority_text = "Not specified" if not priority else f"{priority}/5"
+
+        # Aggregate the past 2 months of spending unless the caller already did
+        if category_totals is None:
+            category_totals = defaultdict(float)
+            category_counts = defaultdict(int)
+            for t in transactions:
+                category = _field(t, "category", "Uncategorized")
+                category_totals[category] += _field(t, "amount", 0)
+                category_counts[category] += 1
+        if transaction_count is None:
+            transaction_count = len(transactions)
+        total_spending = sum(category_totals.values())
+        monthly_spending = total_spending / 2
+
+        category_lines = _category_lines(category_totals, total_spending, category_counts, max_categories=8)
+        transaction_lines = [
+            _transaction_line(t) for t in _sample_transactions(transactions, category_totals, limit=10)
+        ]
+
+        # The feasibility verdict is stated as a fact when it was simulated
+        if feasibility is None:
+            feasibility_line = ""
+            assessment_instruction = "First assess if the goal is realistically achievable given the user's financial situation"
+            verdict = "[achievable/challenging]"
+        else:
+            probability = _field(feasibility, "probability", 0)
+            completion_date = _field(feasibility, "expected_completion_date", None)
+            completion = (
+                f"reached around {datetime.fromisoformat(completion_date).strftime('%B %Y')} at the current rate"
+                if completion_date else "not reached within 10 years at the current rate"
+            )
+            feasibility_line = f"\n    - Simulated chance of reaching the goal by the deadline: {probability:.0%} ({completion})"
+            verdict = "achievable" if probability >= 0.5 else "challenging"
+            assessment_instruction = f"The goal has already been assessed as {verdict} from a simulation of the user's savings, do not reassess it"
 
         # Create the prompt
-        prompt = f"""
+        template = """
     You are a helpful financial advisor creating a personalized savings plan. Here's the user's situation:
 
     GOAL ANALYSIS:
     - Goal: Save ${target_amount:.2f} for {goal_description}
-    - Deadline: {deadline_date.strftime('%B %d, %Y')} ({months_remaining} months remaining)
+    - Deadline: {deadline} ({months_remaining:.1f} months remaining)
     - Monthly income: ${user_income:.2f}
     - Required monthly savings to reach goal: ${required_monthly_savings:.2f}
     - Goal priority: {priority_text}
-    - User transactions for the past 2 months: {transactions} transactions
+    - Spending over the past 2 months: ${total_spending:.2f} across {transaction_count} transactions (about ${monthly_spending:.2f} per month){feasibility_line}
+{recurring_section}
+    SPENDING BY CATEGORY (past 2 months):
+{category_breakdown}
+
+    NOTABLE TRANSACTIONS:
+{transaction_summary}
 
     INSTRUCTIONS:
-    1. First assess if the goal is realistically achievable given the user's financial situation
+    1. {assessment_instruction}
     2. Create a concise savings plan (around 40 words) that helps them achieve this goal
     3. If the goal appears difficult to achieve, suggest specific, actionable adjustments (reducing specific expenses, extending timeline, etc.)
     4. Provide your response in a friendly, encouraging tone
@@ -75,12 +271,162 @@ class PromptBuilder:
     - Do not simply suggest "setting aside money each month" - provide specific strategies
 
     SAMPLE RESPONSE STRUCTURE:
-    "This goal appears [achievable/challenging] based on your finances. [Brief reason why]
+    "This goal appears {verdict} based on your finances. [Brief reason why]
 
     To reach your goal, I recommend: [specific savings strategy with actionable steps]
-    
+
     """
-        return prompt
+
+        def render(category_breakdown: str, transaction_summary: str) -> str:
+            return template.format(
+                target_amount=target_amount,
+                goal_description=_goal_description(goal_description),
+                deadline=deadline_date.strftime('%B %d, %Y'),
+                months_remaining=months_remaining,
+                user_income=user_income,
+                required_monthly_savings=required_monthly_savings,
+                priority_text=priority_text,
+                total_spending=total_spending,
+                transaction_count=transaction_count,
+                monthly_spending=monthly_spending,
+                feasibility_line=feasibility_line,
+                recurring_section=_recurring_section(recurring),
+                assessment_instruction=assessment_instruction,
+                verdict=verdict,
+                category_breakdown=category_breakdown,
+                transaction_summary=transaction_summary,
+            )
+
+        category_breakdown, transaction_summary = _fit_sections(
+            render("", ""), category_lines, transaction_lines, transaction_count, max_tokens, indent="    "
+        )
+        return render(category_breakdown, transaction_summary)
+
+    @staticmethod
+    def build_multi_goal_planning_prompt(
+        goals: List,
+        feasibilities: List,
+        user_income: float,
+        transactions: List,
+        category_totals: Dict,
+        category_counts: Optional[Dict] = None,
+        transaction_count: Optional[int] = None,
+        unallocated_savings: float = 0.0,
+        max_tokens: Optional[int] = None,
+        recurring: Optional[Any] = None,
+    ) -> Tuple[str, List]:
+        """
+        Build one prompt that asks for the savings plans of several goals at once.
+
+        Monthly savings have already been allocated across the goals and each
+        goal's feasibility simulated, so the model only writes the plan texts.
+        Goals are listed highest priority first, as many as fit the token
+        budget, with their descriptions shortened; the spending sections fill
+        what is left.
+
+        Args:
+            goals: The goals, each with goal_id, goal_description, target_amount,
+                deadline and priority
+            feasibilities: Simulated feasibility of each goal, parallel to goals,
+                whose expected_monthly_savings is the goal's allocation
+            user_income: Monthly income
+            transactions: A sample of the past 2 months of transactions
+            category_totals: Spending by category over the past 2 months
+            category_counts: Transaction count by category
+            transaction_count: Total number of transactions in the window
+            unallocated_savings: Expected monthly savings no goal needs
+            max_tokens: Token budget for the prompt, defaults to PROMPT_TOKEN_BUDGET
+            recurring: Fixed monthly obligations and discretionary spending
+                found in the user's history
+
+        Returns:
+            Formatted prompt for the language model and the IDs of the goals it
+            lists, the others need a plan from elsewhere
+        """
+        max_tokens = max_tokens or default_prompt_budget()
+        if transaction_count is None:
+            transaction_count = len(transactions)
+        total_spending = sum(category_totals.values())
+        monthly_spending = total_spending / 2
+
+        # Stable, so goals of equal priority keep the order they came in
+        ranked = sorted(zip(goals, feasibilities), key=lambda pair: -(_field(pair[0], "priority", 0)))
+        goal_lines = []
+        for goal, feasibility in ranked:
+            probability = _field(feasibility, "probability", 0)
+            priority = _field(goal, "priority", 0)
+            deadline = parse_deadline(_field(goal, "deadline", ""))
+            goal_lines.append(
+                f"- Goal {_field(goal, 'goal_id', 0)}: save ${_field(goal, 'target_amount', 0):.2f} for "
+                f"{_goal_description(_field(goal, 'goal_description', ''))} by {deadline.strftime('%B %d, %Y')} "
+                f"({_field(feasibility, 'months_remaining', 0):.1f} months), "
+                f"priority {f'{priority}/5' if priority else 'not specified'}: "
+                f"${_field(feasibility, 'expected_monthly_savings', 0):.2f} a month allocated of "
+                f"${_field(feasibility, 'required_monthly_savings', 0):.2f} needed, "
+                f"{probability:.0%} simulated chance, {'achievable' if probability >= 0.5 else 'challenging'}"
+            )
+
+        category_lines = _category_lines(category_totals, total_spending, category_counts, max_categories=8)
+        transaction_lines = [
+            _transaction_line(t) for t in _sample_transactions(transactions, category_totals, limit=10)
+        ]
+
+        # Create the prompt
+        template = """
+    You are a helpful financial advisor creating personalized savings plans for several goals that compete for the same income. Here's the user's situation:
+
+    FINANCES:
+    - Monthly income: ${user_income:.2f}
+    - Spending over the past 2 months: ${total_spending:.2f} across {transaction_count} transactions (about ${monthly_spending:.2f} per month)
+    - Savings left over each month after the allocations below: ${unallocated_savings:.2f}
+{recurring_section}
+    GOALS (monthly savings already allocated by priority and deadline, feasibility simulated from past months):
+{goal_lines}
+
+    SPENDING BY CATEGORY (past 2 months):
+{category_breakdown}
+
+    NOTABLE TRANSACTIONS:
+{transaction_summary}
+
+    INSTRUCTIONS:
+    1. Write one concise savings plan (around 40 words) for every goal listed above, labelled with its goal ID
+    2. Base each plan on the goal's allocated monthly amount and state its assessment as given, do not reassess it
+    3. For challenging goals, suggest specific, actionable adjustments (reducing specific expenses, extending the timeline, shifting savings from a lower-priority goal, etc.)
+    4. For achievable goals, you can skip the recommendation and focus on encouragement
+    5. Use "you" instead of "the user" to make the response personal
+
+    FORMAT:
+    - Use plain text only in each plan (no markdown or special formatting)
+    - Begin each plan with a brief assessment of feasibility
+    - Do not simply suggest "setting aside money each month" - provide specific strategies
+    """
+
+        def render(listed_goals: List[str], category_breakdown: str, transaction_summary: str) -> str:
+            return template.format(
+                user_income=user_income,
+                total_spending=total_spending,
+                transaction_count=transaction_count,
+                monthly_spending=monthly_spending,
+                unallocated_savings=unallocated_savings,
+                recurring_section=_recurring_section(recurring),
+                goal_lines="\n".join(listed_goals),
+                category_breakdown=category_breakdown,
+                transaction_summary=transaction_summary,
+            )
+
+        # Goals come before the spending sections, which get what they leave,
+        # less the "... and N more transactions" line that is always added
+        more_line_cost = count_tokens(f"    - ... and {transaction_count} more transactions\n")
+        listed_goals, _ = _fit_lines(
+            ["    " + line for line in goal_lines], max_tokens - count_tokens(render([], "", "")) - more_line_cost
+        )
+        listed_ids = [_field(goal, "goal_id", 0) for goal, _ in ranked[:len(listed_goals)]]
+
+        category_breakdown, transaction_summary = _fit_sections(
+            render(listed_goals, "", ""), category_lines, transaction_lines, transaction_count, max_tokens, indent="    "
+        )
+        return render(listed_goals, category_breakdown, transaction_summary), listed_ids
 
     @staticmethod
     def build_monthly_summary_prompt(
@@ -90,11 +436,15 @@ class PromptBuilder:
         total_spending: float,
         budget_status: str,
         category_totals: Dict,
-        transactions: List
+        transactions: List,
+        max_tokens: Optional[int] = None,
+        transaction_count: Optional[int] = None,
+        anomalies: Optional[List] = None,
+        history_months: int = 0,
     ) -> str:
         """
         Build a prompt for monthly financial summary analysis.
-        
+
         Args:
             month: Month number (1-12)
             year: Year
@@ -102,58 +452,58 @@ class PromptBuilder:
             total_spending: Total spending for the period
             budget_status: Under or over budget
             category_totals: Spending totals by category
-            transactions: List of transaction data
-            
+            transactions: List of transaction data, or a sample of it
+            max_tokens: Token budget for the prompt, defaults to PROMPT_TOKEN_BUDGET
+            transaction_count: Total number of transactions, if transactions is a sample
+            anomalies: Categories already found to be unusually high, None when
+                there was not enough history and the model has to judge itself
+            history_months: Number of past months the anomalies were judged against
+
         Returns:
             Formatted prompt for the language model
         """
+        max_tokens = max_tokens or default_prompt_budget()
+        if transaction_count is None:
+            transaction_count = len(transactions)
+
         # Get month name
         month_names = [
             "January", "February", "March", "April", "May", "June",
             "July", "August", "September", "October", "November", "December"
         ]
         month_name = month_names[month - 1]
-        
+
         # Calculate savings and spending percentage
         savings = income - total_spending
         spending_pct = (total_spending / income * 100) if income > 0 else 0
-        
-        # Format transaction data for the prompt
-        transaction_summary = ""
-        for i, t in enumerate(transactions[:5]):  # Limit to 5 transactions
-            # Handle both dictionary and object formats
-            if isinstance(t, dict):
-                amount = t.get('amount', 0)
-                category = t.get('category', 'Uncategorized')
-                date = t.get('date', '')[:10]
-                description = t.get('description', 'No description')
-            else:
-                amount = getattr(t, 'amount', 0)
-                category = getattr(t, 'category', 'Uncategorized')
-                date = getattr(t, 'date', '')[:10]
-                description = getattr(t, 'description', 'No description')
-                
-            transaction_summary += f"- ${amount:.2f} on {category} ({date}): {description}\n"
-            
-        if len(transactions) > 5:
-            transaction_summary += f"- ... and {len(transactions) - 5} more transactions"
-            
-        # Create category breakdown for prompt (top 5 categories)
-        sorted_categories = sorted(category_totals.items(), key=lambda x: x[1], reverse=True)
-        top_categories = sorted_categories[:5]
-        
-        category_breakdown = ""
-        for category, amount in top_categories:
-            percentage = (amount / total_spending * 100) if total_spending > 0 else 0
-            category_breakdown += f"- {category}: ${amount:.2f} ({percentage:.1f}%)\n"
-            
-        if len(category_totals) > 5:
-            other_amount = sum(amount for _, amount in sorted_categories[5:])
-            other_percentage = (other_amount / total_spending * 100) if total_spending > 0 else 0
-            category_breakdown += f"- Other categories: ${other_amount:.2f} ({other_percentage:.1f}%)\n"
-        
+
+        # Unusual spending is stated as a fact when it could be computed
+        if anomalies is None:
+            anomaly_section = ""
+            anomaly_instruction = "Identification of 1-2 categories with unusually high spending"
+        else:
+            anomaly_lines = [
+                f"- {_field(a, 'category', '')}: ${_field(a, 'amount', 0):.2f} "
+                f"vs a typical ${_field(a, 'baseline', 0):.2f}"
+                for a in anomalies
+            ] or ["- None, every category is in line with previous months"]
+            anomaly_section = (
+                f"\nUNUSUALLY HIGH SPENDING (compared with the previous {history_months} months):\n"
+                + "\n".join(anomaly_lines) + "\n"
+            )
+            anomaly_instruction = (
+                "A comment on the unusually high spending listed above, if any "
+                "(do not call other categories unusual)"
+            )
+
+        # Top 5 categories and up to 5 sample transactions, as far as the budget allows
+        category_lines = _category_lines(category_totals, total_spending, max_categories=5)
+        transaction_lines = [
+            _transaction_line(t) for t in _sample_transactions(transactions, category_totals, limit=5)
+        ]
+
         # Create the prompt
-        prompt = f"""
+        template = """
 You are a personal financial advisor analyzing a monthly financial summary. Create a concise, personalized assessment based on this data:
 
 FINANCIAL SUMMARY: {month_name} {year}
@@ -164,14 +514,14 @@ FINANCIAL SUMMARY: {month_name} {year}
 
 TOP SPENDING CATEGORIES:
 {category_breakdown}
-
+{anomaly_section}
 SAMPLE TRANSACTIONS:
 {transaction_summary}
 
 INSTRUCTIONS:
 Create a helpful financial analysis (maximum 75 words) with:
 1. A clear summary of the month's spending patterns
-2. Identification of 1-2 categories with unusually high spending
+2. {anomaly_instruction}
 3. 1-2 specific, actionable recommendations to improve financial health
 
 GUIDELINES:
@@ -187,4 +537,23 @@ RESPONSE STRUCTURE:
 - Identify key insights about spending patterns
 - Provide specific, actionable recommendations
 """
-        return prompt
\ No newline at end of file
+
+        def render(category_breakdown: str, transaction_summary: str) -> str:
+            return template.format(
+                month_name=month_name,
+                year=year,
+                income=income,
+                total_spending=total_spending,
+                spending_pct=spending_pct,
+                savings=savings,
+                budget_status=budget_status,
+                category_breakdown=category_breakdown,
+                anomaly_section=anomaly_section,
+                anomaly_instruction=anomaly_instruction,
+                transaction_summary=transaction_summary,
+            )
+
+        category_breakdown, transaction_summary = _fit_sections(
+            render("", ""), category_lines, transaction_lines, transaction_count, max_tokens
+        )
+        return render(category_breakdown, transaction_summary)
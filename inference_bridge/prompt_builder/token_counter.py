@@ -0,0 +1,44 @@
+# inference_bridge/prompt_builder/token_counter.py
+from functools import lru_cache
+import logging
+import math
+import os
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """
+    Load the tiktoken encoding once, or None to fall back to an estimate
+    (tiktoken not installed, or its BPE file cannot be fetched offline)
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(os.getenv("PROMPT_TOKEN_ENCODING", "o200k_base"))
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable, estimating token counts from length: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens text occupies in the model's context
+
+    Args:
+        text: Any prompt fragment
+
+    Returns:
+        Exact token count with tiktoken, otherwise roughly four characters per token
+    """
+    encoding = _encoding()
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def default_prompt_budget() -> int:
+    """
+    Token budget for a whole prompt, from PROMPT_TOKEN_BUDGET
+    """
+    return int(os.getenv("PROMPT_TOKEN_BUDGET", "1200"))
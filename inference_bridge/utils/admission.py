@@ -0,0 +1,212 @@
+# inference_bridge/utils/admission.py
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Optional
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import os
+import time
+
+from inference_bridge.exception.inference_exception import QueueFullException, QueueTimeoutException
+from inference_bridge.utils.telemetry import span
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """
+    Scheduling class of an upstream call, lower values are served first
+    """
+
+    INTERACTIVE = 0
+    BULK = 10
+
+    @classmethod
+    def from_header(cls, value: Optional[str]) -> "Priority":
+        if value and value.strip().lower() in ("bulk", "background", "batch"):
+            return cls.BULK
+        return cls.INTERACTIVE
+
+
+class AdmissionTicket:
+    """
+    Priority of one call that may have to wait for a slot.
+
+    Callers sharing the call raise it to their own priority, which moves the
+    call up the queue if it is still waiting there.
+    """
+
+    def __init__(self, priority: Priority = Priority.INTERACTIVE):
+        self.priority = priority
+        self._controller: Optional["AdmissionController"] = None
+        self._waiter: Optional[asyncio.Future] = None
+
+    def raise_to(self, priority: Priority) -> None:
+        if priority >= self.priority:
+            return
+        logger.info(f"Raising queued call from {self.priority.name} to {priority.name}")
+        self.priority = priority
+        if self._waiter is not None and not self._waiter.done():
+            self._controller._enqueue(priority, self._waiter)
+
+
+class AdmissionController:
+    """
+    Bounded concurrency limiter with a prioritized wait queue.
+
+    At most max_concurrency upstream calls run at once. Further calls wait in a
+    queue ordered by priority, then arrival. A call is shed with QueueFullException
+    when max_queue calls are already waiting, and with QueueTimeoutException when
+    it waited longer than its queue-wait deadline.
+    """
+
+    def __init__(self, max_concurrency: int = 8, max_queue: int = 64, max_queue_wait: float = 10.0):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self._active = 0
+        self._waiters = []
+        self._waiting = 0
+        self._sequence = itertools.count()
+        # Exponentially weighted service time, used to compute Retry-After
+        self._service_time = 1.0
+        self.admitted = 0
+        self.rejected_full = 0
+        self.rejected_timeout = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    def retry_after(self) -> int:
+        """
+        Estimate in seconds until the current queue has drained
+        """
+        backlog = (self._waiting + 1) / max(self.max_concurrency, 1)
+        return max(1, math.ceil(backlog * self._service_time))
+
+    async def acquire(
+        self, priority: Priority = Priority.INTERACTIVE, max_wait: Optional[float] = None,
+        ticket: Optional[AdmissionTicket] = None
+    ) -> None:
+        """
+        Wait for an upstream slot
+
+        Args:
+            priority: Scheduling class of the call
+            max_wait: Queue-wait deadline in seconds, defaults to max_queue_wait
+            ticket: Ticket of the call, its priority is used instead and can be raised while waiting
+        """
+        if ticket is not None:
+            priority = ticket.priority
+        started = time.monotonic()
+        if self._active < self.max_concurrency and self._waiting == 0:
+            self._active += 1
+            self._record_admission(started)
+            return
+
+        if self._waiting >= self.max_queue:
+            self.rejected_full += 1
+            logger.warning(f"Shedding {priority.name} request, queue depth {self._waiting}")
+            raise QueueFullException(retry_after=self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._enqueue(priority, waiter)
+        self._waiting += 1
+        if ticket is not None:
+            ticket._controller, ticket._waiter = self, waiter
+        timeout = self.max_queue_wait if max_wait is None else max(max_wait, 0.0)
+        try:
+            await asyncio.wait_for(waiter, timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up, pass it on
+                self.release()
+            else:
+                self._waiting -= 1
+            if isinstance(e, asyncio.TimeoutError):
+                self.rejected_timeout += 1
+                logger.warning(f"{priority.name} request timed out after {timeout:.1f}s in queue")
+                raise QueueTimeoutException(retry_after=self.retry_after()) from e
+            raise
+
+        self._record_admission(started)
+
+    def _enqueue(self, priority: Priority, waiter: asyncio.Future) -> None:
+        # A raised waiter is pushed again, release() skips the entry left behind once it is served
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+
+    def release(self, service_time: Optional[float] = None) -> None:
+        """
+        Return a slot, handing it straight to the highest-priority waiter if any
+
+        Args:
+            service_time: How long the finished call held its slot
+        """
+        if service_time is not None:
+            self._service_time = 0.8 * self._service_time + 0.2 * service_time
+
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                # Timed out or cancelled, already uncounted
+                continue
+            self._waiting -= 1
+            waiter.set_result(None)
+            return
+
+        self._active -= 1
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: Priority = Priority.INTERACTIVE, max_wait: Optional[float] = None,
+        ticket: Optional[AdmissionTicket] = None
+    ):
+        with span("queue_wait"):
+            await self.acquire(priority, max_wait, ticket)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - started)
+
+    def _record_admission(self, started: float) -> None:
+        waited = time.monotonic() - started
+        self.admitted += 1
+        self.wait_time_total += waited
+        self.wait_time_max = max(self.wait_time_max, waited)
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self._active,
+            "queue_depth": self._waiting,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_full,
+            "rejected_queue_timeout": self.rejected_timeout,
+            "wait_time_avg_seconds": self.wait_time_total / self.admitted if self.admitted else 0.0,
+            "wait_time_max_seconds": self.wait_time_max,
+        }
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    Return the process-wide admission controller configured from environment variables
+    """
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController(
+            max_concurrency=int(os.getenv("BRIDGE_MAX_CONCURRENCY", "8")),
+            max_queue=int(os.getenv("BRIDGE_MAX_QUEUE", "64")),
+            max_queue_wait=float(os.getenv("BRIDGE_MAX_QUEUE_WAIT_SECONDS", "10")),
+        )
+    return _admission_controller
@@ -0,0 +1,54 @@
+# inference_bridge/utils/deadline.py
+from typing import Optional
+import logging
+import os
+import time
+
+from inference_bridge.exception.inference_exception import DeadlineExceededException
+
+logger = logging.getLogger(__name__)
+
+
+def default_timeout() -> float:
+    """
+    Time budget in seconds of a request that does not send X-Request-Timeout-Ms
+    """
+    return float(os.getenv("BRIDGE_REQUEST_TIMEOUT_SECONDS", "30"))
+
+
+def deadline_from_header(timeout_ms: Optional[str]) -> float:
+    """
+    Turn the caller's remaining time budget into an absolute deadline
+
+    Args:
+        timeout_ms: X-Request-Timeout-Ms header value, milliseconds the caller
+            is still willing to wait. A relative budget is immune to clock skew
+            between the backend and the bridge.
+
+    Returns:
+        A time.monotonic() value the request has to be answered by
+    """
+    timeout = default_timeout()
+    if timeout_ms:
+        try:
+            timeout = max(float(timeout_ms), 0.0) / 1000
+        except ValueError:
+            logger.warning(f"Ignoring invalid X-Request-Timeout-Ms header: {timeout_ms!r}")
+    return time.monotonic() + timeout
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """
+    Seconds left until deadline, never negative, or None without a deadline
+    """
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def check_deadline(deadline: Optional[float]) -> None:
+    """
+    Raise DeadlineExceededException once deadline has passed
+    """
+    if deadline is not None and time.monotonic() >= deadline:
+        raise DeadlineExceededException()
@@ -0,0 +1,61 @@
+# inference_bridge/utils/gzip_request.py
+import gzip
+import zlib
+
+
+class GzipRequestMiddleware:
+    """
+    ASGI middleware that inflates request bodies sent with Content-Encoding: gzip,
+    so endpoints see plain JSON whichever way the client encoded it
+    """
+
+    def __init__(self, app, max_size: int = 16 * 1024 * 1024):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope["headers"])
+        if headers.get(b"content-encoding", b"").lower() != b"gzip":
+            return await self.app(scope, receive, send)
+
+        compressed = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            compressed.extend(message.get("body", b""))
+            more_body = message.get("more_body", False)
+
+        try:
+            # Bound the inflated size so a small body cannot expand without limit
+            inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            body = inflater.decompress(bytes(compressed), self.max_size)
+            if inflater.unconsumed_tail:
+                raise ValueError("Decompressed request body too large")
+        except (zlib.error, gzip.BadGzipFile, ValueError) as e:
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [(b"content-type", b"text/plain")],
+            })
+            await send({"type": "http.response.body", "body": f"Invalid gzip body: {e}".encode()})
+            return
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode())]
+
+        sent = False
+
+        async def inflated_receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, inflated_receive, send)
@@ -0,0 +1,120 @@
+# inference_bridge/utils/metrics.py
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+import threading
+
+from inference_bridge.utils.telemetry import RequestTrace
+
+# Upper bounds in seconds of the request duration histogram
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _labels(**labels: str) -> str:
+    # Sorted so equal label sets map to one series
+    return ",".join(f'{name}="{value}"' for name, value in sorted(labels.items()))
+
+
+class BridgeMetrics:
+    """
+    In-process counters, aggregated from finished request traces and rendered
+    in the Prometheus text exposition format
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[Tuple[str, int], int] = defaultdict(int)
+        self.duration_buckets: Dict[str, List[int]] = defaultdict(lambda: [0] * (len(DURATION_BUCKETS) + 1))
+        self.duration_sum: Dict[str, float] = defaultdict(float)
+        self.stage_sum: Dict[Tuple[str, str], float] = defaultdict(float)
+        self.stage_count: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.tokens: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.outcomes: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self.collectors: Dict[str, Callable[[], Optional[dict]]] = {}
+
+    def record(self, trace: RequestTrace, status: int) -> None:
+        """
+        Fold one finished request into the counters
+        """
+        endpoint = trace.endpoint
+        duration = trace.elapsed()
+        with self._lock:
+            self.requests[(endpoint, status)] += 1
+            self.duration_buckets[endpoint][bisect_left(DURATION_BUCKETS, duration)] += 1
+            self.duration_sum[endpoint] += duration
+            for stage, seconds in trace.stages.items():
+                self.stage_sum[(endpoint, stage)] += seconds
+                self.stage_count[(endpoint, stage)] += 1
+            if trace.prompt_tokens or trace.completion_tokens:
+                self.tokens[(endpoint, "prompt")] += trace.prompt_tokens
+                self.tokens[(endpoint, "completion")] += trace.completion_tokens
+            for name, value in trace.attributes.items():
+                if isinstance(value, bool):
+                    if value:
+                        self.outcomes[(endpoint, name, "true")] += 1
+                elif isinstance(value, str):
+                    self.outcomes[(endpoint, name, value)] += 1
+                elif isinstance(value, int):
+                    self.outcomes[(endpoint, name, "total")] += value
+
+    def register_collector(self, prefix: str, collect: Callable[[], Optional[dict]]) -> None:
+        """
+        Export the numeric values of a stats() dict as gauges named prefix_key
+        """
+        self.collectors[prefix] = collect
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            lines.append("# TYPE bridge_requests_total counter")
+            for (endpoint, status), count in sorted(self.requests.items()):
+                lines.append(f"bridge_requests_total{{{_labels(endpoint=endpoint, status=str(status))}}} {count}")
+
+            lines.append("# TYPE bridge_request_duration_seconds histogram")
+            for endpoint, buckets in sorted(self.duration_buckets.items()):
+                cumulative = 0
+                for bound, count in zip(DURATION_BUCKETS + ("+Inf",), buckets):
+                    cumulative += count
+                    labels = _labels(endpoint=endpoint, le=str(bound))
+                    lines.append(f"bridge_request_duration_seconds_bucket{{{labels}}} {cumulative}")
+                lines.append(f"bridge_request_duration_seconds_sum{{{_labels(endpoint=endpoint)}}} {self.duration_sum[endpoint]:.6f}")
+                lines.append(f"bridge_request_duration_seconds_count{{{_labels(endpoint=endpoint)}}} {cumulative}")
+
+            lines.append("# TYPE bridge_stage_seconds summary")
+            for (endpoint, stage), total in sorted(self.stage_sum.items()):
+                labels = _labels(endpoint=endpoint, stage=stage)
+                lines.append(f"bridge_stage_seconds_sum{{{labels}}} {total:.6f}")
+                lines.append(f"bridge_stage_seconds_count{{{labels}}} {self.stage_count[(endpoint, stage)]}")
+
+            lines.append("# TYPE bridge_tokens_total counter")
+            for (endpoint, kind), count in sorted(self.tokens.items()):
+                lines.append(f"bridge_tokens_total{{{_labels(endpoint=endpoint, kind=kind)}}} {count}")
+
+            lines.append("# TYPE bridge_outcomes_total counter")
+            for (endpoint, name, value), count in sorted(self.outcomes.items()):
+                labels = _labels(endpoint=endpoint, outcome=name, value=value)
+                lines.append(f"bridge_outcomes_total{{{labels}}} {count}")
+
+        for prefix, collect in self.collectors.items():
+            try:
+                stats = collect() or {}
+            except Exception:
+                continue
+            for key, value in stats.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f"# TYPE {prefix}_{key} gauge")
+                    lines.append(f"{prefix}_{key} {value}")
+        return "\n".join(lines) + "\n"
+
+
+_metrics: Optional[BridgeMetrics] = None
+
+
+def get_metrics() -> BridgeMetrics:
+    """
+    Return the process-wide metrics registry
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = BridgeMetrics()
+    return _metrics
@@ -0,0 +1,39 @@
+# inference_bridge/utils/pacer.py
+import asyncio
+import time
+
+
+class RatePacer:
+    """
+    Spaces out calls to at most max_rate per second and adapts to rate limits.
+
+    The current rate halves whenever the caller reports being throttled (and no
+    call starts before the suggested retry time), then creeps back up towards
+    max_rate with every successful call.
+    """
+
+    def __init__(self, max_rate: float, min_rate: float = 0.05, recovery: float = 0.05):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.recovery = recovery
+        self.rate = max_rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """
+        Block until the next call is allowed to start
+        """
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + 1.0 / self.rate
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self) -> None:
+        self.rate = min(self.max_rate, self.rate * (1 + self.recovery))
+
+    def on_throttled(self, retry_after: float = 0.0) -> None:
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._next_slot = max(self._next_slot, time.monotonic() + retry_after)
@@ -0,0 +1,207 @@
+# inference_bridge/utils/profiler.py
+import hmac
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import List, Optional
+
+from starlette.routing import Match
+
+# Leaf frames of threads that are waiting rather than working
+IDLE_FILES = ("threading.py", "selectors.py", "queue.py")
+
+
+def profiler_token() -> Optional[str]:
+    """
+    The admin token of the profiling endpoint from PROFILER_ADMIN_TOKEN, or
+    None when profiling is off
+    """
+    return os.getenv("PROFILER_ADMIN_TOKEN") or None
+
+
+def is_admin(token: Optional[str]) -> bool:
+    expected = profiler_token()
+    return bool(expected and token and hmac.compare_digest(expected, token))
+
+
+def routes_for(app, path: str, method: Optional[str] = None) -> List:
+    """
+    The app's routes declared with that path, and that method when given
+    """
+    return [
+        route for route in app.routes
+        if getattr(route, "path", None) == path
+        and (method is None or method.upper() in (getattr(route, "methods", None) or ()))
+    ]
+
+
+def frame_label(code) -> str:
+    """
+    "function (path:line)" of a code object, with paths inside site-packages
+    or the working directory shortened
+    """
+    path = code.co_filename
+    if "site-packages" + os.sep in path:
+        path = path.split("site-packages" + os.sep, 1)[1]
+    elif path.startswith(os.getcwd() + os.sep):
+        path = path[len(os.getcwd()) + 1:]
+    return f"{code.co_name} ({path}:{code.co_firstlineno})".replace(";", ":")
+
+
+class ProfileCapture:
+    """
+    One profiling run: the routes it covers, when it ends and the stacks
+    sampled so far.
+
+    With routes, only stacks passing through one of their endpoint functions
+    are kept, which separates the route's work from concurrent requests to
+    other routes on the same thread. Work a route hands to other threads
+    (executors, background tasks) is not attributed to it.
+    """
+
+    def __init__(
+        self,
+        routes: List = None,
+        method: Optional[str] = None,
+        requests: Optional[int] = None,
+        seconds: Optional[float] = None,
+        interval: float = 0.01,
+        idle: bool = False,
+    ):
+        self.routes = routes or []
+        self.method = method.upper() if method else None
+        self.requests = requests
+        self.seconds = seconds
+        self.interval = interval
+        self.idle = idle
+        self.codes = {
+            code for code in (getattr(inspect.unwrap(route.endpoint), "__code__", None) for route in self.routes)
+            if code is not None
+        }
+        self.stacks = Counter()
+        self.samples = 0
+        self.matched = 0
+        self.finished = 0
+        self.started = time.monotonic()
+        self.ended: Optional[float] = None
+        self.done = threading.Event()
+        self.lock = threading.Lock()
+
+    def matches(self, scope) -> bool:
+        if self.method and scope["method"] != self.method:
+            return False
+        return any(route.matches(scope)[0] == Match.FULL for route in self.routes)
+
+    def request_started(self) -> None:
+        with self.lock:
+            self.matched += 1
+
+    def request_finished(self) -> None:
+        with self.lock:
+            self.finished += 1
+            if self.requests is not None and self.finished >= self.requests:
+                self.done.set()
+
+    def sample(self, skip_thread: int) -> None:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == skip_thread:
+                continue
+            if not self.idle and os.path.basename(frame.f_code.co_filename) in IDLE_FILES:
+                continue
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            if self.codes and self.codes.isdisjoint(codes):
+                continue
+            self.stacks[tuple(reversed(codes))] += 1
+        self.samples += 1
+
+    def collapsed(self) -> str:
+        """
+        The samples in the collapsed stack format of flamegraph.pl, also read
+        by speedscope and inferno: one "root;...;leaf count" line per stack
+        """
+        labels = {}
+        lines = []
+        for stack, count in self.stacks.most_common():
+            frames = [labels.setdefault(code, frame_label(code)) for code in stack]
+            lines.append(f"{';'.join(frames)} {count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def summary(self) -> dict:
+        return {
+            "samples": self.samples,
+            "stacks": sum(self.stacks.values()),
+            "requests": self.finished,
+            "duration_s": round((self.ended or time.monotonic()) - self.started, 3),
+        }
+
+
+class SamplingProfiler:
+    """
+    Samples the Python stacks of all threads from a background thread while a
+    capture runs, one capture at a time. Nothing runs between captures.
+    """
+
+    def __init__(self):
+        self.capture: Optional[ProfileCapture] = None
+        self.lock = threading.Lock()
+
+    def start(self, capture: ProfileCapture) -> None:
+        with self.lock:
+            if self.capture is not None:
+                raise RuntimeError("A profile is already being captured")
+            self.capture = capture
+        threading.Thread(target=self._run, args=(capture,), name="profiler", daemon=True).start()
+
+    def stop(self, capture: ProfileCapture) -> None:
+        capture.done.set()
+        with self.lock:
+            if self.capture is capture:
+                self.capture = None
+        if capture.ended is None:
+            capture.ended = time.monotonic()
+
+    def _run(self, capture: ProfileCapture) -> None:
+        own = threading.get_ident()
+        deadline = capture.started + capture.seconds if capture.seconds is not None else None
+        while not capture.done.wait(capture.interval):
+            if deadline is not None and time.monotonic() >= deadline:
+                capture.done.set()
+                break
+            capture.sample(own)
+        capture.ended = time.monotonic()
+
+
+class ProfilerMiddleware:
+    """
+    ASGI middleware that counts the requests a request-bound capture is
+    waiting for. Only installed when PROFILER_ADMIN_TOKEN is set; between
+    captures it costs one attribute lookup per request.
+    """
+
+    def __init__(self, app, profiler: "SamplingProfiler"):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        capture = self.profiler.capture
+        if capture is None or capture.requests is None or scope["type"] != "http" or not capture.matches(scope):
+            return await self.app(scope, receive, send)
+
+        capture.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            capture.request_finished()
+
+
+_profiler = SamplingProfiler()
+
+
+def get_profiler() -> SamplingProfiler:
+    return _profiler
@@ -0,0 +1,207 @@
+# inference_bridge/utils/request_recorder.py
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from inference_bridge.utils.telemetry import current_trace
+
+logger = logging.getLogger(__name__)
+
+# Endpoints whose traffic is worth replaying, the rest is not recorded
+RECORDED_PATHS = ("/goal_planning", "/multi_goal_planning", "/monthly_summary", "/monthly_summary/stream")
+
+# Request headers that change how a request is served, kept in the recording
+RECORDED_HEADERS = (b"x-request-priority", b"x-request-timeout-ms", b"x-cache-bypass", b"cache-control")
+
+# Free-text request fields that may identify a user, replaced in the recording
+REDACTED_TEXT = {"description": None, "goal_description": "Savings goal"}
+
+# Placeholder for the descriptions of recurring charges, which are required
+RECURRING_CHARGE_TEXT = "Recurring charge"
+
+# Numeric IDs, renumbered in order of first appearance, so requests of one
+# user stay linked to each other but not to the real IDs
+REDACTED_IDS = ("user_id", "goal_id")
+
+# Recorded requests waiting for the writer thread, newer ones are dropped beyond this
+MAX_PENDING_RECORDS = 10000
+
+
+def sanitize(payload: Any, ids: Optional[Dict[str, Dict[int, int]]] = None) -> Any:
+    """
+    Strip a request body of anything identifying while keeping its shape.
+
+    Free text is replaced, user and goal IDs are renumbered in order of first
+    appearance and amounts, dates and categories are kept, as they drive prompt
+    length and the local analytics.
+
+    Args:
+        payload: Parsed request body
+        ids: Pseudonyms handed out so far, by ID field, then real ID; pass the
+            same dict for every request of a recording to keep its users apart
+    """
+    ids = {} if ids is None else ids
+    if isinstance(payload, list):
+        return [sanitize(item, ids) for item in payload]
+    if not isinstance(payload, dict):
+        return payload
+
+    cleaned = {}
+    for key, value in payload.items():
+        if key in REDACTED_TEXT:
+            cleaned[key] = REDACTED_TEXT[key] if value is not None else None
+        elif key in REDACTED_IDS and isinstance(value, int):
+            # Numbered per field, so the first user and the first goal are both 1
+            pseudonyms = ids.setdefault(key, {})
+            cleaned[key] = pseudonyms.setdefault(value, len(pseudonyms) + 1)
+        else:
+            cleaned[key] = sanitize(value, ids)
+    if "charges" in cleaned and isinstance(cleaned["charges"], list):
+        for charge in cleaned["charges"]:
+            if isinstance(charge, dict) and "description" in charge:
+                charge["description"] = RECURRING_CHARGE_TEXT
+    return cleaned
+
+
+class RequestRecorder:
+    """
+    ASGI middleware that appends sanitized request bodies of the planning and
+    summary endpoints to a JSON lines file, with the status, total duration,
+    upstream time and tokens of the request's trace, for replay with
+    inference_bridge.benchmark.replay.
+
+    Must sit inside TelemetryMiddleware, whose trace it reads, and inside
+    GzipRequestMiddleware, so it sees inflated bodies. Bodies are parsed,
+    sanitized and appended by a writer thread, off the event loop.
+    """
+
+    def __init__(self, app, path: str, sample_rate: float = 1.0, paths: tuple = RECORDED_PATHS):
+        self.app = app
+        self.path = path
+        self.sample_rate = sample_rate
+        self.paths = paths
+        self.started = time.monotonic()
+        self.ids: Dict[str, Dict[int, int]] = {}  # Only touched by the writer thread
+        self.pending: queue.Queue = queue.Queue(maxsize=MAX_PENDING_RECORDS)
+        self.dropped = 0
+        self.writer = threading.Thread(target=self._write_pending, name="request-recorder", daemon=True)
+        self.writer.start()
+        atexit.register(self.close)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["path"] not in self.paths
+            or random.random() >= self.sample_rate
+        ):
+            return await self.app(scope, receive, send)
+
+        arrived = time.monotonic() - self.started
+        body = bytearray()
+        status = 500
+
+        async def receive_and_keep():
+            message = await receive()
+            if message["type"] == "http.request":
+                body.extend(message.get("body", b""))
+            return message
+
+        async def send_and_note(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive_and_keep, send_and_note)
+        finally:
+            self._enqueue(scope, arrived, bytes(body), status)
+
+    def _enqueue(self, scope, arrived: float, body: bytes, status: int) -> None:
+        """
+        Hand a finished request to the writer thread, reading its trace here,
+        where the request's context is still current
+        """
+        trace = current_trace.get()
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope["headers"]
+            if name in RECORDED_HEADERS
+        }
+        record = {
+            "offset_s": round(arrived, 3),
+            "path": scope["path"],
+            "headers": headers,
+            "body": None,
+            "status": status,
+        }
+        if trace is not None:
+            upstream = trace.stages.get("upstream")
+            record.update({
+                "duration_ms": round(trace.elapsed() * 1000, 2),
+                "upstream_ms": round(upstream * 1000, 2) if upstream is not None else None,
+                "prompt_tokens": trace.prompt_tokens,
+                "completion_tokens": trace.completion_tokens,
+                "attributes": dict(trace.attributes),
+            })
+
+        try:
+            self.pending.put_nowait((record, body))
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(f"Request recorder falling behind, {self.dropped} requests not recorded")
+
+    def _write_pending(self) -> None:
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            # Whatever else is waiting goes out with the same file open
+            lines = []
+            while item is not None:
+                lines.append(self._line(*item))
+                try:
+                    item = self.pending.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.writelines(line for line in lines if line is not None)
+            except OSError as e:
+                logger.warning(f"Could not record requests to {self.path}: {e}")
+            if item is None:
+                return
+
+    def _line(self, record: dict, body: bytes) -> Optional[str]:
+        try:
+            record["body"] = sanitize(json.loads(body), self.ids)
+        except ValueError:
+            # Unparseable bodies are not worth replaying
+            return None
+        return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Write out the requests still waiting and stop the writer thread
+        """
+        if self.writer.is_alive():
+            self.pending.put(None)
+            self.writer.join(timeout)
+
+
+def recorder_from_env() -> Optional[dict]:
+    """
+    Keyword arguments of RequestRecorder from REQUEST_RECORD_PATH and
+    REQUEST_RECORD_SAMPLE_RATE, or None when recording is off
+    """
+    path = os.getenv("REQUEST_RECORD_PATH")
+    if not path:
+        return None
+    return {"path": path, "sample_rate": float(os.getenv("REQUEST_RECORD_SAMPLE_RATE", "1.0"))}
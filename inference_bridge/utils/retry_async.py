@@ -1,8 +1,11 @@
 import asyncio
 import random
+import time
 from openai import RateLimitError, BadRequestError, APIError
 import logging
 
+from .telemetry import increment, span
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,24 +15,37 @@ def retry_with_exponential_backoff(
     jitter: bool = True,
     max_retries: int = 3,
 ):
+    """
+    Retry rate-limited and failed OpenAI calls with exponential backoff.
+
+    If the wrapped function is called with a deadline keyword argument
+    (a time.monotonic() value), a retry is only attempted when its backoff
+    ends before the deadline, otherwise the last error is raised right away.
+    """
     def decorator(func):
         async def wrapper(*args, **kwargs):
             delay = initial_delay
+            deadline = kwargs.get("deadline")
+
+            def out_of_time(wait: float) -> bool:
+                return deadline is not None and time.monotonic() + wait >= deadline
 
-            for attempt in range(max_retries):
+            for attempt in range(max_retries + 1):
                 try:
                     return await func(*args, **kwargs)
 
                 except RateLimitError as e:
-                    if attempt == max_retries:
-                        logger.error(
-                            f"Rate limit error after {max_retries} retries: {str(e)}"
-                        )
-                        raise
                     delay_with_jitter = (
                         delay * exponential_base * (1 + jitter * random.random())
                     )
-                    await asyncio.sleep(delay_with_jitter)
+                    if attempt == max_retries or out_of_time(delay_with_jitter):
+                        logger.error(
+                            f"Rate limit error after {attempt} retries: {str(e)}"
+                        )
+                        raise
+                    increment("retries")
+                    with span("retry_backoff"):
+                        await asyncio.sleep(delay_with_jitter)
                     delay = delay_with_jitter
 
                 except BadRequestError as e:
@@ -37,10 +53,12 @@ def retry_with_exponential_backoff(
                     raise
 
                 except APIError as e:
-                    if attempt == max_retries:
-                        logger.error(f"API error after {max_retries} retries: {str(e)}")
+                    if attempt == max_retries or out_of_time(1):
+                        logger.error(f"API error after {attempt} retries: {str(e)}")
                         raise
-                    await asyncio.sleep(1)
+                    increment("retries")
+                    with span("retry_backoff"):
+                        await asyncio.sleep(1)
 
                 except Exception as e:
                     logger.error(f"Unexpected error: {str(e)}")
@@ -48,4 +66,4 @@ def retry_with_exponential_backoff(
 
         return wrapper
 
-    return decorator
\ No newline at end of file
+    return decorator
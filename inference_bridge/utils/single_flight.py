@@ -0,0 +1,79 @@
+# inference_bridge/utils/single_flight.py
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import logging
+
+from inference_bridge.utils.admission import AdmissionTicket
+from inference_bridge.utils.telemetry import annotate, span
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one underlying call.
+
+    The first caller for a key starts the call as a detached task, later callers
+    await the same task. Every caller awaits it through asyncio.shield, so a caller
+    that is cancelled (e.g. its client disconnected) stops waiting without
+    cancelling the call for everyone else.
+
+    A call that still waits for an admission slot waits at the highest priority
+    of its callers, so an interactive caller never queues behind the bulk call
+    it joined.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._tickets: Dict[str, AdmissionTicket] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(
+        self, key: str, func: Callable[[], Awaitable[Any]], ticket: Optional[AdmissionTicket] = None
+    ) -> Any:
+        """
+        Run func for key, or join the call already in flight for key
+
+        Args:
+            key: Identity of the call, callers with equal keys share one result
+            func: Zero-argument coroutine function performing the call
+            ticket: Admission ticket func waits with, a caller joining the call raises
+                the first caller's ticket to the priority of its own
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            if ticket is not None:
+                self._tickets[key] = ticket
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.followers += 1
+            if ticket is not None and key in self._tickets:
+                self._tickets[key].raise_to(ticket.priority)
+            logger.info(f"Joining in-flight call {key[:12]}")
+            annotate(coalesced=True)
+            with span("coalesced_wait"):
+                return await asyncio.shield(task)
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._tickets.pop(key, None)
+        # Mark the exception as retrieved in case every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "upstream_calls": self.leaders,
+            "coalesced_calls": self.followers,
+            "in_flight": len(self._inflight),
+        }
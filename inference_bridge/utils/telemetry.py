@@ -0,0 +1,101 @@
+# inference_bridge/utils/telemetry.py
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+import time
+import uuid
+
+
+class RequestTrace:
+    """
+    Timing and accounting of one request as it passes through the bridge.
+
+    Stages are accumulated in seconds, so a stage entered twice (e.g. two
+    upstream attempts) reports its total. Attributes record outcomes such as
+    cache hits, coalescing and hedging.
+    """
+
+    __slots__ = ("request_id", "endpoint", "started", "stages", "attributes", "prompt_tokens", "completion_tokens")
+
+    def __init__(self, endpoint: str, request_id: Optional[str] = None):
+        self.request_id = request_id or uuid.uuid4().hex[:16]
+        self.endpoint = endpoint
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.attributes: Dict[str, Any] = {}
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def add_stage(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def mark(self, stage: str) -> None:
+        """
+        Record the time since the request started as stage
+        """
+        self.add_stage(stage, time.perf_counter() - self.started)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+# The trace of the request the current task works for. Tasks and worker
+# threads started on its behalf inherit it, so their spans land in it too.
+current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("current_trace", default=None)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """
+    Time the enclosed block as stage of the current request, a no-op outside requests
+    """
+    trace = current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_stage(stage, time.perf_counter() - started)
+
+
+@contextmanager
+def start_trace(endpoint: str, request_id: Optional[str] = None) -> Iterator[RequestTrace]:
+    """
+    Make a new trace current for the enclosed block, for work outside HTTP requests
+    """
+    trace = RequestTrace(endpoint, request_id)
+    token = current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        current_trace.reset(token)
+
+
+def mark(stage: str) -> None:
+    trace = current_trace.get()
+    if trace is not None:
+        trace.mark(stage)
+
+
+def annotate(**attributes: Any) -> None:
+    trace = current_trace.get()
+    if trace is not None:
+        trace.attributes.update(attributes)
+
+
+def increment(attribute: str, amount: int = 1) -> None:
+    trace = current_trace.get()
+    if trace is not None:
+        trace.attributes[attribute] = trace.attributes.get(attribute, 0) + amount
+
+
+def add_tokens(prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+    """
+    Charge upstream token usage to the current request
+    """
+    trace = current_trace.get()
+    if trace is not None:
+        trace.prompt_tokens += prompt_tokens or 0
+        trace.completion_tokens += completion_tokens or 0
@@ -0,0 +1,79 @@
+# inference_bridge/utils/telemetry_middleware.py
+import json
+import logging
+import time
+
+from starlette.routing import Match
+
+from inference_bridge.utils.metrics import get_metrics
+from inference_bridge.utils.telemetry import RequestTrace, current_trace
+
+access_logger = logging.getLogger("inference_bridge.access")
+
+
+class TelemetryMiddleware:
+    """
+    ASGI middleware that opens a RequestTrace for every HTTP request, echoes its
+    ID in X-Request-Id, and on completion records it in the metrics registry and
+    writes one JSON access log line. Requests to exclude_paths, such as metric
+    scrapes, are passed through untraced.
+    """
+
+    def __init__(self, app, access_log: bool = True, exclude_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.access_log = access_log
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope["headers"])
+        incoming_id = headers.get(b"x-request-id", b"").decode("latin-1")[:64] or None
+        trace = RequestTrace(self._endpoint(scope), incoming_id)
+        status = 500
+
+        async def send_with_trace(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-request-id", trace.request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        token = current_trace.set(trace)
+        try:
+            await self.app(scope, receive, send_with_trace)
+        finally:
+            current_trace.reset(token)
+            get_metrics().record(trace, status)
+            if self.access_log:
+                access_logger.info(self._access_record(scope, trace, status))
+
+    def _endpoint(self, scope) -> str:
+        # The route template keeps metric labels bounded, e.g. /batch/jobs/{job_id}
+        app = scope.get("app")
+        for route in getattr(getattr(app, "router", None), "routes", []):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+        return "unmatched"
+
+    @staticmethod
+    def _access_record(scope, trace: RequestTrace, status: int) -> str:
+        record = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
+            "request_id": trace.request_id,
+            "method": scope["method"],
+            "path": scope["path"],
+            "endpoint": trace.endpoint,
+            "status": status,
+            "duration_ms": round(trace.elapsed() * 1000, 2),
+            "stages_ms": {stage: round(seconds * 1000, 2) for stage, seconds in trace.stages.items()},
+        }
+        if trace.prompt_tokens or trace.completion_tokens:
+            record["tokens"] = {"prompt": trace.prompt_tokens, "completion": trace.completion_tokens}
+        record.update(trace.attributes)
+        return json.dumps(record, separators=(",", ":"))